@@ -0,0 +1,191 @@
+# backend/analytics/queries.py
+"""
+Long-range analytics over Parquet snapshots (see analytics/snapshot.py) using embedded DuckDB.
+
+Queries run entirely on the snapshot files, so they work offline on a laptop and never load the
+production database. `publish_aggregates` writes the results into the analytics read models
+(`parliament_cohesion`, `platform_stance_history`) that the honesty API serves.
+"""
+
+import argparse
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import duckdb
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from analytics.snapshot import SNAPSHOT_DIR, SNAPSHOT_TABLES, latest_snapshot
+from api.models.database import SessionLocal
+from api.models.read_models import ParliamentCohesion, PlatformStanceHistory
+
+PARLIAMENT_COHESION_SQL = """
+WITH party_votes AS (
+    SELECT p.party_id, v.parliament, v.bill_id, v.politician_id, v.vote
+    FROM votes v
+    JOIN politicians p ON p.id = v.politician_id
+    WHERE v.vote IN ('yes', 'no') AND v.parliament > 0
+),
+per_bill AS (
+    SELECT party_id, parliament, bill_id,
+           count(*) FILTER (WHERE vote = 'yes') AS yes_votes,
+           count(*) FILTER (WHERE vote = 'no') AS no_votes
+    FROM party_votes
+    GROUP BY party_id, parliament, bill_id
+),
+members AS (
+    SELECT party_id, parliament, count(DISTINCT politician_id) AS member_count, count(*) AS votes_cast
+    FROM party_votes
+    GROUP BY party_id, parliament
+)
+SELECT b.party_id,
+       CAST(b.parliament AS INTEGER) AS parliament,
+       coalesce(pa.name, '') AS party_name,
+       count(*) AS bills_voted,
+       m.member_count,
+       m.votes_cast,
+       avg(greatest(b.yes_votes, b.no_votes) / (b.yes_votes + b.no_votes)) AS cohesion
+FROM per_bill b
+JOIN members m USING (party_id, parliament)
+LEFT JOIN parties pa ON pa.id = b.party_id
+GROUP BY b.party_id, b.parliament, pa.name, m.member_count, m.votes_cast
+ORDER BY b.party_id, b.parliament
+"""
+
+PLATFORM_STANCE_HISTORY_SQL = """
+WITH stances AS (
+    SELECT party_id, category, election_year, stance
+    FROM platform_categories
+    QUALIFY row_number() OVER (PARTITION BY party_id, category, election_year ORDER BY id DESC) = 1
+)
+SELECT s.party_id,
+       s.category,
+       s.election_year,
+       coalesce(pa.name, '') AS party_name,
+       s.stance,
+       lag(s.election_year) OVER w AS previous_election_year,
+       lag(s.stance) OVER w AS previous_stance,
+       coalesce(lag(s.stance) OVER w <> s.stance, false) AS changed
+FROM stances s
+LEFT JOIN parties pa ON pa.id = s.party_id
+WINDOW w AS (PARTITION BY s.party_id, s.category ORDER BY s.election_year)
+ORDER BY s.party_id, s.category, s.election_year
+"""
+
+
+def connect(snapshot_path: Optional[str] = None) -> duckdb.DuckDBPyConnection:
+    """
+    Open an in-memory DuckDB connection with one view per snapshot table.
+
+    Args:
+        snapshot_path (Optional[str]): Snapshot directory; the latest snapshot if None.
+
+    Returns:
+        duckdb.DuckDBPyConnection: Connection with views 'parties', 'politicians', 'bills', 'votes'
+            and 'platform_categories' (votes carry the 'parliament' partition column).
+    """
+    snapshot_path = snapshot_path or latest_snapshot()
+    con = duckdb.connect(":memory:")
+    for table_name in SNAPSHOT_TABLES:
+        files = os.path.join(snapshot_path, table_name, "**", "*.parquet").replace("'", "''")
+        con.execute(
+            f"CREATE VIEW {table_name} AS SELECT * FROM read_parquet('{files}', hive_partitioning = true)"
+        )
+    return con
+
+
+def query(con: duckdb.DuckDBPyConnection, sql: str, params: Optional[List] = None) -> List[Dict]:
+    """
+    Run a SQL query against the snapshot views.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Connection from `connect`.
+        sql (str): DuckDB SQL.
+        params (Optional[List]): Positional query parameters.
+
+    Returns:
+        List[Dict]: One dict per result row.
+    """
+    cursor = con.execute(sql, params or [])
+    names = [column[0] for column in cursor.description]
+    return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+def parliament_cohesion(con: duckdb.DuckDBPyConnection) -> List[Dict]:
+    """
+    Compute each party's voting cohesion per Parliament.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Connection from `connect`.
+
+    Returns:
+        List[Dict]: Rows shaped like the `parliament_cohesion` read model (without 'refreshed_at').
+    """
+    return query(con, PARLIAMENT_COHESION_SQL)
+
+
+def platform_stance_history(con: duckdb.DuckDBPyConnection) -> List[Dict]:
+    """
+    Compute how each party's platform stance changed per category between election years.
+
+    Args:
+        con (duckdb.DuckDBPyConnection): Connection from `connect`.
+
+    Returns:
+        List[Dict]: Rows shaped like the `platform_stance_history` read model (without 'refreshed_at').
+    """
+    return query(con, PLATFORM_STANCE_HISTORY_SQL)
+
+
+def publish_aggregates(db: Session, con: duckdb.DuckDBPyConnection) -> Dict[str, int]:
+    """
+    Replace the analytics read models with aggregates computed from a snapshot.
+
+    Args:
+        db (Session): Database session; committed once both tables are replaced.
+        con (duckdb.DuckDBPyConnection): Connection from `connect`.
+
+    Returns:
+        Dict[str, int]: Number of rows written per read model.
+    """
+    refreshed_at = datetime.utcnow()
+    results = {
+        ParliamentCohesion: parliament_cohesion(con),
+        PlatformStanceHistory: platform_stance_history(con),
+    }
+    for model, rows in results.items():
+        db.query(model).delete()
+        if rows:
+            db.execute(insert(model), [{**row, "refreshed_at": refreshed_at} for row in rows])
+    db.commit()
+    return {model.__tablename__: len(rows) for model, rows in results.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the long-range analytics over a Parquet snapshot.")
+    parser.add_argument("--snapshot", help="Snapshot directory (default: the latest one)")
+    parser.add_argument("--snapshot-dir", default=SNAPSHOT_DIR, help="Directory holding the snapshots")
+    parser.add_argument("--publish", action="store_true", help="Write the aggregates into the API read models")
+    args = parser.parse_args()
+
+    con = connect(args.snapshot or latest_snapshot(args.snapshot_dir))
+    if args.publish:
+        with SessionLocal() as db:
+            print(f"Published: {publish_aggregates(db, con)}")
+        return
+
+    for row in parliament_cohesion(con):
+        print(f"{row['party_name']:<24} Parliament {row['parliament']}: cohesion {row['cohesion']:.3f} over {row['bills_voted']} bills")
+    changes = [row for row in platform_stance_history(con) if row["changed"]]
+    for row in changes:
+        print(f"{row['party_name']} {row['category']}: {row['previous_stance']} ({row['previous_election_year']}) -> {row['stance']} ({row['election_year']})")
+
+
+if __name__ == "__main__":
+    main()
+
+# Example usage (from backend/; only --publish touches the database):
+# python -m analytics.snapshot
+# python -m analytics.queries
+# python -m analytics.queries --publish
@@ -0,0 +1,145 @@
+# backend/api/data_fetching/bill_text.py
+"""
+Module for fetching the full text of bills from the XML publications on parl.ca (the versions
+listed in LEGISinfo: first reading, as passed by the House, as passed by the Senate, royal assent).
+
+Publications are parsed as they download with `iterparse`, and every finished section (and any
+element outside one) is cleared and detached, so even omnibus bills of several megabytes parse
+in constant memory.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from typing import Dict, IO, Iterator, Optional
+
+from api.data_fetching import upstream
+
+# Replace with your actual email
+USER_EMAIL = "your.email@example.com"
+
+# Publication version number -> stage of the bill it reflects
+STAGES = {
+    1: "First Reading",
+    2: "As passed by the House of Commons",
+    3: "As passed by the Senate",
+    4: "Royal Assent",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _tag(elem: ET.Element) -> str:
+    return elem.tag.rsplit("}", 1)[-1]
+
+
+def _text(parts) -> str:
+    return _WHITESPACE.sub(" ", " ".join(parts)).strip()
+
+
+def publication_url(bill_url: str, number: str, version: int) -> Optional[str]:
+    """
+    Build the URL of a bill's XML publication.
+
+    Args:
+        bill_url (str): Open Parliament URL of the bill (e.g., '/bills/44-1/C-69/').
+        number (str): Bill number (e.g., 'C-69').
+        version (int): Publication version (1 for first reading, see STAGES).
+
+    Returns:
+        Optional[str]: URL of the XML file, or None if the bill URL has no session.
+    """
+    match = re.search(r"/bills/(\d+)-(\d+)/", bill_url or "")
+    if not match or not number:
+        return None
+    session = f"{match.group(1)}{match.group(2)}"
+    # Bills numbered below 201 are government bills; the rest are private members' or Senate public bills
+    digits = re.sub(r"\D", "", number)
+    kind = "Government" if digits and int(digits) < 201 else "Private"
+    return f"{upstream.PARL_ROOT}/Content/Bills/{session}/{kind}/{number}/{number}_{version}/{number}_{version}.XML"
+
+
+def parse_bill_sections(source: IO[bytes]) -> Iterator[Dict]:
+    """
+    Stream the sections of a bill XML document.
+
+    Args:
+        source (IO[bytes]): XML file or HTTP response body.
+
+    Yields:
+        Dict: Section with 'position', 'label' (e.g., '12'), 'heading' (its marginal note) and 'text'.
+    """
+    stack = []
+    open_sections = 0
+    position = 0
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        is_section = _tag(elem) == "Section"
+        if event == "start":
+            stack.append(elem)
+            open_sections += is_section
+            continue
+        stack.pop()
+        open_sections -= is_section
+        # Children of a section (including nested sections in amending provisions) are kept until it ends
+        if open_sections:
+            continue
+
+        if is_section:
+            label = _text([elem.findtext("Label") or ""])
+            heading = _text([elem.findtext("MarginalNote") or ""])
+            body = [_text(child.itertext()) for child in elem if _tag(child) not in ("Label", "MarginalNote")]
+            yield {"position": position, "label": label or str(position + 1), "heading": heading, "text": _text(body)}
+            position += 1
+
+        # Free every finished element outside a section and detach it, so the tree never grows
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+
+def publication_exists(url: str) -> bool:
+    """
+    Check whether a publication has been published, without downloading it.
+
+    Throttled and unavailable responses are retried (see `upstream.request`); only a 404 means
+    the publication does not exist yet.
+
+    Args:
+        url (str): Publication URL from `publication_url`.
+
+    Returns:
+        bool: True if the publication is available, False if it is not published.
+
+    Raises:
+        requests.RequestException: If the check fails for any other reason (e.g., still throttled).
+    """
+    response = upstream.head(url, headers={"User-Agent": USER_EMAIL}, allow_redirects=True, timeout=10)
+    if response.status_code == 404:
+        return False
+    response.raise_for_status()
+    return True
+
+
+def stream_bill_sections(url: str) -> Iterator[Dict]:
+    """
+    Download a publication and yield its sections as the XML arrives.
+
+    Args:
+        url (str): Publication URL from `publication_url`.
+
+    Yields:
+        Dict: Sections as returned by `parse_bill_sections`.
+
+    Raises:
+        requests.RequestException: If the download fails.
+        xml.etree.ElementTree.ParseError: If the publication is not well-formed XML.
+    """
+    with upstream.get(url, headers={"User-Agent": USER_EMAIL}, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True  # transparently gunzip
+        yield from parse_bill_sections(response.raw)
+
+# Example usage:
+# if __name__ == "__main__":
+#     url = publication_url("/bills/44-1/C-69/", "C-69", 1)
+#     for section in stream_bill_sections(url):
+#         print(section["label"], section["heading"])
@@ -0,0 +1,107 @@
+# backend/api/data_fetching/hansard.py
+"""
+Module for streaming House of Commons debate speeches (Hansard) from the Open Parliament API.
+
+Speeches are fetched one page at a time and yielded as they arrive, so callers can process
+millions of paragraphs without holding the corpus in memory.
+"""
+
+import re
+import time
+from typing import Dict, Iterator, List, Optional
+
+import requests
+from bs4 import BeautifulSoup
+
+from api.data_fetching import upstream
+
+# Replace with your actual email
+USER_EMAIL = "your.email@example.com"
+
+# Speeches requested per page
+PAGE_SIZE = 100
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def split_paragraphs(content: str) -> List[str]:
+    """
+    Split speech content into paragraphs with whitespace normalized.
+
+    Args:
+        content (str): Speech HTML (one <p> per paragraph) or plain text (blank-line separated).
+
+    Returns:
+        List[str]: Non-empty paragraphs in order.
+    """
+    if "<p" in content:
+        blocks = [p.get_text(" ") for p in BeautifulSoup(content, "html.parser").find_all("p")]
+    else:
+        blocks = re.split(r"\n\s*\n", content)
+    paragraphs = (_WHITESPACE.sub(" ", block).strip() for block in blocks)
+    return [p for p in paragraphs if p]
+
+
+def _localized(value, language: str) -> str:
+    if isinstance(value, dict):
+        return value.get(language) or ""
+    return value or ""
+
+
+def iter_speeches(
+    start_date: Optional[str] = None,
+    language: str = "en",
+    page_size: int = PAGE_SIZE,
+    max_pages: Optional[int] = None,
+) -> Iterator[Dict]:
+    """
+    Stream speeches in the House of Commons, following the API's pagination.
+
+    Args:
+        start_date (Optional[str]): Only speeches on or after this day (e.g., "2021-11-22").
+        language (str): Language of the text to return ('en' or 'fr').
+        page_size (int): Speeches requested per page.
+        max_pages (Optional[int]): Stop after this many pages (None for all).
+
+    Yields:
+        Dict: Speech with 'url', 'politician_url', 'time', 'date', 'heading', 'language' and 'paragraphs'.
+    """
+    headers = {"API-Version": "v1", "User-Agent": USER_EMAIL}
+    url = f"{upstream.OPENPARLIAMENT_API_ROOT}/speeches/"
+    params = {"limit": page_size}
+    if start_date:
+        params["time__gte"] = start_date
+    pages = 0
+
+    with requests.Session() as session:
+        while url and (max_pages is None or pages < max_pages):
+            try:
+                response = upstream.get(url, session=session, headers=headers, params=params, timeout=30)
+                response.raise_for_status()
+                page = response.json()
+            except (requests.RequestException, ValueError) as e:
+                print(f"Error fetching speeches from {url}: {e}")
+                return
+
+            for speech in page.get("objects", []):
+                spoken_at = speech.get("time", "")
+                yield {
+                    "url": speech.get("url", ""),
+                    "politician_url": speech.get("politician_url") or "",
+                    "time": spoken_at,
+                    "date": spoken_at[:10],
+                    "heading": _localized(speech.get("h2") or speech.get("h1"), language),
+                    "language": language,
+                    "paragraphs": split_paragraphs(_localized(speech.get("content"), language)),
+                }
+
+            pages += 1
+            next_url = (page.get("pagination") or {}).get("next_url")
+            # next_url already carries the query string (offset, limit and filters)
+            url, params = (f"{upstream.OPENPARLIAMENT_API_ROOT}{next_url}", None) if next_url else (None, None)
+            time.sleep(0.5)  # Avoid rate limits
+
+# Example usage:
+# if __name__ == "__main__":
+#     for speech in iter_speeches(start_date="2024-01-01", max_pages=1):
+#         print(speech["politician_url"], speech["paragraphs"][:1])
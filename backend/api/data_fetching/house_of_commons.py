@@ -7,6 +7,7 @@ import requests
 from typing import List, Dict, Optional
 from datetime import datetime
 import time
+from api.data_fetching import upstream
 
 # Replace with your actual email
 USER_EMAIL = "your.email@example.com"
@@ -21,13 +22,13 @@ def fetch_bills(start_year: int = 2006) -> List[Dict]:
     Returns:
         List[Dict]: List of bill details with fields like 'url', 'number', 'title', etc.
     """
-    base_url = "https://openparliament.ca/api/bills/"
+    base_url = f"{upstream.OPENPARLIAMENT_API_ROOT}/bills/"
     headers = {"API-Version": "v1", "User-Agent": USER_EMAIL}
     params = {"introduced_date__gte": f"{start_year}-01-01"}  # Filter bills since start_year
     bills = []
 
     try:
-        response = requests.get(base_url, headers=headers, params=params, timeout=10)
+        response = upstream.get(base_url, headers=headers, params=params, timeout=10)
         response.raise_for_status()
         raw_bills = response.json()  # Expecting a list of bills
 
@@ -69,13 +70,13 @@ def fetch_votes(bill_url: Optional[str] = None) -> List[Dict]:
     Returns:
         List[Dict]: List of vote details with fields like 'url', 'politician_url', etc.
     """
-    base_url = "https://openparliament.ca/api/votes/"
+    base_url = f"{upstream.OPENPARLIAMENT_API_ROOT}/votes/"
     headers = {"API-Version": "v1", "User-Agent": USER_EMAIL}
     params = {"bill": bill_url} if bill_url else {}
     votes = []
 
     try:
-        response = requests.get(base_url, headers=headers, params=params, timeout=10)
+        response = upstream.get(base_url, headers=headers, params=params, timeout=10)
         response.raise_for_status()
         raw_votes = response.json()
 
@@ -85,6 +86,7 @@ def fetch_votes(bill_url: Optional[str] = None) -> List[Dict]:
                 "politician_url": vote.get("politician_url", ""),
                 "bill_url": vote.get("bill_url", bill_url or ""),
                 "vote": vote.get("vote", "yes"),
+                "date": vote.get("date", ""),  # Day of the vote, e.g., "2021-11-03"
                 "created_at": datetime.utcnow().isoformat()
             })
         time.sleep(0.5)  # Avoid rate limits
@@ -96,6 +98,7 @@ def fetch_votes(bill_url: Optional[str] = None) -> List[Dict]:
             "politician_url": "/politicians/1/",
             "bill_url": bill_url or "/bills/1/",
             "vote": "yes",
+            "date": "",
             "created_at": datetime.utcnow().isoformat()
         })
 
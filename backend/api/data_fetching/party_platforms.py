@@ -8,30 +8,34 @@ import requests
 from bs4 import BeautifulSoup
 from typing import Dict
 from datetime import datetime
+from api.data_fetching import upstream
+from api.data_processing.entities import party_slug
 
 def fetch_party_platform(party_name: str, election_year: int) -> Dict[str, str]:
     """
     Fetch the platform for a given political party and election year.
 
     Args:
-        party_name (str): Name of the party (e.g., 'Liberal', 'Conservative').
+        party_name (str): Name of the party in any known spelling (e.g., 'Liberal', 'Bloc Québécois', 'BQ').
         election_year (int): Year of the election campaign (e.g., 2006).
 
     Returns:
         Dict[str, str]: Dictionary with 'name', 'election_year', 'platform', and 'created_at'.
     """
-    party_name = party_name.lower().replace(" ", "-")
+    # Every variant of a party's name maps to the same canonical slug (api/data_processing/entities.py)
+    party_name = party_slug(party_name)
     # Placeholder URL; update with actual party platform URLs or use Poltext/archives
     base_url = f"https://{party_name}.ca/platform/{election_year}"
 
     try:
         # Use Wayback Machine for historical data if direct URL unavailable
-        archive_url = f"https://web.archive.org/web/{election_year}*/{base_url}"
-        response = requests.get(archive_url, timeout=10)
+        archive_url = f"{upstream.WAYBACK_ROOT}/{election_year}*/{base_url}"
+        response = upstream.get(archive_url, timeout=10)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
         platform_text = soup.find("div", class_="platform-content")
-        platform = platform_text.get_text(strip=True) if platform_text else "No platform found"
+        # Keep block boundaries as line breaks for segmentation (categorize_text)
+        platform = platform_text.get_text("\n", strip=True) if platform_text else "No platform found"
 
         return {
             "name": party_name.capitalize(),
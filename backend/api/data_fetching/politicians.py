@@ -7,6 +7,7 @@ import requests
 from typing import List, Dict
 from datetime import datetime
 import time
+from api.data_fetching import upstream
 
 USER_EMAIL = "your.email@example.com"
 
@@ -20,12 +21,12 @@ def fetch_politicians(start_year: int = 2006) -> List[Dict]:
     Returns:
         List[Dict]: List of politician details with fields like 'url', 'name', etc.
     """
-    base_url = "https://openparliament.ca/api/politicians/"
+    base_url = f"{upstream.OPENPARLIAMENT_API_ROOT}/politicians/"
     headers = {"API-Version": "v1", "User-Agent": USER_EMAIL}
     politicians = []
 
     try:
-        response = requests.get(base_url, headers=headers, timeout=10)
+        response = upstream.get(base_url, headers=headers, timeout=10)
         response.raise_for_status()
         raw_politicians = response.json()
 
@@ -0,0 +1,107 @@
+# backend/api/data_fetching/upstream.py
+"""
+Base URLs of the upstream services the fetchers crawl, and GET/HEAD helpers that back off on throttling.
+
+The base URLs are read from the environment, so the fetchers can be pointed at the offline stub
+server (loadtest/stub_server.py) for load tests:
+    OPENPARLIAMENT_API_ROOT  Open Parliament API (politicians, bills, votes, speeches)
+    PARL_ROOT                parl.ca (bill XML publications)
+    WAYBACK_ROOT             Wayback Machine (archived party platforms)
+"""
+
+import os
+import time
+from typing import Optional
+
+import requests
+
+OPENPARLIAMENT_API_ROOT = os.getenv("OPENPARLIAMENT_API_ROOT", "https://openparliament.ca/api")
+PARL_ROOT = os.getenv("PARL_ROOT", "https://www.parl.ca")
+WAYBACK_ROOT = os.getenv("WAYBACK_ROOT", "https://web.archive.org/web")
+
+# Statuses retried after the server's Retry-After delay (throttling and temporary unavailability)
+RETRY_STATUSES = {429, 503}
+
+# Retries per request, and the longest Retry-After honoured (seconds)
+MAX_RETRIES = 3
+MAX_RETRY_AFTER = 60.0
+
+
+def configure(base_url: str) -> None:
+    """
+    Point every upstream at one server (e.g., the stub server at 'http://127.0.0.1:8765').
+
+    Args:
+        base_url (str): Server root; the services are served under /api, /Content and /web.
+    """
+    global OPENPARLIAMENT_API_ROOT, PARL_ROOT, WAYBACK_ROOT
+    base_url = base_url.rstrip("/")
+    OPENPARLIAMENT_API_ROOT = f"{base_url}/api"
+    PARL_ROOT = base_url
+    WAYBACK_ROOT = f"{base_url}/web"
+
+
+def retry_delay(response: requests.Response, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a throttled response.
+
+    Args:
+        response (requests.Response): Response with a retryable status.
+        attempt (int): Number of retries already made.
+
+    Returns:
+        float: The Retry-After delay in seconds (capped), or exponential backoff if absent or an HTTP date.
+    """
+    try:
+        return min(MAX_RETRY_AFTER, max(0.0, float(response.headers.get("Retry-After", ""))))
+    except ValueError:
+        return min(MAX_RETRY_AFTER, 2.0 ** attempt)
+
+
+def request(
+    method: str,
+    url: str,
+    session: Optional[requests.Session] = None,
+    max_retries: int = MAX_RETRIES,
+    **kwargs,
+) -> requests.Response:
+    """
+    Send a request, retrying throttled (429) and unavailable (503) responses after their Retry-After delay.
+
+    Args:
+        method (str): HTTP method ('GET' or 'HEAD').
+        url (str): URL to request.
+        session (Optional[requests.Session]): Session to reuse connections with (module-level requests if None).
+        max_retries (int): Retries before the last response is returned.
+        **kwargs: Passed to `requests.request` (headers, params, timeout, stream, allow_redirects...).
+
+    Returns:
+        requests.Response: The first non-retryable response, or the last one once retries run out.
+
+    Raises:
+        requests.RequestException: On connection errors or timeouts.
+    """
+    client = session or requests
+    for attempt in range(max_retries + 1):
+        response = client.request(method, url, **kwargs)
+        if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+            return response
+        delay = retry_delay(response, attempt)
+        response.close()
+        print(f"Upstream returned {response.status_code} for {method} {url}; retrying in {delay:.1f}s")
+        time.sleep(delay)
+    return response
+
+
+def get(url: str, session: Optional[requests.Session] = None, max_retries: int = MAX_RETRIES, **kwargs) -> requests.Response:
+    """
+    GET a URL with `request`'s retries.
+    """
+    return request("GET", url, session, max_retries, **kwargs)
+
+
+def head(url: str, session: Optional[requests.Session] = None, max_retries: int = MAX_RETRIES, **kwargs) -> requests.Response:
+    """
+    HEAD a URL with `request`'s retries.
+    """
+    return request("HEAD", url, session, max_retries, **kwargs)
@@ -0,0 +1,69 @@
+# backend/api/data_processing/alignment.py
+"""
+Module for deciding whether a politician's vote on a bill aligns with their party's platform stance.
+"""
+
+from bisect import bisect_right
+from typing import List, Optional, Sequence
+from api.data_processing.categorize_platform import categories_of
+
+# Stance labels from the SST-2 pipeline ('positive'/'negative') and the stance classifier ('support'/'oppose')
+SUPPORTIVE_STANCES = {"positive", "support"}
+OPPOSING_STANCES = {"negative", "oppose"}
+
+
+def bill_categories(title: str, description: str, full_text: Optional[str] = None) -> List[str]:
+    """
+    Determine which platform categories a bill falls under.
+
+    Args:
+        title (str): Title of the bill.
+        description (str): Description of the bill.
+        full_text (Optional[str]): Text of the bill's latest stored version (see
+            `bill_text.latest_bill_texts`), used instead of the description when available.
+
+    Returns:
+        List[str]: Categories whose keywords appear in the bill's title and text or description.
+    """
+    # Matched directly: bill titles are not scraped pages ("Copyright Act" is not a footer)
+    return categories_of(f"{title}\n{full_text or description}")
+
+
+def vote_alignment(vote: str, stance: str) -> Optional[bool]:
+    """
+    Compare a vote with the party's stance in the bill's category.
+
+    Args:
+        vote (str): Vote cast ('yes', 'no', 'abstain').
+        stance (str): Party stance label for the category.
+
+    Returns:
+        Optional[bool]: True if aligned, False if conflicting, None if neither applies
+        (abstentions or neutral stances).
+    """
+    vote = vote.lower()
+    if vote not in ("yes", "no"):
+        return None
+    if stance in SUPPORTIVE_STANCES:
+        return vote == "yes"
+    if stance in OPPOSING_STANCES:
+        return vote == "no"
+    return None
+
+
+def platform_year_for(election_years: Sequence[int], year: int) -> Optional[int]:
+    """
+    Find the platform in force in a given year: the latest election at or before it.
+
+    Args:
+        election_years (Sequence[int]): Sorted election years with stored platforms.
+        year (int): Year of the vote.
+
+    Returns:
+        Optional[int]: Election year of the platform in force, the earliest platform if the
+        vote predates all of them, or None if there are no platforms.
+    """
+    if not election_years:
+        return None
+    index = bisect_right(election_years, year)
+    return election_years[index - 1] if index else election_years[0]
@@ -3,16 +3,40 @@
 Module for analyzing the sentiment of categorized platform text to determine party stances.
 """
 
+import os
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict
-from transformers import pipeline
+from transformers import AutoTokenizer, pipeline
 
-# Load a pre-trained sentiment analysis model (install transformers: pip install transformers)
-sentiment_pipeline = pipeline("sentiment-analysis")
+from api.model_weights import get_shared_model
+
+# Sentiment model (Hugging Face name or local directory with model.safetensors)
+SENTIMENT_MODEL = os.getenv("SENTIMENT_MODEL", "distilbert-base-uncased-finetuned-sst-2-english")
+# Units classified per forward pass
+BATCH_SIZE = 16
+
+@lru_cache(maxsize=1)
+def get_sentiment_pipeline():
+    """
+    Build this process's sentiment pipeline on first use.
+
+    The weights come from the memory-mapped model shared by all workers (api/model_weights.py);
+    the tokenizer is created per process, after the fork.
+
+    Returns:
+        transformers.Pipeline: Sentiment-analysis pipeline.
+    """
+    tokenizer = AutoTokenizer.from_pretrained(SENTIMENT_MODEL)
+    return pipeline("sentiment-analysis", model=get_shared_model(SENTIMENT_MODEL), tokenizer=tokenizer)
 
 def analyze_stance(categorized_text: Dict[str, str]) -> Dict[str, str]:
     """
     Analyze the sentiment of the text in each category to determine the party's stance.
 
+    Each unit of a category's text is classified, and the label with the highest total
+    confidence across its units is the stance.
+
     Args:
         categorized_text (Dict[str, str]): Dictionary with categories and their corresponding text.
 
@@ -21,10 +45,13 @@ def analyze_stance(categorized_text: Dict[str, str]) -> Dict[str, str]:
     """
     stances = {}
     for category, text in categorized_text.items():
-        if text.strip():
-            # Limit to 512 tokens due to model constraints
-            result = sentiment_pipeline(text[:512])
-            stances[category] = result[0]["label"].lower()  # e.g., 'positive', 'negative', 'neutral'
+        # One bounded unit per line (categorize_text), so every unit is scored, not just the first 512 characters
+        units = [unit for unit in text.splitlines() if unit.strip()]
+        if units:
+            totals = defaultdict(float)
+            for result in get_sentiment_pipeline()(units, batch_size=BATCH_SIZE, truncation=True):
+                totals[result["label"].lower()] += result["score"]
+            stances[category] = max(totals, key=totals.get)  # e.g., 'positive', 'negative', 'neutral'
         else:
             stances[category] = "neutral"  # Default if no text
 
@@ -34,4 +61,4 @@ def analyze_stance(categorized_text: Dict[str, str]) -> Dict[str, str]:
 # if __name__ == "__main__":
 #     sample_categorized = {"Climate Change and Energy": "We support renewable energy."}
 #     stances = analyze_stance(sample_categorized)
-#     print(stances)
\ No newline at end of file
+#     print(stances)
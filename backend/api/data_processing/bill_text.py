@@ -0,0 +1,220 @@
+# backend/api/data_processing/bill_text.py
+"""
+Module for storing the full text of bills version by version, recording what changed in each
+section between readings.
+
+Only versions newer than the latest stored one are downloaded. Sections are written in batches
+while the publication streams in, so memory is bounded by the batch size and the previous
+version's section hashes, not by the size of the bill.
+"""
+
+import difflib
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+
+import requests
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from api.data_fetching.bill_text import STAGES, publication_exists, publication_url, stream_bill_sections
+from api.models.bill import Bill
+from api.models.bill_text import BillSection, BillVersion
+from data_processing.utils import content_hash
+
+# Sections inserted per statement
+BATCH_SIZE = 200
+
+# Versions checked per bill (LEGISinfo publishes at most one per stage)
+MAX_VERSION = max(STAGES)
+
+
+def section_diff(old: str, new: str) -> str:
+    """
+    Describe word-level changes between two versions of a section.
+
+    Args:
+        old (str): Text of the previous version.
+        new (str): Text of the new version.
+
+    Returns:
+        str: Changed words only, as '[-removed-]' and '{+added+}' runs separated by ' … '.
+    """
+    old_words, new_words = old.split(), new.split()
+    changes = []
+    for op, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old_words, new_words, autojunk=False).get_opcodes():
+        if op == "equal":
+            continue
+        removed = f"[-{' '.join(old_words[i1:i2])}-]" if i2 > i1 else ""
+        added = f"{{+{' '.join(new_words[j1:j2])}+}}" if j2 > j1 else ""
+        changes.append(removed + added)
+    return " … ".join(changes)
+
+
+def _batches(sections: Iterator[Dict], size: int) -> Iterator[List[Dict]]:
+    while True:
+        batch = list(islice(sections, size))
+        if not batch:
+            return
+        yield batch
+
+
+def store_bill_version(
+    db: Session,
+    bill: Bill,
+    version: int,
+    source_url: str,
+    sections: Iterable[Dict],
+    batch_size: int = BATCH_SIZE,
+) -> BillVersion:
+    """
+    Store a version's sections, comparing each with the same-numbered section of the previous version.
+
+    Args:
+        db (Session): Database session; the caller commits.
+        bill (Bill): Bill the version belongs to.
+        version (int): Publication version number.
+        source_url (str): URL of the XML publication.
+        sections (Iterable[Dict]): Sections from `stream_bill_sections` (consumed lazily).
+        batch_size (int): Sections inserted per statement.
+
+    Returns:
+        BillVersion: The stored version.
+    """
+    previous = (
+        db.query(BillVersion)
+        .filter(BillVersion.bill_id == bill.id, BillVersion.version < version)
+        .order_by(BillVersion.version.desc())
+        .first()
+    )
+    # label -> (section id, hash) of the previous version; texts are loaded only for modified sections
+    previous_sections = {}
+    if previous:
+        previous_sections = {
+            label: (section_id, hash_)
+            for section_id, label, hash_ in db.query(BillSection.id, BillSection.label, BillSection.content_hash)
+            .filter(BillSection.version_id == previous.id)
+        }
+
+    bill_version = BillVersion(
+        bill_id=bill.id, version=version, stage=STAGES.get(version, f"Version {version}"), source_url=source_url
+    )
+    db.add(bill_version)
+    db.flush()
+
+    seen_labels = set()
+    count = 0
+    for batch in _batches(iter(sections), batch_size):
+        rows = []
+        for section in batch:
+            hash_ = content_hash(section["heading"], section["text"])
+            before = previous_sections.get(section["label"])
+            change = "added" if before is None else "unchanged" if before[1] == hash_ else "modified"
+            seen_labels.add(section["label"])
+            rows.append({
+                "version_id": bill_version.id,
+                "position": section["position"],
+                "label": section["label"],
+                "heading": section["heading"] or None,
+                "text": section["text"],
+                "content_hash": hash_,
+                "change": change,
+                "diff": None,
+                "_previous_id": before[0] if change == "modified" else None,
+            })
+
+        modified_ids = [row["_previous_id"] for row in rows if row["_previous_id"]]
+        old_texts = dict(db.query(BillSection.id, BillSection.text).filter(BillSection.id.in_(modified_ids))) if modified_ids else {}
+        for row in rows:
+            previous_id = row.pop("_previous_id")
+            if previous_id:
+                row["diff"] = section_diff(old_texts[previous_id], row["text"])
+        db.execute(insert(BillSection), rows)
+        count += len(rows)
+
+    bill_version.section_count = count
+    bill_version.removed_sections = sorted(set(previous_sections) - seen_labels)
+    db.flush()
+    return bill_version
+
+
+def ingest_bill_text(db: Session, bill: Bill, max_version: int = MAX_VERSION) -> List[BillVersion]:
+    """
+    Download and store the versions of a bill published since the latest stored one.
+
+    Args:
+        db (Session): Database session; each version is committed.
+        bill (Bill): Bill with 'url' and 'number' set.
+        max_version (int): Highest version number to check.
+
+    Returns:
+        List[BillVersion]: Newly stored versions.
+    """
+    latest = db.query(func.max(BillVersion.version)).filter(BillVersion.bill_id == bill.id).scalar() or 0
+    stored = []
+    for version in range(latest + 1, max_version + 1):
+        url = publication_url(bill.url, bill.number, version)
+        if url is None:
+            break
+        try:
+            published = publication_exists(url)
+        except requests.RequestException as e:
+            # Unknown, not unpublished: the next run checks this version again
+            print(f"Error checking publication {url}: {e}")
+            break
+        if not published:
+            break
+        try:
+            stored.append(store_bill_version(db, bill, version, url, stream_bill_sections(url)))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"Error storing {url}: {e}")
+            break
+    return stored
+
+
+def ingest_bill_texts(db: Session, bills: Iterable[Bill]) -> int:
+    """
+    Fetch new text versions for bills (e.g., those whose status changed during ingestion).
+
+    Args:
+        db (Session): Database session.
+        bills (Iterable[Bill]): Bills to check.
+
+    Returns:
+        int: Number of versions stored.
+    """
+    return sum(len(ingest_bill_text(db, bill)) for bill in bills)
+
+
+def latest_bill_texts(db: Session, bill_ids: Iterable[int]) -> Dict[int, str]:
+    """
+    Return the full text of each bill's latest stored version, for categorization and semantic analysis.
+
+    Bills are looked up BATCH_SIZE at a time, with one query per batch.
+
+    Args:
+        db (Session): Database session.
+        bill_ids (Iterable[int]): IDs of the bills.
+
+    Returns:
+        Dict[int, str]: Sections joined by newlines, per bill ID; bills without a stored version are omitted.
+    """
+    ids = list(set(bill_ids))
+    sections: Dict[int, List[str]] = {}
+    for start in range(0, len(ids), BATCH_SIZE):
+        latest = (
+            db.query(BillVersion.bill_id, func.max(BillVersion.version).label("version"))
+            .filter(BillVersion.bill_id.in_(ids[start:start + BATCH_SIZE]))
+            .group_by(BillVersion.bill_id)
+            .subquery()
+        )
+        rows = (
+            db.query(BillVersion.bill_id, BillSection.heading, BillSection.text)
+            .join(latest, (BillVersion.bill_id == latest.c.bill_id) & (BillVersion.version == latest.c.version))
+            .join(BillSection, BillSection.version_id == BillVersion.id)
+            .order_by(BillVersion.bill_id, BillSection.position)
+        )
+        for bill_id, heading, text in rows:
+            sections.setdefault(bill_id, []).append(f"{heading}: {text}" if heading else text)
+    return {bill_id: "\n".join(parts) for bill_id, parts in sections.items()}
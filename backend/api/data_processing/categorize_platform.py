@@ -3,8 +3,8 @@
 Module for categorizing party platform text into 15 predefined categories.
 """
 
-from typing import Dict
-import re
+from typing import Dict, List
+from data_processing.preprocess import clean_units
 
 # Define the 15 categories as specified
 CATEGORIES = [
@@ -25,10 +25,46 @@ CATEGORIES = [
     "International Trade and Relations"
 ]
 
+# Keyword mappings based on your category descriptions
+KEYWORDS = {
+    "Climate Change and Energy": ["climate", "energy", "emissions", "renewable", "hydroelectricity", "carbon tax"],
+    "Cost of Living (including Taxes)": ["tax", "cost of living", "affordability", "exemption", "bracket"],
+    "Crime and Justice": ["crime", "justice", "law enforcement", "rcmp", "sentencing", "three-strikes"],
+    "Defence and National Security": ["defence", "military", "security", "nato", "arctic", "f-35"],
+    "Education and Training": ["education", "training", "apprenticeship", "postsecondary", "grants"],
+    "Foreign Policy": ["foreign", "international", "aid", "allies", "u.s.", "conflicts"],
+    "Government Spending and Fiscal Policy": ["spending", "fiscal", "budget", "public service", "cbc", "foreign aid"],
+    "Gun Control": ["gun", "firearm", "control", "buyback", "border", "scanners"],
+    "Health Care": ["health", "care", "dental", "pharmacare", "addiction"],
+    "Housing": ["housing", "affordable", "gst", "home", "housing starts"],
+    "Immigration": ["immigration", "asylum", "border", "caps", "non-permanent", "levels"],
+    "Indigenous Affairs": ["indigenous", "rights", "self-determination", "loan", "undrip", "trc"],
+    "Infrastructure": ["infrastructure", "transportation", "energy corridor", "lng", "pipelines"],
+    "Jobs and Employment": ["jobs", "employment", "labor", "trade barriers", "union", "ccaa"],
+    "International Trade and Relations": ["trade", "tariff", "relations", "cusma", "bonds"]
+}
+
+def categories_of(text: str) -> List[str]:
+    """
+    Find the categories whose keywords appear in a piece of text.
+
+    Args:
+        text (str): A paragraph, sentence or title.
+
+    Returns:
+        List[str]: Matching categories, in CATEGORIES order.
+    """
+    text = text.lower()
+    return [category for category, words in KEYWORDS.items() if any(word in text for word in words)]
+
 def categorize_text(platform_text: str) -> Dict[str, str]:
     """
     Categorize the platform text into the 15 predefined categories based on keywords.
 
+    The text is normalized, stripped of navigation and footer boilerplate, and split into units
+    of at most MAX_UNIT_CHARS characters (data_processing/preprocess.py); each category collects
+    the units that mention it, one per line.
+
     Args:
         platform_text (str): The full platform text.
 
@@ -37,32 +73,10 @@ def categorize_text(platform_text: str) -> Dict[str, str]:
     """
     categorized = {category: "" for category in CATEGORIES}
 
-    # Keyword mappings based on your category descriptions
-    keywords = {
-        "Climate Change and Energy": ["climate", "energy", "emissions", "renewable", "hydroelectricity", "carbon tax"],
-        "Cost of Living (including Taxes)": ["tax", "cost of living", "affordability", "exemption", "bracket"],
-        "Crime and Justice": ["crime", "justice", "law enforcement", "rcmp", "sentencing", "three-strikes"],
-        "Defence and National Security": ["defence", "military", "security", "nato", "arctic", "f-35"],
-        "Education and Training": ["education", "training", "apprenticeship", "postsecondary", "grants"],
-        "Foreign Policy": ["foreign", "international", "aid", "allies", "u.s.", "conflicts"],
-        "Government Spending and Fiscal Policy": ["spending", "fiscal", "budget", "public service", "cbc", "foreign aid"],
-        "Gun Control": ["gun", "firearm", "control", "buyback", "border", "scanners"],
-        "Health Care": ["health", "care", "dental", "pharmacare", "addiction"],
-        "Housing": ["housing", "affordable", "gst", "home", "housing starts"],
-        "Immigration": ["immigration", "asylum", "border", "caps", "non-permanent", "levels"],
-        "Indigenous Affairs": ["indigenous", "rights", "self-determination", "loan", "undrip", "trc"],
-        "Infrastructure": ["infrastructure", "transportation", "energy corridor", "lng", "pipelines"],
-        "Jobs and Employment": ["jobs", "employment", "labor", "trade barriers", "union", "ccaa"],
-        "International Trade and Relations": ["trade", "tariff", "relations", "cusma", "bonds"]
-    }
-
-    # Split text into paragraphs for categorization
-    paragraphs = re.split(r'\n+', platform_text)
-
-    for paragraph in paragraphs:
-        for category, words in keywords.items():
-            if any(word.lower() in paragraph.lower() for word in words):
-                categorized[category] += paragraph + "\n"
+    # Clean, bounded units rather than raw lines: scraped pages may have no line breaks at all
+    for unit in clean_units(platform_text):
+        for category in categories_of(unit):
+            categorized[category] += unit + "\n"
 
     return categorized
 
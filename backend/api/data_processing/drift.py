@@ -0,0 +1,322 @@
+# backend/api/data_processing/drift.py
+"""
+Drift engine: how much each party's platform changed per category between consecutive elections.
+
+Each StanceDrift row compares a category's stance and text in one election year with the
+party's previous platform that covered the category. The drift score combines the change of
+stance label with the embedding distance between the categorized texts. Rows are stored as a
+precomputed time series. When a platform is stored, only the pairs it takes part in are
+recomputed (its own row, and the next election's row that now compares against it).
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import re
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from api.data_processing.alignment import OPPOSING_STANCES, SUPPORTIVE_STANCES
+from api.models.database import SessionLocal
+from api.models.party import PlatformCategory
+from api.models.read_models import StanceDrift
+from api.tasks import TaskQueue
+
+# Weight of the stance label change in the drift score (the rest is the text distance)
+LABEL_WEIGHT = 0.5
+
+# Dimensions of the default hashed bag-of-words embedding
+HASH_DIMENSIONS = 1024
+
+# Optional Hugging Face encoder used instead of hashed embeddings (e.g., 'sentence-transformers/all-MiniLM-L6-v2')
+EMBEDDING_MODEL = os.getenv("DRIFT_EMBEDDING_MODEL")
+
+_WORD = re.compile(r"[a-zà-ÿ0-9']+")
+
+drift_queue = TaskQueue("stance-drift")
+
+
+def stance_position(stance: Optional[str]) -> int:
+    """
+    Place a stance label on a -1 (oppose) to 1 (support) scale; neutral or unknown labels are 0.
+    """
+    stance = (stance or "").lower()
+    if stance in SUPPORTIVE_STANCES:
+        return 1
+    if stance in OPPOSING_STANCES:
+        return -1
+    return 0
+
+
+def label_change(previous: str, current: str) -> float:
+    """
+    Distance between two stance labels.
+
+    Args:
+        previous (str): Earlier stance label.
+        current (str): Later stance label.
+
+    Returns:
+        float: 0 for the same position, 0.5 for a step to or from neutral, 1 for a reversal.
+    """
+    return abs(stance_position(current) - stance_position(previous)) / 2
+
+
+def hashed_embeddings(texts: Sequence[str], dimensions: int = HASH_DIMENSIONS) -> List[List[float]]:
+    """
+    Embed texts as L2-normalized, sublinear term-frequency vectors with hashed word indices.
+
+    Deterministic and dependency-free; set DRIFT_EMBEDDING_MODEL to use a transformer encoder instead.
+
+    Args:
+        texts (Sequence[str]): Texts to embed.
+        dimensions (int): Vector size.
+
+    Returns:
+        List[List[float]]: One unit vector per text (all zeros for empty text).
+    """
+    vectors = []
+    for text in texts:
+        counts: Dict[int, int] = defaultdict(int)
+        for word in _WORD.findall((text or "").lower()):
+            # Stable across processes, unlike hash()
+            digest = hashlib.blake2b(word.encode("utf-8"), digest_size=4).digest()
+            counts[int.from_bytes(digest, "little") % dimensions] += 1
+        vector = [0.0] * dimensions
+        for index, count in counts.items():
+            vector[index] = 1 + math.log(count)
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        vectors.append([v / norm for v in vector])
+    return vectors
+
+
+@lru_cache(maxsize=1)
+def _encoder(model_name: str):
+    from transformers import AutoModel, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+    return tokenizer, model
+
+
+def transformer_embeddings(texts: Sequence[str], model_name: str) -> List[List[float]]:
+    """
+    Embed texts with a Hugging Face encoder (mean-pooled, L2-normalized last hidden states).
+
+    Args:
+        texts (Sequence[str]): Texts to embed.
+        model_name (str): Encoder model name or local directory.
+
+    Returns:
+        List[List[float]]: One unit vector per text.
+    """
+    import torch
+
+    tokenizer, model = _encoder(model_name)
+    with torch.inference_mode():
+        batch = tokenizer(list(texts), padding=True, truncation=True, max_length=512, return_tensors="pt")
+        hidden = model(**batch).last_hidden_state
+        mask = batch["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+        pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+        return torch.nn.functional.normalize(pooled, dim=-1).tolist()
+
+
+def embed_texts(texts: Sequence[str]) -> List[List[float]]:
+    """
+    Embed texts with the configured embedding (DRIFT_EMBEDDING_MODEL, or hashed embeddings).
+    """
+    if EMBEDDING_MODEL:
+        return transformer_embeddings(texts, EMBEDDING_MODEL)
+    return hashed_embeddings(texts)
+
+
+def text_distance(previous: List[float], current: List[float]) -> float:
+    """
+    Cosine distance between two unit vectors, clamped to 0 (same) to 1 (unrelated).
+    An empty text (zero vector) is unrelated to any non-empty one and identical to another empty one.
+    """
+    if not any(previous) or not any(current):
+        return 0.0 if not any(previous) and not any(current) else 1.0
+    similarity = sum(a * b for a, b in zip(previous, current))
+    return min(1.0, max(0.0, 1.0 - similarity))
+
+
+def _drift_rows(
+    platforms: Dict[Tuple[str, int], Tuple[str, str]],
+    pairs: Iterable[Tuple[str, int, Optional[int]]],
+    party_id: int,
+) -> List[Dict]:
+    """
+    Compute StanceDrift rows for (category, election_year, previous_election_year) pairs of one party.
+    """
+    pairs = list(pairs)
+    keys = sorted({(c, y) for c, y, _ in pairs} | {(c, p) for c, _, p in pairs if p is not None})
+    embeddings = dict(zip(keys, embed_texts([platforms[key][1] for key in keys])))
+    computed_at = datetime.utcnow()
+
+    rows = []
+    for category, year, previous_year in pairs:
+        stance = platforms[(category, year)][0]
+        row = {
+            "party_id": party_id,
+            "category": category,
+            "election_year": year,
+            "previous_election_year": previous_year,
+            "stance": stance,
+            "previous_stance": None,
+            "label_change": None,
+            "text_distance": None,
+            "drift_score": None,
+            "computed_at": computed_at,
+        }
+        if previous_year is not None:
+            previous_stance = platforms[(category, previous_year)][0]
+            labels = label_change(previous_stance, stance)
+            distance = text_distance(embeddings[(category, previous_year)], embeddings[(category, year)])
+            row.update({
+                "previous_stance": previous_stance,
+                "label_change": labels,
+                "text_distance": distance,
+                "drift_score": LABEL_WEIGHT * labels + (1 - LABEL_WEIGHT) * distance,
+            })
+        rows.append(row)
+    return rows
+
+
+def _load_platforms(
+    db: Session, party_id: int, years: Optional[Set[int]] = None
+) -> Dict[Tuple[str, int], Tuple[str, str]]:
+    query = db.query(
+        PlatformCategory.category, PlatformCategory.election_year, PlatformCategory.stance, PlatformCategory.text
+    ).filter(PlatformCategory.party_id == party_id)
+    if years is not None:
+        query = query.filter(PlatformCategory.election_year.in_(years))
+    # Later rows win if a platform was stored twice
+    return {
+        (category, year): (stance, text or "")
+        for category, year, stance, text in query.order_by(PlatformCategory.id)
+    }
+
+
+def update_drift(db: Session, party_id: int, election_year: int) -> int:
+    """
+    Recompute the drift rows affected by storing a party's platform for one election year.
+
+    Only the (category, year) keys of the party are read to find each category's neighbouring
+    election years; stances and texts are loaded for those neighbours alone, so the cost does
+    not grow with the number of past elections.
+
+    Args:
+        db (Session): Database session; committed on success.
+        party_id (int): ID of the party.
+        election_year (int): Election year of the stored platform.
+
+    Returns:
+        int: Number of drift rows written.
+    """
+    years_by_category: Dict[str, Set[int]] = defaultdict(set)
+    for category, year in db.query(PlatformCategory.category, PlatformCategory.election_year).filter(
+        PlatformCategory.party_id == party_id
+    ):
+        years_by_category[category].add(year)
+
+    pairs = []
+    for category, years in years_by_category.items():
+        if election_year not in years:
+            continue
+        ordered = sorted(years)
+        position = ordered.index(election_year)
+        previous_year = ordered[position - 1] if position else None
+        pairs.append((category, election_year, previous_year))
+        if position + 1 < len(ordered):
+            pairs.append((category, ordered[position + 1], election_year))
+    if not pairs:
+        return 0
+
+    needed = {y for _, y, _ in pairs} | {p for _, _, p in pairs if p is not None}
+    rows = _drift_rows(_load_platforms(db, party_id, needed), pairs, party_id)
+    for category, year, _ in pairs:
+        db.execute(delete(StanceDrift).where(
+            StanceDrift.party_id == party_id, StanceDrift.category == category, StanceDrift.election_year == year
+        ))
+    db.execute(insert(StanceDrift), rows)
+    db.commit()
+    return len(rows)
+
+
+def refresh_drift(db: Session, party_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Rebuild the drift time series of some or all parties from their stored platforms (backfill).
+
+    Args:
+        db (Session): Database session; committed on success.
+        party_ids (Optional[Iterable[int]]): Parties to rebuild (None for every party with a platform).
+
+    Returns:
+        int: Number of drift rows written.
+    """
+    if party_ids is None:
+        party_ids = [pid for (pid,) in db.query(PlatformCategory.party_id).distinct()]
+    written = 0
+    for party_id in party_ids:
+        platforms = _load_platforms(db, party_id)
+        years_by_category: Dict[str, List[int]] = defaultdict(list)
+        for category, year in sorted(platforms):
+            years_by_category[category].append(year)
+        pairs = [
+            (category, year, years[i - 1] if i else None)
+            for category, years in years_by_category.items()
+            for i, year in enumerate(years)
+        ]
+        db.execute(delete(StanceDrift).where(StanceDrift.party_id == party_id))
+        if pairs:
+            db.execute(insert(StanceDrift), _drift_rows(platforms, pairs, party_id))
+        written += len(pairs)
+    db.commit()
+    return written
+
+
+def _update_in_background(party_id: int, election_year: int) -> None:
+    with SessionLocal() as db:
+        update_drift(db, party_id, election_year)
+
+
+def enqueue_drift_update(party_id: int, election_year: int) -> bool:
+    """
+    Queue the drift update for a newly stored platform off the request path.
+
+    Args:
+        party_id (int): ID of the party.
+        election_year (int): Election year of the stored platform.
+
+    Returns:
+        bool: True if queued, False if the same update is already pending.
+    """
+    return drift_queue.submit(f"{party_id}:{election_year}", _update_in_background, party_id, election_year)
+
+
+def main() -> None:
+    """
+    Command-line entry point: rebuild the drift time series.
+    """
+    parser = argparse.ArgumentParser(description="Compute party stance drift between elections.")
+    parser.add_argument("--party", type=int, action="append", help="Party ID to rebuild (repeatable; default all)")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        print(f"Wrote {refresh_drift(db, args.party)} drift rows")
+
+
+if __name__ == "__main__":
+    main()
+
+# Example usage (from backend/):
+#     python -m api.data_processing.drift
+#     python -m api.data_processing.drift --party 1
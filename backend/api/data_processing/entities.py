@@ -0,0 +1,313 @@
+# backend/api/data_processing/entities.py
+"""
+Entity resolution for parties and politicians across sources.
+
+Fetchers refer to entities by strings: Open Parliament URLs ('/parties/liberal/',
+'/politicians/jane-smith/'), party slugs and names in several spellings and languages.
+`EntityIndex` loads every identifier once (canonical rows plus the EntityAlias table) into
+dicts keyed by a normalized form, so ingestion resolves each reference with a dict lookup
+instead of a per-row query. Party names that match no key exactly fall back to a trigram
+similarity search over the known names.
+"""
+
+import argparse
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from api.models.entity_alias import EntityAlias
+from api.models.party import Party
+from api.models.politician import Politician
+
+ENTITY_TYPES = ("party", "politician")
+
+# Words ignored when comparing names (honorifics, and the generic parts of party names)
+STOPWORDS = {
+    "party": {"party", "of", "canada", "parti", "du", "de", "la", "le", "the"},
+    "politician": {"hon", "honourable", "right", "rt", "mr", "mrs", "ms", "dr", "pc", "mp"},
+}
+
+# Variants of the main parties' names; the first entry is the Open Parliament slug
+PARTY_VARIANTS = [
+    ["liberal", "Liberal Party of Canada", "Parti libéral du Canada", "LPC", "PLC"],
+    ["conservative", "Conservative Party of Canada", "Parti conservateur du Canada", "CPC", "PCC"],
+    ["ndp", "New Democratic Party", "Nouveau Parti démocratique", "NPD"],
+    ["bloc", "Bloc Québécois", "BQ"],
+    ["green", "Green Party of Canada", "Parti vert du Canada", "GPC"],
+    ["independent", "Independent", "Indépendant", "Ind"],
+]
+
+# Minimum trigram (Jaccard) similarity for a fuzzy party name match
+MATCH_THRESHOLD = 0.5
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def is_url(value: str) -> bool:
+    """
+    Check whether an identifier is a URL or URL path rather than a name.
+    """
+    return value.startswith(("/", "http://", "https://"))
+
+
+def url_key(url: str) -> str:
+    """
+    Normalize a URL to its lowercase path with surrounding slashes
+    (e.g., 'https://openparliament.ca/Politicians/Jane-Smith' -> '/politicians/jane-smith/').
+    """
+    path = re.sub(r"^https?://[^/]+", "", url.strip()).split("?", 1)[0].strip("/").lower()
+    return f"/{path}/" if path else ""
+
+
+def entity_key(value: str, entity_type: str) -> str:
+    """
+    Normalize an identifier for lookup.
+
+    URLs become their normalized path. Names are stripped of accents, case, punctuation and
+    stopwords (e.g., 'Parti libéral du Canada' -> 'liberal', 'Hon. Jane Smith' -> 'jane smith').
+
+    Args:
+        value (str): URL or name.
+        entity_type (str): 'party' or 'politician'.
+
+    Returns:
+        str: Normalized key ('' if nothing is left).
+    """
+    if is_url(value):
+        return url_key(value)
+    ascii_name = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    words = _NON_ALNUM.sub(" ", ascii_name.lower()).split()
+    kept = [w for w in words if w not in STOPWORDS[entity_type]]
+    # A name made only of stopwords (e.g., 'The Party') keeps its words rather than vanishing
+    return " ".join(kept or words)
+
+
+def party_slug(value: str) -> str:
+    """
+    Canonical slug of a party name, slug or URL (e.g., 'Bloc Québécois' or 'BQ' -> 'bloc').
+
+    Names in PARTY_VARIANTS resolve to their Open Parliament slug through an `EntityIndex` of
+    the variants; other names fall back to their hyphenated normalized key.
+
+    Args:
+        value (str): Party name, slug or URL.
+
+    Returns:
+        str: Slug.
+    """
+    variant = _VARIANT_INDEX.resolve("party", value)
+    if variant is not None:
+        return PARTY_VARIANTS[variant][0]
+    return entity_key(value, "party").strip("/").split("/")[-1].replace(" ", "-")
+
+
+def trigrams(key: str) -> Set[str]:
+    """
+    Character trigrams of a normalized name, padded so short words still produce some.
+    """
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class EntityIndex:
+    """
+    In-memory map from every known identifier of parties and politicians to their IDs.
+
+    Keys with conflicting IDs (e.g., two politicians with the same name) are marked ambiguous
+    and resolve to None, so a reference is never linked to the wrong entity.
+
+    Attributes:
+        pending (List[Dict]): Aliases registered since the last `save`, to insert into EntityAlias.
+    """
+
+    def __init__(self):
+        self._keys: Dict[str, Dict[str, int]] = {t: {} for t in ENTITY_TYPES}
+        self._ambiguous: Dict[str, Set[str]] = {t: set() for t in ENTITY_TYPES}
+        # Trigram -> name keys containing it, for fuzzy party matching
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        self.pending: List[Dict] = []
+
+    @classmethod
+    def load(cls, db: Session) -> "EntityIndex":
+        """
+        Build the index from the Party, Politician and EntityAlias tables (three queries).
+
+        Args:
+            db (Session): Database session.
+
+        Returns:
+            EntityIndex: Index of every stored identifier.
+        """
+        index = cls()
+        for party_id, name in db.query(Party.id, Party.name):
+            index.add("party", name, party_id)
+        for politician_id, url, name in db.query(Politician.id, Politician.url, Politician.name):
+            if url:
+                index.add("politician", url, politician_id)
+            index.add("politician", name, politician_id)
+        for entity_type, alias, entity_id in db.query(EntityAlias.entity_type, EntityAlias.alias, EntityAlias.entity_id):
+            index.add(entity_type, alias, entity_id)
+        return index
+
+    def add(self, entity_type: str, value: str, entity_id: int) -> None:
+        """
+        Index an identifier of an entity (in memory only; see `register`).
+
+        Adding a party name also indexes its known variants (PARTY_VARIANTS) and, for a
+        '/parties/<slug>/' URL, the slug as a name.
+
+        Args:
+            entity_type (str): 'party' or 'politician'.
+            value (str): URL, name or already normalized alias.
+            entity_id (int): ID of the entity.
+        """
+        keys = {entity_key(value, entity_type)}
+        if entity_type == "party":
+            if is_url(value):
+                keys.add(entity_key(url_key(value).strip("/").split("/")[-1], "party"))
+            for variants in PARTY_VARIANTS:
+                variant_keys = {entity_key(v, "party") for v in variants}
+                if keys & variant_keys:
+                    keys |= variant_keys
+        for key in keys - {""}:
+            self._add_key(entity_type, key, entity_id)
+
+    def _add_key(self, entity_type: str, key: str, entity_id: int) -> None:
+        known = self._keys[entity_type].setdefault(key, entity_id)
+        if known != entity_id:
+            self._ambiguous[entity_type].add(key)
+        if entity_type == "party" and not is_url(key):
+            for gram in trigrams(key):
+                self._trigrams[gram].add(key)
+
+    def resolve(self, entity_type: str, value: Optional[str], fuzzy: bool = False) -> Optional[int]:
+        """
+        Resolve an identifier to an entity ID.
+
+        Args:
+            entity_type (str): 'party' or 'politician'.
+            value (Optional[str]): URL or name.
+            fuzzy (bool): For party names, fall back to the most similar known name.
+
+        Returns:
+            Optional[int]: ID of the entity, or None if unknown or ambiguous.
+        """
+        if not value:
+            return None
+        keys = [entity_key(value, entity_type)]
+        if entity_type == "party" and is_url(value):
+            keys.append(entity_key(url_key(value).strip("/").split("/")[-1], "party"))
+        for key in keys:
+            if key in self._keys[entity_type]:
+                return None if key in self._ambiguous[entity_type] else self._keys[entity_type][key]
+        if fuzzy and entity_type == "party":
+            match = self.match(keys[-1])
+            return self._keys["party"][match] if match else None
+        return None
+
+    def resolve_many(self, entity_type: str, values: Iterable[str]) -> Dict[str, Optional[int]]:
+        """
+        Resolve many identifiers at once.
+
+        Args:
+            entity_type (str): 'party' or 'politician'.
+            values (Iterable[str]): URLs or names.
+
+        Returns:
+            Dict[str, Optional[int]]: Identifier -> ID (None if unknown or ambiguous).
+        """
+        return {value: self.resolve(entity_type, value) for value in values}
+
+    def match(self, key: str, threshold: float = MATCH_THRESHOLD) -> Optional[str]:
+        """
+        Find the known party name most similar to a normalized name.
+
+        Args:
+            key (str): Normalized name (from `entity_key`).
+            threshold (float): Minimum trigram Jaccard similarity.
+
+        Returns:
+            Optional[str]: The best matching, unambiguous key, or None.
+        """
+        grams = trigrams(key)
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in grams:
+            for candidate in self._trigrams.get(gram, ()):
+                shared[candidate] += 1
+        best, best_score = None, threshold
+        for candidate, count in shared.items():
+            score = count / (len(grams) + len(trigrams(candidate)) - count)
+            if score >= best_score and candidate not in self._ambiguous["party"]:
+                best, best_score = candidate, score
+        return best
+
+    def register(self, entity_type: str, value: str, entity_id: int, source: str = "ingest") -> None:
+        """
+        Index an identifier and queue it for the EntityAlias table if it is new.
+
+        Args:
+            entity_type (str): 'party' or 'politician'.
+            value (str): URL or name.
+            entity_id (int): ID of the entity.
+            source (str): Where the alias came from.
+        """
+        key = entity_key(value, entity_type)
+        if not key or self._keys[entity_type].get(key) == entity_id:
+            return
+        self.add(entity_type, value, entity_id)
+        self.pending.append({"entity_type": entity_type, "alias": key, "entity_id": entity_id, "source": source})
+
+    def save(self, db: Session) -> int:
+        """
+        Insert the queued aliases in one statement.
+
+        Args:
+            db (Session): Database session; the caller commits.
+
+        Returns:
+            int: Number of aliases inserted.
+        """
+        pending, self.pending = self.pending, []
+        if pending:
+            db.execute(insert(EntityAlias), pending)
+        return len(pending)
+
+
+# Position in PARTY_VARIANTS of every party name variant, for `party_slug`
+_VARIANT_INDEX = EntityIndex()
+for _position, _variants in enumerate(PARTY_VARIANTS):
+    _VARIANT_INDEX.add("party", _variants[0], _position)
+
+
+def main() -> None:
+    """
+    Command-line entry point: add a manual alias or resolve an identifier.
+    """
+    from api.models.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Manage party and politician aliases.")
+    parser.add_argument("entity_type", choices=ENTITY_TYPES)
+    parser.add_argument("value", help="URL or name to resolve, or to add as an alias")
+    parser.add_argument("--add", type=int, metavar="ENTITY_ID", help="Record the value as an alias of this ID")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        index = EntityIndex.load(db)
+        if args.add is not None:
+            index.register(args.entity_type, args.value, args.add, source="manual")
+            print(f"Added {index.save(db)} alias(es)")
+            db.commit()
+        else:
+            print(index.resolve(args.entity_type, args.value, fuzzy=True))
+
+
+if __name__ == "__main__":
+    main()
+
+# Example usage (from backend/):
+#     python -m api.data_processing.entities party "Parti libéral du Canada"
+#     python -m api.data_processing.entities politician /politicians/jane-smith-2/ --add 42
@@ -0,0 +1,165 @@
+# backend/api/data_processing/hansard.py
+"""
+Module for storing streamed Hansard speeches as compressed, deduplicated paragraphs and
+categorizing them in bulk with `categories_of`.
+
+Both steps work in fixed-size batches committed one at a time, so memory stays bounded by the
+batch size however many millions of paragraphs are processed, and an interrupted run resumes
+where it stopped (stored paragraphs are skipped by hash, categorized ones by `categorized_at`).
+"""
+
+from datetime import date, datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from api.data_fetching.hansard import iter_speeches
+from api.data_processing.categorize_platform import categories_of
+from api.data_processing.entities import EntityIndex
+from api.models.hansard import HansardParagraph
+from data_processing.utils import content_hash
+
+# Paragraphs stored or categorized per transaction
+BATCH_SIZE = 1000
+
+
+def _paragraph_rows(speeches: Iterable[Dict]) -> Iterator[Dict]:
+    for speech in speeches:
+        if not speech.get("date") or not speech.get("url"):
+            continue
+        spoken_on = date.fromisoformat(speech["date"])
+        for position, text in enumerate(speech["paragraphs"]):
+            yield {
+                "content_hash": content_hash(speech["politician_url"], text),
+                "politician_url": speech["politician_url"],
+                "speech_url": speech["url"],
+                "position": position,
+                "spoken_on": spoken_on,
+                "language": speech.get("language", "en"),
+                "heading": speech.get("heading") or None,
+                "text": text,
+            }
+
+
+def _batches(rows: Iterator[Dict], size: int) -> Iterator[List[Dict]]:
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def ingest_hansard(
+    db: Session,
+    speeches: Iterable[Dict],
+    batch_size: int = BATCH_SIZE,
+    index: Optional[EntityIndex] = None,
+) -> Dict[str, int]:
+    """
+    Store the paragraphs of streamed speeches, skipping paragraphs already stored.
+
+    Args:
+        db (Session): Database session; each batch is committed.
+        speeches (Iterable[Dict]): Speeches from `iter_speeches` (consumed lazily).
+        batch_size (int): Paragraphs per transaction.
+        index (Optional[EntityIndex]): Entity index resolving speaker URLs (loaded if not given).
+
+    Returns:
+        Dict[str, int]: Number of paragraphs 'stored' and skipped as 'duplicates'.
+    """
+    index = index or EntityIndex.load(db)
+    stored = duplicates = 0
+
+    for batch in _batches(_paragraph_rows(speeches), batch_size):
+        seen: Set[str] = {h for (h,) in db.query(HansardParagraph.content_hash).filter(
+            HansardParagraph.content_hash.in_({row["content_hash"] for row in batch})
+        )}
+
+        rows = []
+        for row in batch:
+            if row["content_hash"] in seen:
+                duplicates += 1
+                continue
+            seen.add(row["content_hash"])
+            rows.append({
+                "content_hash": row["content_hash"],
+                "politician_id": index.resolve("politician", row["politician_url"]),
+                "speech_url": row["speech_url"],
+                "position": row["position"],
+                "spoken_on": row["spoken_on"],
+                "language": row["language"],
+                "heading": row["heading"],
+                "text_compressed": HansardParagraph.compress(row["text"]),
+            })
+        if rows:
+            db.execute(insert(HansardParagraph), rows)
+        db.commit()
+        stored += len(rows)
+
+    return {"stored": stored, "duplicates": duplicates}
+
+
+def categorize_paragraphs(db: Session, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Categorize every stored paragraph not categorized yet.
+
+    Hansard paragraphs are already clean, bounded units, so each is matched against the category
+    keywords as is (`categorize_text` would normalize and re-segment them).
+
+    Args:
+        db (Session): Database session; each batch is committed.
+        batch_size (int): Paragraphs per transaction.
+
+    Returns:
+        int: Number of paragraphs categorized.
+    """
+    categorized, last_id = 0, 0
+    while True:
+        batch = (
+            db.query(HansardParagraph.id, HansardParagraph.text_compressed)
+            .filter(HansardParagraph.categorized_at.is_(None), HansardParagraph.id > last_id)
+            .order_by(HansardParagraph.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            return categorized
+
+        categorized_at = datetime.utcnow()
+        db.execute(update(HansardParagraph), [
+            {
+                "id": paragraph_id,
+                "categories": categories_of(HansardParagraph.decompress(data)),
+                "categorized_at": categorized_at,
+            }
+            for paragraph_id, data in batch
+        ])
+        db.commit()
+        categorized += len(batch)
+        last_id = batch[-1].id
+
+
+def run_hansard_ingestion(db: Session, start_date: Optional[str] = None, max_pages: Optional[int] = None) -> Dict[str, int]:
+    """
+    Stream speeches since a date into the database, then categorize the new paragraphs.
+
+    Args:
+        db (Session): Database session.
+        start_date (Optional[str]): Only speeches on or after this day (e.g., "2021-11-22").
+        max_pages (Optional[int]): Stop after this many API pages (None for all).
+
+    Returns:
+        Dict[str, int]: Paragraphs 'stored', 'duplicates' skipped and 'categorized'.
+    """
+    counts = ingest_hansard(db, iter_speeches(start_date=start_date, max_pages=max_pages))
+    counts["categorized"] = categorize_paragraphs(db)
+    return counts
+
+
+# Example usage (from backend/):
+# if __name__ == "__main__":
+#     from api.models.database import SessionLocal
+#     with SessionLocal() as db:
+#         print(run_hansard_ingestion(db, start_date="2025-05-26"))
@@ -0,0 +1,299 @@
+# backend/api/data_processing/ingest.py
+"""
+Ingestion job storing fetched politicians, bills and votes, then running the post-ingestion
+processing steps (translation, audio, explanations, read models) so API requests only read
+precomputed data.
+"""
+
+from collections import Counter, defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from api.data_fetching.house_of_commons import fetch_bills, fetch_votes
+from api.data_fetching.politicians import fetch_politicians
+from api.data_processing.bill_text import ingest_bill_texts
+from api.data_processing.entities import EntityIndex
+from api.data_processing.read_models import refresh_read_models
+from api.events import publish_events
+from api.models.bill import Bill
+from api.models.party import Party
+from api.models.politician import Politician
+from api.models.vote import Vote
+from policy_explanation.explainer import generate_explanations, iter_current_explanations
+from text_to_speech.tts import enqueue_bill_audio, enqueue_explanation_audio
+from translation.translator import pretranslate_bills, pretranslate_explanations, pretranslate_platforms
+
+
+def _party_name_from_url(party_url: str) -> str:
+    """
+    Derive a party name from an Open Parliament party URL (e.g., '/parties/liberal/' -> 'Liberal').
+    """
+    slug = party_url.strip("/").split("/")[-1] if party_url else ""
+    return slug.replace("-", " ").title() or "Independent"
+
+
+def ingest_politicians(
+    db: Session, raw_politicians: List[Dict], index: Optional[EntityIndex] = None
+) -> List[Politician]:
+    """
+    Insert new politicians and update existing ones, creating their parties as needed.
+
+    Args:
+        db (Session): Database session; the caller commits.
+        raw_politicians (List[Dict]): Output of `fetch_politicians`.
+        index (Optional[EntityIndex]): Entity index shared by the ingestion run (loaded if not given).
+
+    Returns:
+        List[Politician]: Politicians that were inserted or changed.
+    """
+    index = index or EntityIndex.load(db)
+    ids = {p["url"]: index.resolve("politician", p["url"]) for p in raw_politicians if p.get("url")}
+    existing = {p.id: p for p in db.query(Politician).filter(Politician.id.in_({i for i in ids.values() if i}))}
+    created: Dict[str, Politician] = {}
+    changed = []
+
+    for raw in raw_politicians:
+        if not raw.get("url"):
+            continue
+        party_ref = raw.get("party_url", "")
+        party_id = index.resolve("party", party_ref)
+        if party_id is None:
+            party_id = index.resolve("party", party_ref, fuzzy=True)
+            if party_id is not None:
+                # Remember the spelling, so it resolves exactly next time
+                index.register("party", party_ref, party_id)
+        if party_id is None:
+            party = Party(name=_party_name_from_url(party_ref))
+            db.add(party)
+            db.flush()
+            party_id = party.id
+            index.add("party", party.name, party_id)
+
+        politician = existing.get(ids[raw["url"]]) or created.get(raw["url"])
+        if politician is None:
+            politician = created[raw["url"]] = Politician(url=raw["url"])
+            db.add(politician)
+        elif (politician.name, politician.party_id, politician.position) == (raw["name"], party_id, raw["position"]):
+            continue
+        politician.name = raw["name"]
+        politician.party_id = party_id
+        politician.position = raw["position"]
+        changed.append(politician)
+
+    db.flush()
+    for politician in changed:
+        index.add("politician", politician.url, politician.id)
+        index.add("politician", politician.name, politician.id)
+    index.save(db)
+    return changed
+
+
+def ingest_bills(
+    db: Session,
+    raw_bills: List[Dict],
+    changes: Optional[Dict[str, Dict]] = None,
+    index: Optional[EntityIndex] = None,
+) -> List[Bill]:
+    """
+    Insert new bills and update existing ones, linking each to its sponsoring politician.
+
+    Args:
+        db (Session): Database session; the caller commits.
+        raw_bills (List[Dict]): Output of `fetch_bills`.
+        changes (Optional[Dict[str, Dict]]): If given, filled with bill URL ->
+            {'action': 'created' or 'updated', 'changes': changed fields}.
+        index (Optional[EntityIndex]): Entity index shared by the ingestion run (loaded if not given).
+
+    Returns:
+        List[Bill]: Bills that were inserted or changed.
+    """
+    index = index or EntityIndex.load(db)
+    urls = [b["url"] for b in raw_bills if b.get("url")]
+    existing = {b.url: b for b in db.query(Bill).filter(Bill.url.in_(urls))}
+    changed = []
+
+    for raw in raw_bills:
+        sponsor_id = index.resolve("politician", raw.get("introduced_by"))
+        if not raw.get("url") or sponsor_id is None:
+            print(f"Skipping bill {raw.get('number')}: unknown sponsor {raw.get('introduced_by')}")
+            continue
+
+        fields = {
+            "number": raw["number"],
+            "title": raw["title"],
+            "description": raw["description"],
+            "status": raw["status"],
+            "introduced_by": sponsor_id,
+        }
+        bill = existing.get(raw["url"])
+        if bill is None:
+            bill = existing[raw["url"]] = Bill(url=raw["url"])
+            db.add(bill)
+            action, diff = "created", fields
+        else:
+            action = "updated"
+            diff = {k: v for k, v in fields.items() if getattr(bill, k) != v}
+            if not diff:
+                continue
+        for key, value in fields.items():
+            setattr(bill, key, value)
+        changed.append(bill)
+        if changes is not None:
+            changes[raw["url"]] = {"action": action, "changes": diff}
+
+    db.flush()
+    return changed
+
+
+def ingest_votes(db: Session, raw_votes: List[Dict], index: Optional[EntityIndex] = None) -> List[Vote]:
+    """
+    Insert votes not already stored, resolving politician and bill URLs to IDs.
+
+    Votes without a date are skipped with a warning, as the date decides their Parliament partition.
+
+    Args:
+        db (Session): Database session; the caller commits.
+        raw_votes (List[Dict]): Output of `fetch_votes`.
+        index (Optional[EntityIndex]): Entity index shared by the ingestion run (loaded if not given).
+
+    Returns:
+        List[Vote]: Newly inserted votes.
+    """
+    index = index or EntityIndex.load(db)
+    politician_ids = index.resolve_many("politician", {v["politician_url"] for v in raw_votes})
+    bill_ids = dict(db.query(Bill.url, Bill.id).filter(Bill.url.in_({v["bill_url"] for v in raw_votes})))
+    existing = set(db.query(Vote.url, Vote.politician_id).filter(Vote.url.in_({v["url"] for v in raw_votes})))
+    inserted = []
+    undated = set()
+
+    for raw in raw_votes:
+        politician_id = politician_ids.get(raw["politician_url"])
+        bill_id = bill_ids.get(raw["bill_url"])
+        if politician_id is None or bill_id is None or (raw["url"], politician_id) in existing:
+            continue
+        if not raw.get("date"):
+            # The date is the partition key: guessing it would file the vote under the wrong Parliament
+            if raw["url"] not in undated:
+                undated.add(raw["url"])
+                print(f"Skipping vote {raw['url']}: no date")
+            continue
+        existing.add((raw["url"], politician_id))
+        inserted.append(Vote(
+            url=raw["url"], politician_id=politician_id, bill_id=bill_id, vote=raw["vote"],
+            date=date.fromisoformat(raw["date"]),
+        ))
+
+    db.add_all(inserted)
+    db.flush()
+    return inserted
+
+
+def change_events(
+    politicians: List[Politician], bills: List[Bill], bill_changes: Dict[str, Dict], votes: List[Vote]
+) -> List[Tuple[str, Dict]]:
+    """
+    Build the compact change events pushed to clients after an ingestion run (see api/events.py).
+
+    Bills carry only their changed fields, and votes are grouped into one event per division
+    with the tally and each member's vote.
+
+    Args:
+        politicians (List[Politician]): Inserted or changed politicians (committed, so IDs are set).
+        bills (List[Bill]): Inserted or changed bills.
+        bill_changes (Dict[str, Dict]): Bill URL -> action and changed fields, from `ingest_bills`.
+        votes (List[Vote]): Newly inserted votes.
+
+    Returns:
+        List[Tuple[str, Dict]]: (topic, data) events.
+    """
+    events = [
+        ("politicians", {"id": p.id, "url": p.url, "name": p.name, "party_id": p.party_id, "position": p.position})
+        for p in politicians
+    ]
+    for bill in bills:
+        events.append(("bills", {"id": bill.id, "url": bill.url, **bill_changes[bill.url]}))
+
+    divisions: Dict[Tuple, Dict[int, str]] = defaultdict(dict)
+    for vote in votes:
+        divisions[(vote.url, vote.bill_id, vote.date)][vote.politician_id] = vote.vote
+    for (url, bill_id, voted_on), ballots in divisions.items():
+        events.append(("votes", {
+            "url": url,
+            "bill_id": bill_id,
+            "date": voted_on.isoformat(),
+            "tally": dict(Counter(ballots.values())),
+            "votes": {str(politician_id): vote for politician_id, vote in ballots.items()},
+        }))
+    return events
+
+
+def run_ingestion(db: Session, start_year: int = 2006) -> Dict[str, int]:
+    """
+    Fetch and store politicians, bills and votes, then precompute derived data.
+
+    Args:
+        db (Session): Database session.
+        start_year (int): Year to start fetching from.
+
+    Returns:
+        Dict[str, int]: Number of changed politicians, bills and votes, published events, new bill
+        text versions, translated texts, queued audio files, new explanation versions and refreshed
+        scorecards.
+        Audio is synthesized in the background; call `audio_queue.join()` before exiting a batch job.
+    """
+    # Every party and politician reference below is resolved in memory (api/data_processing/entities.py)
+    index = EntityIndex.load(db)
+    politicians = ingest_politicians(db, fetch_politicians(start_year), index)
+    bill_changes: Dict[str, Dict] = {}
+    bills = ingest_bills(db, fetch_bills(start_year), bill_changes, index)
+    votes = ingest_votes(db, fetch_votes(), index)
+    db.commit()
+
+    # Push compact diffs to SSE/WebSocket clients (api/routes/events.py) so they never poll
+    events = publish_events(change_events(politicians, bills, bill_changes, votes))
+
+    # Download new published versions of changed bills (full text, with changes between readings)
+    bill_versions = ingest_bill_texts(db, bills)
+
+    # Translate at ingestion time so serving a translation is a DB lookup; platforms stored through
+    # the API since the last run are translated here too, never on the request path
+    translated = pretranslate_bills(db, bills)
+    translated += pretranslate_platforms(db)
+    db.commit()
+
+    # Pre-generate spoken summaries (after translation, so French audio has its text)
+    audio = enqueue_bill_audio(db, bills)
+
+    # Regenerate every politician's explanations: new votes and platforms stored through the API since
+    # the last run both change them, and versions with unchanged inputs are skipped by hash
+    explanations = generate_explanations(db)
+
+    # Translate, then voice, the current versions; those already done cost a memory lookup and a file check
+    for batch in iter_current_explanations(db):
+        translated += pretranslate_explanations(db, batch)
+        db.commit()
+        audio += enqueue_explanation_audio(db, batch)
+
+    # Rebuild the denormalized honesty read models served by api/routes/honesty.py
+    read_models = refresh_read_models(db)
+
+    return {
+        "politicians": len(politicians),
+        "bills": len(bills),
+        "votes": len(votes),
+        "events": events,
+        "bill_versions": bill_versions,
+        "translated": translated,
+        "audio": len(audio),
+        "explanations": explanations,
+        "scorecards": read_models["scorecards"],
+    }
+
+
+# Example usage (from backend/):
+# if __name__ == "__main__":
+#     from api.models.database import SessionLocal
+#     from text_to_speech.tts import audio_queue
+#     with SessionLocal() as db:
+#         print(run_ingestion(db, start_year=2006))
+#     audio_queue.join()
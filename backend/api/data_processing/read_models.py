@@ -0,0 +1,181 @@
+# backend/api/data_processing/read_models.py
+"""
+Module for rebuilding the denormalized honesty read models (scorecards, party cohesion and
+category comparisons) after ingestion, so the honesty API never joins or aggregates per request.
+"""
+
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from api.data_processing.alignment import bill_categories, platform_year_for, vote_alignment
+from api.data_processing.bill_text import latest_bill_texts
+from api.models.database import SessionLocal
+from api.models.party import Party, PlatformCategory
+from api.models.politician import Politician
+from api.models.read_models import CategoryComparison, PartyCohesion, PoliticianScorecard
+from api.models.vote import Vote
+from api.tasks import TaskQueue
+
+# Politicians loaded (with their votes and bills) per query, bounding memory use
+_BATCH_SIZE = 200
+
+read_model_queue = TaskQueue("read-models")
+
+
+def _rate(aligned: int, conflicting: int):
+    total = aligned + conflicting
+    return aligned / total if total else None
+
+
+def refresh_read_models(db: Session) -> Dict[str, int]:
+    """
+    Recompute every honesty read model from politicians, parties, votes, bills and platforms.
+
+    Politicians are loaded in batches with their party, votes and voted bills eagerly loaded
+    (one query per relationship per batch instead of one per row), and the read-model tables are
+    replaced in a single transaction so readers never see a partial refresh.
+
+    Args:
+        db (Session): Database session; committed on success.
+
+    Returns:
+        Dict[str, int]: Number of rows written per read model.
+    """
+    refreshed_at = datetime.utcnow()
+
+    # stances[party_id][election_year][category] -> stance label
+    stances: Dict[int, Dict[int, Dict[str, str]]] = defaultdict(lambda: defaultdict(dict))
+    for party_id, year, category, stance in db.query(
+        PlatformCategory.party_id, PlatformCategory.election_year, PlatformCategory.category, PlatformCategory.stance
+    ):
+        stances[party_id][year][category] = stance
+    years = {party_id: sorted(by_year) for party_id, by_year in stances.items()}
+    party_names = dict(db.query(Party.id, Party.name))
+
+    scorecards: List[Dict] = []
+    category_totals: Dict[Tuple[str, int, int], List[int]] = defaultdict(lambda: [0, 0])
+    # bill_votes[(party_id, year)][bill_id] -> Counter of yes/no votes; members[(party_id, year)] -> voter ids
+    bill_votes: Dict[Tuple[int, int], Dict[int, Counter]] = defaultdict(lambda: defaultdict(Counter))
+    members: Dict[Tuple[int, int], set] = defaultdict(set)
+    categories_by_bill: Dict[int, List[str]] = {}
+
+    last_id = 0
+    while True:
+        batch = (
+            db.query(Politician)
+            .options(joinedload(Politician.party), selectinload(Politician.votes).joinedload(Vote.bill))
+            .filter(Politician.id > last_id)
+            .order_by(Politician.id)
+            .limit(_BATCH_SIZE)
+            .all()
+        )
+        if not batch:
+            break
+
+        # Categorize the batch's new bills by their full text, loaded in bulk
+        new_bills = {
+            vote.bill.id: vote.bill for p in batch for vote in p.votes if vote.bill.id not in categories_by_bill
+        }
+        full_texts = latest_bill_texts(db, new_bills)
+        for bill_id, bill in new_bills.items():
+            categories_by_bill[bill_id] = bill_categories(bill.title, bill.description, full_texts.get(bill_id))
+
+        for politician in batch:
+            per_category: Dict[str, Dict[str, int]] = defaultdict(lambda: {"aligned": 0, "conflicting": 0})
+            for vote in politician.votes:
+                bill = vote.bill
+                vote_year = vote.date.year
+                if vote.vote in ("yes", "no"):
+                    bill_votes[(politician.party_id, vote_year)][bill.id][vote.vote] += 1
+                    members[(politician.party_id, vote_year)].add(politician.id)
+
+                election_year = platform_year_for(years.get(politician.party_id, []), vote_year)
+                if election_year is None:
+                    continue
+                for category in categories_by_bill[bill.id]:
+                    stance = stances[politician.party_id][election_year].get(category)
+                    aligned = vote_alignment(vote.vote, stance) if stance else None
+                    if aligned is None:
+                        continue
+                    key = "aligned" if aligned else "conflicting"
+                    per_category[category][key] += 1
+                    category_totals[(category, politician.party_id, election_year)][0 if aligned else 1] += 1
+
+            aligned = sum(c["aligned"] for c in per_category.values())
+            conflicting = sum(c["conflicting"] for c in per_category.values())
+            scorecards.append({
+                "politician_id": politician.id,
+                "politician_name": politician.name,
+                "position": politician.position,
+                "party_id": politician.party_id,
+                "party_name": politician.party.name if politician.party else "",
+                "votes_cast": len(politician.votes),
+                "aligned_votes": aligned,
+                "conflicting_votes": conflicting,
+                "integrity_score": _rate(aligned, conflicting),
+                "categories": dict(per_category),
+                "refreshed_at": refreshed_at,
+            })
+
+        last_id = batch[-1].id
+        # Drop the batch's politicians, votes and bills from the identity map before the next batch
+        db.expunge_all()
+
+    cohesion_rows = []
+    for (party_id, year), by_bill in bill_votes.items():
+        shares = [max(counts.values()) / sum(counts.values()) for counts in by_bill.values()]
+        cohesion_rows.append({
+            "party_id": party_id,
+            "year": year,
+            "party_name": party_names.get(party_id, ""),
+            "bills_voted": len(by_bill),
+            "member_count": len(members[(party_id, year)]),
+            "cohesion": sum(shares) / len(shares) if shares else None,
+            "refreshed_at": refreshed_at,
+        })
+
+    comparison_rows = [
+        {
+            "category": category,
+            "party_id": party_id,
+            "election_year": election_year,
+            "party_name": party_names.get(party_id, ""),
+            "stance": stances[party_id][election_year][category],
+            "aligned_votes": aligned,
+            "conflicting_votes": conflicting,
+            "alignment_rate": _rate(aligned, conflicting),
+            "refreshed_at": refreshed_at,
+        }
+        for (category, party_id, election_year), (aligned, conflicting) in category_totals.items()
+    ]
+
+    for model, rows in (
+        (PoliticianScorecard, scorecards),
+        (PartyCohesion, cohesion_rows),
+        (CategoryComparison, comparison_rows),
+    ):
+        db.query(model).delete()
+        if rows:
+            db.execute(insert(model), rows)
+    db.commit()
+
+    return {"scorecards": len(scorecards), "party_cohesion": len(cohesion_rows), "category_comparisons": len(comparison_rows)}
+
+
+def _refresh_in_background() -> None:
+    with SessionLocal() as db:
+        refresh_read_models(db)
+
+
+def enqueue_refresh() -> bool:
+    """
+    Queue a read-model refresh off the request path (duplicate pending refreshes are dropped).
+
+    Returns:
+        bool: True if queued, False if a refresh is already pending.
+    """
+    return read_model_queue.submit("refresh", _refresh_in_background)
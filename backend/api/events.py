@@ -0,0 +1,258 @@
+# backend/api/events.py
+"""
+Pub/sub of change events (new or updated politicians, bills and votes) published by the
+ingestion pipeline and pushed to clients over SSE and WebSocket (api/routes/events.py).
+
+Every event gets a cursor. Clients resume from the last cursor they saw and receive only the
+events after it; if those events are no longer retained, they get a 'reset' and refetch.
+
+Two backends share one interface. `publish` is synchronous, for the ingestion pipeline;
+`latest_cursor`, `read` and `wait` are coroutines, so streaming clients never block the event loop:
+    - InMemoryEventBus: a bounded ring buffer, enough when ingestion runs in the API process.
+    - RedisEventBus: a capped Redis stream, used when EVENT_BUS_URL is set, so events published
+      by a separate ingestion process fan out to every API worker.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+EVENT_BUS_URL = os.getenv("EVENT_BUS_URL", "")
+
+# Events retained for resuming clients
+EVENT_BUFFER_SIZE = int(os.getenv("EVENT_BUFFER_SIZE", "10000"))
+
+# Events returned per read
+READ_LIMIT = 500
+
+REDIS_STREAM = "truenorthwatch:events"
+
+TOPICS = ("politicians", "bills", "votes")
+
+
+def _parse_cursor(cursor: str) -> Optional[Tuple[int, int]]:
+    try:
+        first, second = cursor.split("-")
+        return int(first), int(second)
+    except (AttributeError, ValueError):
+        return None
+
+
+class InMemoryEventBus:
+    """
+    Ring buffer of events with cursors of the form '<epoch>-<sequence>'.
+
+    The epoch is the bus creation time, so cursors from before a restart are detected
+    and answered with a reset instead of silently skipping events.
+
+    Attributes:
+        maxlen (int): Number of events retained.
+    """
+
+    def __init__(self, maxlen: int = EVENT_BUFFER_SIZE):
+        self.maxlen = maxlen
+        self._epoch = int(time.time() * 1000)
+        self._events: deque = deque(maxlen=maxlen)
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._waiters = set()
+
+    def _cursor(self, sequence: int) -> str:
+        return f"{self._epoch}-{sequence}"
+
+    def publish(self, topic: str, data: Dict) -> str:
+        """
+        Append an event and wake every waiting client.
+
+        Args:
+            topic (str): Event topic ('politicians', 'bills' or 'votes').
+            data (Dict): JSON-serializable payload.
+
+        Returns:
+            str: Cursor of the event.
+        """
+        with self._lock:
+            self._sequence += 1
+            event = {"id": self._cursor(self._sequence), "topic": topic, "data": data}
+            self._events.append((self._sequence, event))
+            waiters = list(self._waiters)
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(waiter.set)
+            except RuntimeError:
+                pass  # the client's event loop has closed
+        return event["id"]
+
+    async def latest_cursor(self) -> str:
+        """
+        Return the cursor of the newest event (a client starting now receives only later events).
+        """
+        with self._lock:
+            return self._cursor(self._sequence)
+
+    async def read(self, cursor: str, limit: int = READ_LIMIT) -> Tuple[List[Dict], bool]:
+        """
+        Return the events after a cursor.
+
+        Args:
+            cursor (str): Last cursor the client saw.
+            limit (int): Maximum number of events returned.
+
+        Returns:
+            Tuple[List[Dict], bool]: Events ({'id', 'topic', 'data'}) oldest first, and whether the
+            client must reset because events after its cursor are no longer retained.
+        """
+        parsed = _parse_cursor(cursor)
+        with self._lock:
+            if parsed is None or parsed[0] != self._epoch or parsed[1] > self._sequence:
+                return [], True
+            after = parsed[1]
+            if self._events and after < self._events[0][0] - 1:
+                return [], True
+            skip = max(0, len(self._events) - (self._sequence - after))
+            return [event for _, event in list(self._events)[skip:skip + limit]], False
+
+    async def wait(self, cursor: str, timeout: float) -> bool:
+        """
+        Wait until an event after the cursor is published, or the timeout expires.
+
+        Args:
+            cursor (str): Last cursor the client saw.
+            timeout (float): Maximum seconds to wait.
+
+        Returns:
+            bool: True if an event was published, False on timeout.
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            parsed = _parse_cursor(cursor)
+            if parsed is None or parsed[1] < self._sequence:
+                return True
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+
+class RedisEventBus:
+    """
+    Capped Redis stream of events; cursors are Redis stream IDs.
+
+    Attributes:
+        url (str): Redis URL (e.g., 'redis://localhost:6379/0').
+        stream (str): Stream key.
+        maxlen (int): Approximate number of events retained.
+    """
+
+    def __init__(self, url: str, stream: str = REDIS_STREAM, maxlen: int = EVENT_BUFFER_SIZE):
+        # Imported lazily so the in-memory bus works without the redis package.
+        # The sync client publishes from ingestion; the async one serves the routes.
+        import redis
+        import redis.asyncio
+
+        self.url = url
+        self.stream = stream
+        self.maxlen = maxlen
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._async_client = redis.asyncio.Redis.from_url(url, decode_responses=True)
+
+    def publish(self, topic: str, data: Dict) -> str:
+        """
+        Append an event to the stream.
+
+        Args:
+            topic (str): Event topic ('politicians', 'bills' or 'votes').
+            data (Dict): JSON-serializable payload.
+
+        Returns:
+            str: Cursor (stream ID) of the event.
+        """
+        return self._client.xadd(
+            self.stream, {"topic": topic, "data": json.dumps(data)}, maxlen=self.maxlen, approximate=True
+        )
+
+    async def latest_cursor(self) -> str:
+        """
+        Return the cursor of the newest event (a client starting now receives only later events).
+        """
+        newest = await self._async_client.xrevrange(self.stream, count=1)
+        return newest[0][0] if newest else "0-0"
+
+    async def read(self, cursor: str, limit: int = READ_LIMIT) -> Tuple[List[Dict], bool]:
+        """
+        Return the events after a cursor.
+
+        Args:
+            cursor (str): Last cursor the client saw.
+            limit (int): Maximum number of events returned.
+
+        Returns:
+            Tuple[List[Dict], bool]: Events ({'id', 'topic', 'data'}) oldest first, and whether the
+            client must reset because events after its cursor were trimmed from the stream.
+        """
+        parsed = _parse_cursor(cursor)
+        if parsed is None:
+            return [], True
+        oldest = await self._async_client.xrange(self.stream, count=1)
+        if oldest and cursor != "0-0" and parsed < _parse_cursor(oldest[0][0]):
+            # The client's last event was trimmed, so events after it may have been too
+            return [], True
+        entries = await self._async_client.xrange(self.stream, min=f"({cursor}", count=limit)
+        return [
+            {"id": entry_id, "topic": fields["topic"], "data": json.loads(fields["data"])}
+            for entry_id, fields in entries
+        ], False
+
+    async def wait(self, cursor: str, timeout: float) -> bool:
+        """
+        Wait until an event after the cursor is published, or the timeout expires.
+
+        Args:
+            cursor (str): Last cursor the client saw.
+            timeout (float): Maximum seconds to wait.
+
+        Returns:
+            bool: True if an event was published, False on timeout.
+        """
+        return bool(await self._async_client.xread({self.stream: cursor}, count=1, block=int(timeout * 1000)))
+
+
+@lru_cache(maxsize=1)
+def get_event_bus():
+    """
+    Return the process-wide event bus (Redis if EVENT_BUS_URL is set, in-memory otherwise).
+    """
+    if EVENT_BUS_URL:
+        return RedisEventBus(EVENT_BUS_URL)
+    return InMemoryEventBus()
+
+
+def publish_events(events: List[Tuple[str, Dict]]) -> int:
+    """
+    Publish (topic, data) events; failures are logged so they never abort the publisher.
+
+    Args:
+        events (List[Tuple[str, Dict]]): Events to publish, in order.
+
+    Returns:
+        int: Number of events published.
+    """
+    bus = get_event_bus()
+    published = 0
+    for topic, data in events:
+        try:
+            bus.publish(topic, data)
+            published += 1
+        except Exception as e:
+            print(f"Error publishing {topic} event: {e}")
+    return published
@@ -0,0 +1,135 @@
+# backend/api/loaders.py
+"""
+DataLoader-style batch loading for the batch and page endpoints (api/routes/batch.py).
+
+Keys requested from a loader are queued, then fetched together with a single `WHERE key IN (...)`
+query per model when the loader dispatches. Every loaded row is kept in a per-request cache, so
+an entity referenced many times (e.g., a party shared by 150 voters) is queried once. Rows are
+selected as tuples of the response schema's columns and returned as dicts, ready for orjson.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from api.models.bill import Bill
+from api.models.party import Party
+from api.models.politician import Politician
+from api.models.schemas import BillSchema, PartySchema, PoliticianSchema, VoteSchema
+from api.models.vote import Vote
+from api.serialization import rows_to_dicts, schema_select
+
+# Keys per IN query (keeps statements within database parameter limits)
+CHUNK_SIZE = 1000
+
+
+class Loader:
+    """
+    Loads rows of one model by a key column, coalescing keys into IN queries.
+
+    Attributes:
+        model: SQLAlchemy model to load.
+        schema (Type[BaseModel]): Response schema selecting the columns.
+        key (str): Column the rows are looked up by (must be a field of the schema).
+        many (bool): Whether a key matches a list of rows (e.g., votes by bill_id) instead of one.
+        queries (int): Number of queries executed so far.
+    """
+
+    def __init__(self, db: Session, model, schema: Type[BaseModel], key: str = "id", many: bool = False):
+        self.model = model
+        self.schema = schema
+        self.key = key
+        self.many = many
+        self.queries = 0
+        self._db = db
+        self._cache: Dict[Any, Any] = {}
+        self._queue: List[Any] = []
+
+    def queue(self, keys: Iterable[Any]) -> "Loader":
+        """
+        Schedule keys for the next dispatch; cached or already queued keys are skipped.
+
+        Args:
+            keys (Iterable[Any]): Keys to load (None values are ignored).
+
+        Returns:
+            Loader: The loader, for chaining.
+        """
+        queued = set(self._queue)
+        for key in keys:
+            if key is not None and key not in self._cache and key not in queued:
+                self._queue.append(key)
+                queued.add(key)
+        return self
+
+    def dispatch(self) -> None:
+        """
+        Fetch every queued key with one IN query per chunk and cache the results.
+        """
+        pending, self._queue = self._queue, []
+        column = getattr(self.model, self.key)
+        query = schema_select(self.model, self.schema)
+        for start in range(0, len(pending), CHUNK_SIZE):
+            chunk = pending[start:start + CHUNK_SIZE]
+            for key in chunk:
+                self._cache[key] = [] if self.many else None
+            rows = rows_to_dicts(self._db.execute(query.where(column.in_(chunk)).order_by(self.model.id)))
+            self.queries += 1
+            for row in rows:
+                if self.many:
+                    self._cache[row[self.key]].append(row)
+                else:
+                    self._cache[row[self.key]] = row
+
+    def load_many(self, keys: Iterable[Any]) -> Dict[Any, Any]:
+        """
+        Load rows for keys, querying only keys not already cached.
+
+        Args:
+            keys (Iterable[Any]): Keys to load.
+
+        Returns:
+            Dict[Any, Any]: Key -> row dict (None if missing), or list of row dicts if `many`.
+        """
+        keys = [key for key in keys if key is not None]
+        self.queue(keys)
+        if self._queue:
+            self.dispatch()
+        return {key: self._cache[key] for key in keys}
+
+    def load(self, key: Any) -> Optional[Any]:
+        """
+        Load the row (or rows if `many`) for one key.
+        """
+        return self.load_many([key])[key]
+
+
+class RequestLoaders:
+    """
+    The loaders of one request, sharing its session and caches.
+
+    Attributes:
+        parties (Loader): Parties by ID.
+        politicians (Loader): Politicians by ID.
+        bills (Loader): Bills by ID.
+        votes (Loader): Votes by ID.
+        votes_by_bill (Loader): Votes by bill ID (lists).
+    """
+
+    def __init__(self, db: Session):
+        self.parties = Loader(db, Party, PartySchema)
+        self.politicians = Loader(db, Politician, PoliticianSchema)
+        self.bills = Loader(db, Bill, BillSchema)
+        self.votes = Loader(db, Vote, VoteSchema)
+        self.votes_by_bill = Loader(db, Vote, VoteSchema, key="bill_id", many=True)
+
+    @property
+    def queries(self) -> int:
+        """
+        Total queries executed by the request's loaders.
+        """
+        return sum(
+            loader.queries
+            for loader in (self.parties, self.politicians, self.bills, self.votes, self.votes_by_bill)
+        )
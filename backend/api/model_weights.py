@@ -0,0 +1,158 @@
+# backend/api/model_weights.py
+"""
+Transformer weights shared between the API's worker processes.
+
+Weights are memory-mapped from the model's safetensors file instead of being copied into each
+process: every tensor is a view into one private (copy-on-write) file mapping, so the pages live
+in the OS page cache once, however many workers map them, and inference never writes to them.
+When gunicorn preloads the app (gunicorn.conf.py), the models are mapped in the master before
+forking, and workers inherit the mappings; tokenizers and pipelines are still created per worker,
+since the Rust tokenizers are not fork-safe.
+"""
+
+import json
+import os
+import struct
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import torch
+
+# Models mapped in the gunicorn master before forking (comma-separated names or directories;
+# gunicorn.conf.py falls back to the sentiment model)
+SERVING_MODELS = [m for m in os.getenv("SERVING_MODELS", "").split(",") if m]
+
+_DTYPES = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool,
+}
+
+_models: Dict[Tuple[str, str], torch.nn.Module] = {}
+_lock = threading.Lock()
+
+
+def mmap_safetensors(path: str) -> Dict[str, torch.Tensor]:
+    """
+    Map a safetensors file and return its tensors as views into the mapping (no copy).
+
+    Args:
+        path (str): Path to a .safetensors file.
+
+    Returns:
+        Dict[str, torch.Tensor]: Tensor name -> read-only-by-convention tensor backed by the file.
+    """
+    with open(path, "rb") as f:
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size))
+    header.pop("__metadata__", None)
+    data_start = 8 + header_size
+    # shared=False maps the file copy-on-write: pages are shared until written, and never written back
+    storage = torch.UntypedStorage.from_file(path, shared=False, nbytes=os.path.getsize(path))
+
+    tensors = {}
+    for name, info in header.items():
+        dtype = _DTYPES[info["dtype"]]
+        begin, end = info["data_offsets"]
+        itemsize = torch.empty(0, dtype=dtype).element_size()
+        shape = info["shape"]
+        if (data_start + begin) % itemsize:
+            # Misaligned for its dtype (not written by save_pretrained); fall back to a copy
+            raw = torch.empty(0, dtype=torch.uint8).set_(storage, data_start + begin, (end - begin,))
+            tensors[name] = raw.clone().view(dtype).reshape(shape)
+            continue
+        stride = torch.empty(shape, dtype=dtype, device="meta").stride()
+        tensors[name] = torch.empty(0, dtype=dtype).set_(storage, (data_start + begin) // itemsize, shape, stride)
+    return tensors
+
+
+def _weights_file(name_or_path: str) -> str:
+    if os.path.isdir(name_or_path):
+        return os.path.join(name_or_path, "model.safetensors")
+    from transformers.utils import cached_file
+
+    # Downloads to (or reads from) the Hugging Face cache
+    return cached_file(name_or_path, "model.safetensors")
+
+
+def load_mapped_model(name_or_path: str, task: str = "sequence-classification") -> torch.nn.Module:
+    """
+    Build a model whose weights are memory-mapped from its safetensors file.
+
+    Args:
+        name_or_path (str): Hugging Face model name or a directory written by `save_pretrained`.
+        task (str): 'sequence-classification' or 'base' (encoder only).
+
+    Returns:
+        torch.nn.Module: The model in evaluation mode.
+
+    Raises:
+        ValueError: If the weights file lacks parameters the model needs.
+    """
+    from transformers import AutoConfig, AutoModel, AutoModelForSequenceClassification
+    from transformers.modeling_utils import no_init_weights
+
+    model_cls = AutoModelForSequenceClassification if task == "sequence-classification" else AutoModel
+    config = AutoConfig.from_pretrained(name_or_path)
+    # Skip random initialization; every parameter is replaced by a mapped tensor below
+    with no_init_weights():
+        model = model_cls.from_config(config)
+
+    state = mmap_safetensors(_weights_file(name_or_path))
+    model_keys = set(model.state_dict())
+    prefix = f"{model.base_model_prefix}."
+    if not model_keys & set(state):
+        # Base-model checkpoint loaded with a head, or the other way round
+        if any(key.startswith(prefix) for key in model_keys):
+            state = {f"{prefix}{key}": value for key, value in state.items()}
+        else:
+            state = {key[len(prefix):]: value for key, value in state.items() if key.startswith(prefix)}
+    missing, _ = model.load_state_dict(state, strict=False, assign=True)
+    # Tied parameters (e.g., output embeddings) are not stored separately
+    model.tie_weights()
+    untied = [key for key in missing if key not in set(getattr(model, "_tied_weights_keys", None) or [])]
+    if untied:
+        raise ValueError(f"{name_or_path} has no weights for {untied[:5]}")
+    model.eval()
+    return model
+
+
+def get_shared_model(name_or_path: str, task: str = "sequence-classification") -> torch.nn.Module:
+    """
+    Return the process-wide mapped model, loading it on first use (inherited by forked workers).
+
+    Args:
+        name_or_path (str): Hugging Face model name or local directory.
+        task (str): 'sequence-classification' or 'base'.
+
+    Returns:
+        torch.nn.Module: Shared model in evaluation mode.
+    """
+    key = (name_or_path, task)
+    with _lock:
+        if key not in _models:
+            _models[key] = load_mapped_model(name_or_path, task)
+        return _models[key]
+
+
+def preload_models(names: Optional[List[str]] = None) -> int:
+    """
+    Map models in this process (called in the gunicorn master before forking).
+
+    Args:
+        names (Optional[List[str]]): Models to map (default: SERVING_MODELS).
+
+    Returns:
+        int: Number of models mapped.
+    """
+    names = SERVING_MODELS if names is None else names
+    for name in names:
+        get_shared_model(name)
+    return len(names)
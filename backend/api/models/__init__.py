@@ -0,0 +1,6 @@
+# backend/api/models/__init__.py
+"""
+SQLAlchemy models. Importing the package registers every table on the shared Base.
+"""
+
+from . import bill, bill_text, entity_alias, explanation, hansard, party, politician, read_models, translation, vote  # noqa: F401
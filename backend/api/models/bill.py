@@ -4,11 +4,9 @@ SQLAlchemy model for the Bill table.
 """
 
 from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from datetime import datetime
-
-# Note: Base should ideally be defined in a central file (e.g., database.py)
-Base = declarative_base()
+from .database import Base
 
 class Bill(Base):
     """
@@ -16,6 +14,8 @@ class Bill(Base):
 
     Attributes:
         id (int): Primary key.
+        url (str): Open Parliament URL of the bill (e.g., '/bills/42-1/C-10/'), used to match re-fetched bills.
+        number (str): Bill number (e.g., 'C-10').
         title (str): Title of the bill.
         description (str): Detailed description of the bill.
         status (str): Current status (e.g., 'proposed', 'passed').
@@ -24,11 +24,14 @@ class Bill(Base):
     """
     __tablename__ = "bills"
     id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, unique=True, nullable=True, index=True)
+    number = Column(String, nullable=True)
     title = Column(String, nullable=False)
     description = Column(String, nullable=False)
     status = Column(String, nullable=False)
     introduced_by = Column(Integer, ForeignKey("politicians.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    # Optional: Define relationships for easier querying
-    # introduced_by_politician = relationship("Politician", back_populates="bills")
\ No newline at end of file
+    # Relationships to the sponsoring politician and the votes cast on the bill
+    sponsor = relationship("Politician", back_populates="bills")
+    votes = relationship("Vote", back_populates="bill")
@@ -0,0 +1,68 @@
+# backend/api/models/bill_text.py
+"""
+SQLAlchemy models for the BillVersion and BillSection tables.
+Store each published version of a bill's full text, section by section, with changes between readings.
+"""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from .database import Base
+
+class BillVersion(Base):
+    """
+    Represents one published version of a bill (e.g., as passed by the House of Commons).
+
+    Attributes:
+        id (int): Primary key.
+        bill_id (int): Foreign key to the Bill.
+        version (int): Publication version number (1 for first reading).
+        stage (str): Stage the version reflects (e.g., 'First Reading').
+        source_url (str): URL of the XML publication.
+        section_count (int): Number of sections.
+        removed_sections (list): Labels of sections of the previous version missing from this one.
+        fetched_at (datetime): Timestamp when the version was downloaded.
+    """
+    __tablename__ = "bill_versions"
+    __table_args__ = (UniqueConstraint("bill_id", "version"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    bill_id = Column(Integer, ForeignKey("bills.id"), nullable=False, index=True)
+    version = Column(Integer, nullable=False)
+    stage = Column(String, nullable=False)
+    source_url = Column(String, nullable=False)
+    section_count = Column(Integer, nullable=False, default=0)
+    removed_sections = Column(JSON, nullable=False, default=list)
+    fetched_at = Column(DateTime, default=datetime.utcnow)
+
+    sections = relationship("BillSection", back_populates="bill_version", order_by="BillSection.position")
+
+class BillSection(Base):
+    """
+    Represents one section of a bill version.
+
+    Attributes:
+        id (int): Primary key.
+        version_id (int): Foreign key to the BillVersion.
+        position (int): Order of the section in the version.
+        label (str): Section number (e.g., '12').
+        heading (str): Marginal note of the section.
+        text (str): Full text of the section.
+        content_hash (str): Hash of heading and text, compared between versions.
+        change (str): 'added', 'modified' or 'unchanged' relative to the previous version.
+        diff (str): Word-level changes from the previous version ('[-old-]{+new+}'), if modified.
+    """
+    __tablename__ = "bill_sections"
+    __table_args__ = (Index("ix_bill_sections_version_id_position", "version_id", "position"),)
+
+    id = Column(Integer, primary_key=True)
+    version_id = Column(Integer, ForeignKey("bill_versions.id", ondelete="CASCADE"), nullable=False)
+    position = Column(Integer, nullable=False)
+    label = Column(String, nullable=False)
+    heading = Column(String, nullable=True)
+    text = Column(Text, nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    change = Column(String, nullable=False)
+    diff = Column(Text, nullable=True)
+
+    bill_version = relationship("BillVersion", back_populates="sections")
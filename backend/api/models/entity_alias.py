@@ -0,0 +1,35 @@
+# backend/api/models/entity_alias.py
+"""
+SQLAlchemy model for the EntityAlias table.
+Maps external identifiers of parties and politicians to their canonical rows.
+"""
+
+from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
+from datetime import datetime
+from .database import Base
+
+class EntityAlias(Base):
+    """
+    Represents an alternative identifier of a party or politician.
+
+    Canonical identifiers (party names, politician URLs and names) are indexed from their own tables;
+    this table only holds the other variants, such as an earlier Open Parliament URL, a party's full
+    or French name, or a name used by another source.
+
+    Attributes:
+        id (int): Primary key.
+        entity_type (str): 'party' or 'politician'.
+        alias (str): Normalized identifier (see `entity_key` in api/data_processing/entities.py).
+        entity_id (int): ID of the Party or Politician it refers to.
+        source (str): Where the alias came from (e.g., 'ingest', 'manual').
+        created_at (datetime): Timestamp when the alias was recorded.
+    """
+    __tablename__ = "entity_aliases"
+    __table_args__ = (UniqueConstraint("entity_type", "alias"),)
+
+    id = Column(Integer, primary_key=True)
+    entity_type = Column(String(16), nullable=False)
+    alias = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    source = Column(String, nullable=False, default="ingest")
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,48 @@
+# backend/api/models/explanation.py
+"""
+SQLAlchemy model for the PolicyExplanation table.
+Stores versioned, precomputed explanations of how a politician's votes compare to their party's platform.
+"""
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint
+from datetime import datetime
+from .database import Base
+
+class PolicyExplanation(Base):
+    """
+    Represents one version of the explanation for a politician, category and platform year.
+
+    Attributes:
+        id (int): Primary key.
+        politician_id (int): Foreign key to the Politician.
+        category (str): Platform category (e.g., 'Housing').
+        election_year (int): Election year of the platform the votes are compared against.
+        version (int): Version number, incremented whenever the inputs change.
+        is_current (bool): Whether this is the latest version (the one served by the API).
+        inputs_hash (str): Hash of the stance, platform text and votes used; unchanged inputs are not regenerated.
+        aligned_count (int): Number of votes aligned with the party's stance.
+        conflicting_count (int): Number of votes conflicting with the party's stance.
+        explanation (str): Plain-language explanation.
+        citations (dict): Cited bills and platform excerpt.
+        generator (str): Name and version of the generator that produced the text.
+        created_at (datetime): Timestamp when the version was generated.
+    """
+    __tablename__ = "policy_explanations"
+    __table_args__ = (
+        UniqueConstraint("politician_id", "category", "election_year", "version"),
+        Index("ix_policy_explanations_current", "politician_id", "is_current"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    politician_id = Column(Integer, ForeignKey("politicians.id"), nullable=False)
+    category = Column(String, nullable=False)
+    election_year = Column(Integer, nullable=False)
+    version = Column(Integer, nullable=False, default=1)
+    is_current = Column(Boolean, nullable=False, default=True)
+    inputs_hash = Column(String(64), nullable=False)
+    aligned_count = Column(Integer, nullable=False, default=0)
+    conflicting_count = Column(Integer, nullable=False, default=0)
+    explanation = Column(Text, nullable=False)
+    citations = Column(JSON, nullable=False)
+    generator = Column(String, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,72 @@
+# backend/api/models/hansard.py
+"""
+SQLAlchemy model for the HansardParagraph table.
+Stores debate paragraphs zlib-compressed, deduplicated by content hash.
+"""
+
+import zlib
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, JSON, LargeBinary, String
+from sqlalchemy import text as sql_text
+from datetime import datetime
+from .database import Base
+
+class HansardParagraph(Base):
+    """
+    Represents one paragraph of a House of Commons speech.
+
+    Attributes:
+        id (int): Primary key.
+        content_hash (str): Hash of the speaker URL and normalized text; a repeated paragraph is stored once.
+        politician_id (int): Foreign key to the Politician (None for the Speaker or unknown speakers).
+        speech_url (str): Open Parliament URL of the speech (e.g., '/debates/2024/5/1/jane-smith-1/').
+        position (int): Index of the paragraph within the speech.
+        spoken_on (date): Day of the debate.
+        language (str): ISO 639-1 code of the text ('en' or 'fr').
+        heading (str): Debate heading (e.g., 'Government Orders').
+        text_compressed (bytes): zlib-compressed UTF-8 text; read through `text`.
+        categories (list): Platform categories mentioned (set by categorization).
+        categorized_at (datetime): When the paragraph was categorized (None while pending).
+        created_at (datetime): Timestamp when the paragraph was stored.
+    """
+    __tablename__ = "hansard_paragraphs"
+    __table_args__ = (
+        Index("ix_hansard_paragraphs_politician_id_spoken_on", "politician_id", "spoken_on"),
+        Index("ix_hansard_paragraphs_spoken_on", "spoken_on"),
+        # Small partial index over the categorization backlog
+        Index("ix_hansard_paragraphs_uncategorized", "id", postgresql_where=sql_text("categorized_at IS NULL")),
+    )
+
+    id = Column(Integer, primary_key=True)
+    content_hash = Column(String(64), unique=True, nullable=False, index=True)
+    politician_id = Column(Integer, ForeignKey("politicians.id"), nullable=True)
+    speech_url = Column(String, nullable=False)
+    position = Column(Integer, nullable=False)
+    spoken_on = Column(Date, nullable=False)
+    language = Column(String(2), nullable=False)
+    heading = Column(String, nullable=True)
+    text_compressed = Column(LargeBinary, nullable=False)
+    categories = Column(JSON, nullable=True)
+    categorized_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    @staticmethod
+    def compress(text: str) -> bytes:
+        """
+        Compress paragraph text for storage.
+        """
+        return zlib.compress(text.encode("utf-8"), 6)
+
+    @staticmethod
+    def decompress(data: bytes) -> str:
+        """
+        Decompress stored paragraph text.
+        """
+        return zlib.decompress(data).decode("utf-8")
+
+    @property
+    def text(self) -> str:
+        """
+        Decompressed paragraph text.
+        """
+        return self.decompress(self.text_compressed)
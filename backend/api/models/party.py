@@ -4,7 +4,7 @@ SQLAlchemy model for the Party and PlatformCategory tables.
 Represents a political party and its categorized platform stances in the database.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .database import Base
@@ -24,8 +24,9 @@ class Party(Base):
     name = Column(String, unique=True, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    # Relationship to PlatformCategory
+    # Relationships to PlatformCategory and Politician
     platform_categories = relationship("PlatformCategory", back_populates="party")
+    politicians = relationship("Politician", back_populates="party")
 
 class PlatformCategory(Base):
     """
@@ -37,15 +38,18 @@ class PlatformCategory(Base):
         election_year (int): Year of the election campaign.
         category (str): Category of the stance (e.g., 'Climate Change and Energy').
         stance (str): Text describing the party's stance in that category.
+        text (str): Platform paragraphs categorized under this category, cited in explanations.
         created_at (datetime): Timestamp when the record was created.
     """
     __tablename__ = "platform_categories"
+    __table_args__ = (Index("ix_platform_categories_party_id_election_year", "party_id", "election_year"),)
 
     id = Column(Integer, primary_key=True, index=True)
     party_id = Column(Integer, ForeignKey("parties.id"), nullable=False)
     election_year = Column(Integer, nullable=False)
     category = Column(String, nullable=False)
     stance = Column(String, nullable=False)
+    text = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationship to Party
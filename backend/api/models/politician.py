@@ -4,7 +4,7 @@ SQLAlchemy model for the Politician table.
 """
 
 from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from .database import Base
 
@@ -14,6 +14,7 @@ class Politician(Base):
 
     Attributes:
         id (int): Primary key.
+        url (str): Open Parliament URL of the politician (e.g., '/politicians/123/').
         name (str): Full name of the politician.
         party_id (int): Foreign key to the Party table.
         position (str): Current role or position (e.g., MP, Minister).
@@ -21,10 +22,13 @@ class Politician(Base):
     """
     __tablename__ = "politicians"
     id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, unique=True, nullable=True, index=True)
     name = Column(String, nullable=False)
     party_id = Column(Integer, ForeignKey("parties.id"), nullable=False)
     position = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    # Optional: Define relationships for easier querying
-    # party = relationship("Party", back_populates="politicians")
\ No newline at end of file
+    # Relationships for eager loading (selectinload/joinedload) in read-model refreshes
+    party = relationship("Party", back_populates="politicians")
+    votes = relationship("Vote", back_populates="politician")
+    bills = relationship("Bill", back_populates="sponsor")
@@ -0,0 +1,177 @@
+# backend/api/models/read_models.py
+"""
+SQLAlchemy models for denormalized honesty read models.
+These tables are rebuilt after each ingestion run (or, for the long-range analytics tables, published
+from the Parquet snapshot analytics in `analytics/`) so every honesty endpoint is a single-table read.
+"""
+
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, JSON, String
+from datetime import datetime
+from .database import Base
+
+class PoliticianScorecard(Base):
+    """
+    Represents a politician's precomputed integrity scorecard.
+
+    Attributes:
+        politician_id (int): Primary key and foreign key to the Politician.
+        politician_name (str): Name of the politician (denormalized).
+        position (str): Current role or position (denormalized).
+        party_id (int): Foreign key to the Party.
+        party_name (str): Name of the party (denormalized).
+        votes_cast (int): Number of votes cast.
+        aligned_votes (int): Vote/category judgements aligned with the party platform.
+        conflicting_votes (int): Vote/category judgements conflicting with the party platform.
+        integrity_score (float): aligned / (aligned + conflicting), or None without judgements.
+        categories (dict): Per-category {'aligned', 'conflicting'} counts.
+        refreshed_at (datetime): Timestamp of the refresh that produced the row.
+    """
+    __tablename__ = "politician_scorecards"
+
+    politician_id = Column(Integer, ForeignKey("politicians.id"), primary_key=True)
+    politician_name = Column(String, nullable=False)
+    position = Column(String, nullable=False)
+    party_id = Column(Integer, ForeignKey("parties.id"), nullable=False, index=True)
+    party_name = Column(String, nullable=False)
+    votes_cast = Column(Integer, nullable=False, default=0)
+    aligned_votes = Column(Integer, nullable=False, default=0)
+    conflicting_votes = Column(Integer, nullable=False, default=0)
+    integrity_score = Column(Float, nullable=True)
+    categories = Column(JSON, nullable=False)
+    refreshed_at = Column(DateTime, default=datetime.utcnow)
+
+class PartyCohesion(Base):
+    """
+    Represents how consistently a party's members voted together in a year.
+
+    Attributes:
+        party_id (int): Part of the primary key; foreign key to the Party.
+        year (int): Part of the primary key; year the votes were cast.
+        party_name (str): Name of the party (denormalized).
+        bills_voted (int): Number of bills with at least one yes/no vote from the party.
+        member_count (int): Number of distinct members who voted.
+        cohesion (float): Average share of members voting with the party majority per bill.
+        refreshed_at (datetime): Timestamp of the refresh that produced the row.
+    """
+    __tablename__ = "party_cohesion"
+
+    party_id = Column(Integer, ForeignKey("parties.id"), primary_key=True)
+    year = Column(Integer, primary_key=True)
+    party_name = Column(String, nullable=False)
+    bills_voted = Column(Integer, nullable=False, default=0)
+    member_count = Column(Integer, nullable=False, default=0)
+    cohesion = Column(Float, nullable=True)
+    refreshed_at = Column(DateTime, default=datetime.utcnow)
+
+class CategoryComparison(Base):
+    """
+    Represents how a party's votes in a category compare with its platform for an election year.
+
+    Attributes:
+        category (str): Part of the primary key; platform category.
+        party_id (int): Part of the primary key; foreign key to the Party.
+        election_year (int): Part of the primary key; election year of the platform.
+        party_name (str): Name of the party (denormalized).
+        stance (str): Platform stance in the category.
+        aligned_votes (int): Member votes aligned with the stance.
+        conflicting_votes (int): Member votes conflicting with the stance.
+        alignment_rate (float): aligned / (aligned + conflicting), or None without votes.
+        refreshed_at (datetime): Timestamp of the refresh that produced the row.
+    """
+    __tablename__ = "category_comparisons"
+
+    category = Column(String, primary_key=True)
+    party_id = Column(Integer, ForeignKey("parties.id"), primary_key=True)
+    election_year = Column(Integer, primary_key=True)
+    party_name = Column(String, nullable=False)
+    stance = Column(String, nullable=False)
+    aligned_votes = Column(Integer, nullable=False, default=0)
+    conflicting_votes = Column(Integer, nullable=False, default=0)
+    alignment_rate = Column(Float, nullable=True)
+    refreshed_at = Column(DateTime, default=datetime.utcnow)
+
+class ParliamentCohesion(Base):
+    """
+    Represents how consistently a party's members voted together over a whole Parliament.
+    Published by the snapshot analytics (analytics/queries.py), not by the ingestion refresh.
+
+    Attributes:
+        party_id (int): Part of the primary key; foreign key to the Party.
+        parliament (int): Part of the primary key; Parliament number (e.g., 44).
+        party_name (str): Name of the party (denormalized).
+        bills_voted (int): Number of bills with at least one yes/no vote from the party.
+        member_count (int): Number of distinct members who voted.
+        votes_cast (int): Number of yes/no votes cast by the party's members.
+        cohesion (float): Average share of members voting with the party majority per bill.
+        refreshed_at (datetime): Timestamp of the publish that produced the row.
+    """
+    __tablename__ = "parliament_cohesion"
+
+    party_id = Column(Integer, ForeignKey("parties.id"), primary_key=True)
+    parliament = Column(Integer, primary_key=True)
+    party_name = Column(String, nullable=False)
+    bills_voted = Column(Integer, nullable=False, default=0)
+    member_count = Column(Integer, nullable=False, default=0)
+    votes_cast = Column(Integer, nullable=False, default=0)
+    cohesion = Column(Float, nullable=True)
+    refreshed_at = Column(DateTime, default=datetime.utcnow)
+
+class PlatformStanceHistory(Base):
+    """
+    Represents a party's platform stance in a category for one election year, next to its previous stance.
+    Published by the snapshot analytics (analytics/queries.py), not by the ingestion refresh.
+
+    Attributes:
+        party_id (int): Part of the primary key; foreign key to the Party.
+        category (str): Part of the primary key; platform category.
+        election_year (int): Part of the primary key; election year of the platform.
+        party_name (str): Name of the party (denormalized).
+        stance (str): Platform stance in the category.
+        previous_election_year (int): Previous election year with a stance in the category, if any.
+        previous_stance (str): Stance in that previous platform, if any.
+        changed (bool): Whether the stance differs from the previous platform's.
+        refreshed_at (datetime): Timestamp of the publish that produced the row.
+    """
+    __tablename__ = "platform_stance_history"
+
+    party_id = Column(Integer, ForeignKey("parties.id"), primary_key=True)
+    category = Column(String, primary_key=True)
+    election_year = Column(Integer, primary_key=True)
+    party_name = Column(String, nullable=False)
+    stance = Column(String, nullable=False)
+    previous_election_year = Column(Integer, nullable=True)
+    previous_stance = Column(String, nullable=True)
+    changed = Column(Boolean, nullable=False, default=False)
+    refreshed_at = Column(DateTime, default=datetime.utcnow)
+
+class StanceDrift(Base):
+    """
+    Represents how much a party's platform changed in a category since the previous election.
+    Maintained incrementally by the drift engine (api/data_processing/drift.py) as platforms are stored.
+
+    The primary key starts with party_id, so a party's whole drift time series is one index range read.
+
+    Attributes:
+        party_id (int): Part of the primary key; foreign key to the Party.
+        category (str): Part of the primary key; platform category.
+        election_year (int): Part of the primary key; election year of the platform.
+        previous_election_year (int): Previous election year with a stance in the category (None for the first).
+        stance (str): Platform stance in the category.
+        previous_stance (str): Stance in the previous platform, if any.
+        label_change (float): Distance between the stance labels, from 0 (same) to 1 (support <-> oppose).
+        text_distance (float): Cosine distance between the embeddings of the categorized texts (0 to 1).
+        drift_score (float): Combined change score (0 to 1); None for the first election year.
+        computed_at (datetime): Timestamp when the row was computed.
+    """
+    __tablename__ = "stance_drift"
+
+    party_id = Column(Integer, ForeignKey("parties.id"), primary_key=True)
+    category = Column(String, primary_key=True)
+    election_year = Column(Integer, primary_key=True)
+    previous_election_year = Column(Integer, nullable=True)
+    stance = Column(String, nullable=False)
+    previous_stance = Column(String, nullable=True)
+    label_change = Column(Float, nullable=True)
+    text_distance = Column(Float, nullable=True)
+    drift_score = Column(Float, nullable=True)
+    computed_at = Column(DateTime, default=datetime.utcnow)
@@ -5,8 +5,10 @@ These schemas define the structure of data exchanged between the frontend and ba
 ensuring type safety and proper serialization of SQLAlchemy models.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+import datetime as dt  # dt.date: VoteSchema has a field named `date`
 from datetime import datetime
+from typing import Any, Dict, Optional
 
 class PartySchema(BaseModel):
     """
@@ -21,8 +23,7 @@ class PartySchema(BaseModel):
     name: str
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class PlatformCategorySchema(BaseModel):
     """
@@ -43,8 +44,7 @@ class PlatformCategorySchema(BaseModel):
     stance: str
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class PoliticianSchema(BaseModel):
     """
@@ -52,19 +52,20 @@ class PoliticianSchema(BaseModel):
 
     Attributes:
         id (int): Unique identifier for the politician.
+        url (Optional[str]): Open Parliament URL of the politician.
         name (str): Full name of the politician.
         party_id (int): Foreign key referencing the Party table (many-to-one).
         position (str): Current role or position (e.g., MP, Minister).
         created_at (datetime): Timestamp when the politician was added.
     """
     id: int
+    url: Optional[str] = None
     name: str
     party_id: int
     position: str
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class BillSchema(BaseModel):
     """
@@ -72,6 +73,8 @@ class BillSchema(BaseModel):
 
     Attributes:
         id (int): Unique identifier for the bill.
+        url (Optional[str]): Open Parliament URL of the bill.
+        number (Optional[str]): Bill number (e.g., 'C-10').
         title (str): Title of the bill.
         description (str): Detailed text of the bill, used for semantic analysis.
         status (str): Current status (e.g., 'proposed', 'passed', 'rejected').
@@ -79,14 +82,15 @@ class BillSchema(BaseModel):
         created_at (datetime): Timestamp when the bill was added.
     """
     id: int
+    url: Optional[str] = None
+    number: Optional[str] = None
     title: str
     description: str
     status: str
     introduced_by: int
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class VoteSchema(BaseModel):
     """
@@ -97,13 +101,236 @@ class VoteSchema(BaseModel):
         politician_id (int): Foreign key referencing the Politician (many-to-one).
         bill_id (int): Foreign key referencing the Bill (many-to-one).
         vote (str): The vote cast (e.g., 'yes', 'no', 'abstain').
+        date (Optional[date]): Day the vote was held.
         created_at (datetime): Timestamp when the vote was recorded.
     """
     id: int
     politician_id: int
     bill_id: int
     vote: str
+    date: Optional[dt.date] = None
     created_at: datetime
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class TranslatedBillSchema(BaseModel):
+    """
+    Schema representing a bill's title and description in a requested language.
+
+    Attributes:
+        bill_id (int): Unique identifier for the bill.
+        language (str): Language code of the translation ('en' or 'fr').
+        title (str): Title of the bill in that language.
+        description (str): Description of the bill in that language.
+    """
+    bill_id: int
+    language: str
+    title: str
+    description: str
+
+
+class PolicyExplanationSchema(BaseModel):
+    """
+    Schema representing the current explanation of a politician's votes in one platform category.
+
+    Attributes:
+        id (int): Unique identifier of the explanation version (used by its audio route).
+        politician_id (int): Foreign key referencing the Politician.
+        category (str): Platform category (e.g., 'Housing').
+        election_year (int): Election year of the platform the votes are compared against.
+        version (int): Version number of the explanation.
+        aligned_count (int): Number of votes aligned with the party's stance.
+        conflicting_count (int): Number of votes conflicting with the party's stance.
+        explanation (str): Plain-language explanation.
+        citations (Dict[str, Any]): Cited bills and platform excerpt.
+        created_at (datetime): Timestamp when the explanation was generated.
+    """
+    id: int
+    politician_id: int
+    category: str
+    election_year: int
+    version: int
+    aligned_count: int
+    conflicting_count: int
+    explanation: str
+    citations: Dict[str, Any]
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class PoliticianScorecardSchema(BaseModel):
+    """
+    Schema representing a politician's precomputed integrity scorecard.
+
+    Attributes:
+        politician_id (int): Unique identifier for the politician.
+        politician_name (str): Full name of the politician.
+        position (str): Current role or position.
+        party_id (int): Foreign key referencing the Party.
+        party_name (str): Name of the party.
+        votes_cast (int): Number of votes cast.
+        aligned_votes (int): Vote/category judgements aligned with the party platform.
+        conflicting_votes (int): Vote/category judgements conflicting with the party platform.
+        integrity_score (Optional[float]): Share of aligned judgements, if any.
+        categories (Dict[str, Dict[str, int]]): Per-category aligned/conflicting counts.
+        refreshed_at (datetime): Timestamp of the read-model refresh.
+    """
+    politician_id: int
+    politician_name: str
+    position: str
+    party_id: int
+    party_name: str
+    votes_cast: int
+    aligned_votes: int
+    conflicting_votes: int
+    integrity_score: Optional[float]
+    categories: Dict[str, Dict[str, int]]
+    refreshed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class PartyCohesionSchema(BaseModel):
+    """
+    Schema representing a party's voting cohesion in one year.
+
+    Attributes:
+        party_id (int): Foreign key referencing the Party.
+        year (int): Year the votes were cast.
+        party_name (str): Name of the party.
+        bills_voted (int): Number of bills voted on by the party's members.
+        member_count (int): Number of members who voted.
+        cohesion (Optional[float]): Average share of members voting with the party majority.
+        refreshed_at (datetime): Timestamp of the read-model refresh.
+    """
+    party_id: int
+    year: int
+    party_name: str
+    bills_voted: int
+    member_count: int
+    cohesion: Optional[float]
+    refreshed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class CategoryComparisonSchema(BaseModel):
+    """
+    Schema representing how a party's votes in a category compare with its platform.
+
+    Attributes:
+        category (str): Platform category.
+        party_id (int): Foreign key referencing the Party.
+        election_year (int): Election year of the platform.
+        party_name (str): Name of the party.
+        stance (str): Platform stance in the category.
+        aligned_votes (int): Member votes aligned with the stance.
+        conflicting_votes (int): Member votes conflicting with the stance.
+        alignment_rate (Optional[float]): Share of aligned votes, if any.
+        refreshed_at (datetime): Timestamp of the read-model refresh.
+    """
+    category: str
+    party_id: int
+    election_year: int
+    party_name: str
+    stance: str
+    aligned_votes: int
+    conflicting_votes: int
+    alignment_rate: Optional[float]
+    refreshed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class ParliamentCohesionSchema(BaseModel):
+    """
+    Schema representing a party's voting cohesion over one Parliament.
+
+    Attributes:
+        party_id (int): Foreign key referencing the Party.
+        parliament (int): Parliament number.
+        party_name (str): Name of the party.
+        bills_voted (int): Number of bills voted on by the party's members.
+        member_count (int): Number of members who voted.
+        votes_cast (int): Number of yes/no votes cast by the party's members.
+        cohesion (Optional[float]): Average share of members voting with the party majority.
+        refreshed_at (datetime): Timestamp of the analytics publish.
+    """
+    party_id: int
+    parliament: int
+    party_name: str
+    bills_voted: int
+    member_count: int
+    votes_cast: int
+    cohesion: Optional[float]
+    refreshed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class PlatformStanceHistorySchema(BaseModel):
+    """
+    Schema representing a party's platform stance in a category for one election year.
+
+    Attributes:
+        party_id (int): Foreign key referencing the Party.
+        category (str): Platform category.
+        election_year (int): Election year of the platform.
+        party_name (str): Name of the party.
+        stance (str): Platform stance in the category.
+        previous_election_year (Optional[int]): Previous election year with a stance, if any.
+        previous_stance (Optional[str]): Stance in that previous platform, if any.
+        changed (bool): Whether the stance differs from the previous platform's.
+        refreshed_at (datetime): Timestamp of the analytics publish.
+    """
+    party_id: int
+    category: str
+    election_year: int
+    party_name: str
+    stance: str
+    previous_election_year: Optional[int]
+    previous_stance: Optional[str]
+    changed: bool
+    refreshed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+class BatchRequestSchema(BaseModel):
+    """
+    Schema representing a batch lookup of entities by ID.
+
+    Attributes:
+        parties (list[int]): IDs of parties to load.
+        politicians (list[int]): IDs of politicians to load.
+        bills (list[int]): IDs of bills to load.
+        votes (list[int]): IDs of votes to load.
+    """
+    parties: list[int] = Field(default_factory=list, max_length=1000)
+    politicians: list[int] = Field(default_factory=list, max_length=1000)
+    bills: list[int] = Field(default_factory=list, max_length=1000)
+    votes: list[int] = Field(default_factory=list, max_length=1000)
+
+class StanceDriftSchema(BaseModel):
+    """
+    Schema representing how much a party's stance in a category changed since the previous election.
+
+    Attributes:
+        party_id (int): Foreign key referencing the Party.
+        category (str): Platform category.
+        election_year (int): Election year of the platform.
+        previous_election_year (Optional[int]): Previous election year with a stance in the category, if any.
+        stance (str): Platform stance in the category.
+        previous_stance (Optional[str]): Stance in the previous platform, if any.
+        label_change (Optional[float]): Change of stance label (0 same, 0.5 to/from neutral, 1 reversal).
+        text_distance (Optional[float]): Embedding distance between the categorized texts (0 to 1).
+        drift_score (Optional[float]): Combined change score (0 to 1); None for the first election year.
+        computed_at (datetime): Timestamp when the row was computed.
+    """
+    party_id: int
+    category: str
+    election_year: int
+    previous_election_year: Optional[int]
+    stance: str
+    previous_stance: Optional[str]
+    label_change: Optional[float]
+    text_distance: Optional[float]
+    drift_score: Optional[float]
+    computed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,34 @@
+# backend/api/models/translation.py
+"""
+SQLAlchemy model for the TranslationMemory table.
+Stores every translated segment so the same text is never sent to the model twice.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from datetime import datetime
+from .database import Base
+
+class TranslationMemory(Base):
+    """
+    Represents a translated text segment (a sentence or a full bill/platform field).
+
+    Attributes:
+        id (int): Primary key.
+        source_hash (str): SHA-256 of source language, target language and source text; unique lookup key.
+        source_lang (str): Language of the source text ('en' or 'fr').
+        target_lang (str): Language of the translation ('en' or 'fr').
+        source_text (str): Original text.
+        translated_text (str): Translated text.
+        model_name (str): Model that produced the translation (e.g., 'Helsinki-NLP/opus-mt-en-fr').
+        created_at (datetime): Timestamp when the translation was stored.
+    """
+    __tablename__ = "translation_memory"
+
+    id = Column(Integer, primary_key=True, index=True)
+    source_hash = Column(String(64), unique=True, nullable=False, index=True)
+    source_lang = Column(String(2), nullable=False)
+    target_lang = Column(String(2), nullable=False)
+    source_text = Column(Text, nullable=False)
+    translated_text = Column(Text, nullable=False)
+    model_name = Column(String, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -1,27 +1,88 @@
 # backend/api/models/vote.py
 """
 SQLAlchemy model for the Vote table.
+
+In PostgreSQL the table is range-partitioned by `date`, one partition per Parliament (see
+migrations/versions/0001_initial_schema.py). Filtering with `in_parliament` (as `/votes?parliament=`
+does) lets the planner prune every other partition.
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
-from sqlalchemy.ext.declarative import declarative_base
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Date, Index, and_
+from sqlalchemy.orm import relationship
+from datetime import date, datetime
+from typing import Optional, Tuple
 from .database import Base
 
+# Parliament number -> (first sitting day, first day of the next Parliament); None = ongoing
+PARLIAMENTS = {
+    39: (date(2006, 4, 3), date(2008, 11, 18)),
+    40: (date(2008, 11, 18), date(2011, 6, 2)),
+    41: (date(2011, 6, 2), date(2015, 12, 3)),
+    42: (date(2015, 12, 3), date(2019, 12, 5)),
+    43: (date(2019, 12, 5), date(2021, 11, 22)),
+    44: (date(2021, 11, 22), date(2025, 5, 26)),
+    45: (date(2025, 5, 26), None),
+}
+
 class Vote(Base):
     """
     Represents a vote cast by a politician on a bill.
 
     Attributes:
-        id (int): Primary key.
+        id (int): Primary key (in PostgreSQL the physical key is (id, date), as partitioning requires).
+        url (str): Open Parliament URL of the vote (e.g., '/votes/42-1/123/').
         politician_id (int): Foreign key to Politician.
         bill_id (int): Foreign key to Bill.
         vote (str): Vote cast ('yes', 'no', 'abstain').
+        date (date): Day the vote was held; the partition key.
         created_at (datetime): Timestamp when the vote was recorded.
     """
     __tablename__ = "votes"
+    __table_args__ = (
+        Index("ix_votes_politician_id_date", "politician_id", "date"),
+        Index("ix_votes_bill_id_politician_id", "bill_id", "politician_id"),
+        Index("ix_votes_created_at_brin", "created_at", postgresql_using="brin"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, nullable=True, index=True)
     politician_id = Column(Integer, ForeignKey("politicians.id"), nullable=False)
     bill_id = Column(Integer, ForeignKey("bills.id"), nullable=False)
     vote = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
+    date = Column(Date, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships to the voter and the bill
+    politician = relationship("Politician", back_populates="votes")
+    bill = relationship("Bill", back_populates="votes")
+
+
+def parliament_dates(parliament: int) -> Tuple[date, Optional[date]]:
+    """
+    Return the date range [start, end) covered by a Parliament's votes partition.
+
+    Args:
+        parliament (int): Parliament number (e.g., 44).
+
+    Returns:
+        Tuple[date, Optional[date]]: Start date and exclusive end date (None if ongoing).
+    """
+    if parliament not in PARLIAMENTS:
+        raise ValueError(f"Unknown Parliament: {parliament}")
+    return PARLIAMENTS[parliament]
+
+
+def in_parliament(parliament: int):
+    """
+    Build a filter restricting votes to one Parliament, so queries scan a single partition.
+
+    Args:
+        parliament (int): Parliament number (e.g., 44).
+
+    Returns:
+        ColumnElement: Criterion usable in `query.filter(...)`.
+    """
+    start, end = parliament_dates(parliament)
+    if end is None:
+        return Vote.date >= start
+    return and_(Vote.date >= start, Vote.date < end)
@@ -0,0 +1,194 @@
+# backend/api/routes/audio.py
+"""
+API routes streaming cached text-to-speech audio with HTTP range support.
+Audio is content-addressed and immutable, so responses are cacheable forever and
+clients can seek or start playback before the whole file has downloaded.
+Audio is synthesized by the ingestion-side queue (text_to_speech/tts.py); these routes only
+read the cache and never load the speech model.
+"""
+
+import re
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session
+from api.models.database import get_db
+from api.models.bill import Bill
+from api.models.explanation import PolicyExplanation
+from text_to_speech import tts
+
+router = APIRouter()
+
+_CHUNK_SIZE = 64 * 1024
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range `Range` header into inclusive byte offsets.
+
+    Args:
+        header (Optional[str]): Value of the Range header (e.g., 'bytes=0-1023', 'bytes=-500').
+        size (int): Size of the file in bytes.
+
+    Returns:
+        Optional[Tuple[int, int]]: (start, end) offsets, or None to serve the whole file.
+
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied.
+    """
+    if not header:
+        return None
+    match = _RANGE_PATTERN.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        # Multi-range or malformed headers fall back to a full response
+        return None
+
+    start, end = match.groups()
+    if start == "":
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start, end = int(start), min(int(end), size - 1) if end else size - 1
+
+    if start >= size or start > end:
+        raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
+def _iter_file(path: Path, start: int, end: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def stream_audio(path: Path, key: str, request: Request) -> StreamingResponse:
+    """
+    Stream an audio file, honouring Range and If-None-Match request headers.
+    """
+    etag = f'"{key}"'
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return StreamingResponse(iter(()), status_code=304, headers=headers)
+
+    size = path.stat().st_size
+    byte_range = parse_range(request.headers.get("range"), size)
+    start, end = byte_range or (0, size - 1)
+    headers["Content-Length"] = str(end - start + 1)
+    if byte_range:
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    return StreamingResponse(
+        _iter_file(path, start, end),
+        status_code=206 if byte_range else 200,
+        media_type="audio/wav",
+        headers=headers,
+    )
+
+
+@router.get("/audio/{key}.wav")
+def get_audio(key: str, request: Request):
+    """
+    Stream a cached audio file by its content key.
+
+    Args:
+        key (str): Audio key (SHA-256 of text, voice and language).
+        request (Request): Incoming request, used for Range headers.
+
+    Returns:
+        StreamingResponse: The full file (200) or the requested byte range (206).
+    """
+    try:
+        path = tts.audio_path(key)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Audio not found")
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Audio not found")
+    return stream_audio(path, key, request)
+
+
+def cached_audio_response(text: Optional[str], lang: str, request: Request):
+    """
+    Stream the cached audio for a text, or answer 202 with its URL while ingestion synthesizes it.
+
+    Args:
+        text (Optional[str]): Text to speak; None if its translation is not available yet.
+        lang (str): Language code ('en' or 'fr').
+        request (Request): Incoming request, used for Range headers.
+
+    Returns:
+        StreamingResponse | JSONResponse: The audio, or 202 with the audio URL.
+    """
+    if text is None:
+        raise HTTPException(status_code=404, detail="Translation not available yet")
+
+    key = tts.audio_key(text, lang)
+    path = tts.audio_path(key)
+    if path.exists():
+        return stream_audio(path, key, request)
+    return JSONResponse(status_code=202, content={"status": "pending", "audio_url": f"/audio/{key}.wav"})
+
+
+def _check_language(lang: str) -> None:
+    if lang not in tts.VOICE_MODELS:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {lang}")
+
+
+@router.get("/bills/{bill_id}/audio/{lang}")
+def get_bill_audio(bill_id: int, lang: str, request: Request, db: Session = Depends(get_db)):
+    """
+    Stream the spoken summary of a bill.
+
+    Args:
+        bill_id (int): ID of the bill.
+        lang (str): Language code ('en' or 'fr').
+        request (Request): Incoming request, used for Range headers.
+        db (Session): Database session dependency.
+
+    Returns:
+        StreamingResponse | JSONResponse: The audio, or 202 with the key while it is generated.
+    """
+    _check_language(lang)
+
+    bill = db.get(Bill, bill_id)
+    if not bill:
+        raise HTTPException(status_code=404, detail="Bill not found")
+
+    return cached_audio_response(tts.bill_audio_text(db, bill, lang), lang, request)
+
+
+@router.get("/politicians/{politician_id}/explanations/{explanation_id}/audio/{lang}")
+def get_explanation_audio(
+    politician_id: int, explanation_id: int, lang: str, request: Request, db: Session = Depends(get_db)
+):
+    """
+    Stream the spoken version of a politician's stance explanation.
+
+    Args:
+        politician_id (int): ID of the politician.
+        explanation_id (int): ID of the explanation version.
+        lang (str): Language code ('en' or 'fr').
+        request (Request): Incoming request, used for Range headers.
+        db (Session): Database session dependency.
+
+    Returns:
+        StreamingResponse | JSONResponse: The audio, or 202 with the key while it is generated.
+    """
+    _check_language(lang)
+
+    explanation = db.get(PolicyExplanation, explanation_id)
+    if not explanation or explanation.politician_id != politician_id:
+        raise HTTPException(status_code=404, detail="Explanation not found")
+
+    return cached_audio_response(tts.explanation_audio_text(db, explanation, lang), lang, request)
@@ -0,0 +1,78 @@
+# backend/api/routes/batch.py
+"""
+API routes that load many entities in one request.
+IDs of each model are coalesced by the request's loaders (api/loaders.py) into single
+`WHERE id IN (...)` queries, and entities referenced more than once are loaded once.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+from api.loaders import RequestLoaders
+from api.models.database import get_db
+from api.models.schemas import BatchRequestSchema
+
+router = APIRouter()
+
+
+def get_loaders(db: Session = Depends(get_db)) -> RequestLoaders:
+    """
+    Dependency providing fresh loaders (and caches) for each request.
+    """
+    return RequestLoaders(db)
+
+
+def _keyed(rows: dict) -> dict:
+    # JSON object keys are strings
+    return {str(key): row for key, row in rows.items()}
+
+
+@router.post("/batch")
+def batch_lookup(request: BatchRequestSchema, loaders: RequestLoaders = Depends(get_loaders)):
+    """
+    Fetch parties, politicians, bills and votes by ID in one request (one query per requested model).
+
+    Args:
+        request (BatchRequestSchema): IDs to load per model.
+        loaders (RequestLoaders): Per-request loaders dependency.
+
+    Returns:
+        ORJSONResponse: For each model, an object mapping each requested ID to its record (null if not found).
+    """
+    return ORJSONResponse({
+        "parties": _keyed(loaders.parties.load_many(request.parties)),
+        "politicians": _keyed(loaders.politicians.load_many(request.politicians)),
+        "bills": _keyed(loaders.bills.load_many(request.bills)),
+        "votes": _keyed(loaders.votes.load_many(request.votes)),
+    })
+
+
+@router.get("/bills/{bill_id}/page")
+def get_bill_page(bill_id: int, loaders: RequestLoaders = Depends(get_loaders)):
+    """
+    Fetch everything a bill page renders: the bill, its sponsor, its votes, the voters and their parties.
+    Runs four queries regardless of the number of votes (bill, votes, politicians, parties).
+
+    Args:
+        bill_id (int): ID of the bill.
+        loaders (RequestLoaders): Per-request loaders dependency.
+
+    Returns:
+        ORJSONResponse: Object with 'bill', 'sponsor', 'votes', and 'politicians' and 'parties' keyed by ID.
+    """
+    bill = loaders.bills.load(bill_id)
+    if not bill:
+        raise HTTPException(status_code=404, detail="Bill not found")
+    votes = loaders.votes_by_bill.load(bill_id)
+
+    # The sponsor and every voter are loaded together, then every party they belong to
+    politicians = loaders.politicians.load_many([bill["introduced_by"], *(v["politician_id"] for v in votes)])
+    parties = loaders.parties.load_many(p["party_id"] for p in politicians.values() if p)
+
+    return ORJSONResponse({
+        "bill": bill,
+        "sponsor": politicians.get(bill["introduced_by"]),
+        "votes": votes,
+        "politicians": _keyed(politicians),
+        "parties": _keyed(parties),
+    })
@@ -3,48 +3,98 @@
 API routes for fetching data on politicians, bills, votes, and party platforms.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import Optional
+from api.models.bill import Bill
 from api.models.database import get_db
 from api.models.party import Party, PlatformCategory
+from api.models.politician import Politician
+from api.models.vote import PARLIAMENTS, Vote, in_parliament
 from api.data_fetching.party_platforms import fetch_party_platform
 from api.data_processing.categorize_platform import categorize_text
 from api.data_processing.analyze_stance import analyze_stance
 from api.models.schemas import PoliticianSchema, BillSchema, VoteSchema, PlatformCategorySchema
+from api.data_processing.drift import enqueue_drift_update
+from api.data_processing.read_models import enqueue_refresh
+from api.serialization import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, rows_response, schema_select
 
 router = APIRouter()
 
 @router.get("/politicians", response_model=list[PoliticianSchema])
-def get_politicians():
+def get_politicians(
+    after_id: int = 0,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     """
-    Fetch a list of politicians.
-    TODO: Replace with actual database query.
+    Fetch a page of politicians ordered by ID.
+
+    Args:
+        after_id (int): Return politicians with a greater ID (the last ID of the previous page).
+        limit (int): Maximum number of politicians.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[PoliticianSchema]: Politicians, encoded directly from row tuples.
     """
-    return [
-        {"id": 1, "name": "John Doe", "party_id": 1, "position": "MP", "created_at": "2023-01-01T00:00:00"},
-        {"id": 2, "name": "Jane Smith", "party_id": 2, "position": "Minister", "created_at": "2023-01-02T00:00:00"}
-    ]
+    query = schema_select(Politician, PoliticianSchema).where(Politician.id > after_id)
+    return rows_response(db.execute(query.order_by(Politician.id).limit(limit)))
 
 @router.get("/bills", response_model=list[BillSchema])
-def get_bills():
+def get_bills(
+    after_id: int = 0,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     """
-    Fetch a list of bills.
-    TODO: Replace with actual database query.
+    Fetch a page of bills ordered by ID.
+
+    Args:
+        after_id (int): Return bills with a greater ID (the last ID of the previous page).
+        limit (int): Maximum number of bills.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[BillSchema]: Bills, encoded directly from row tuples.
     """
-    return [
-        {"id": 1, "title": "Bill A", "description": "Description A", "status": "proposed", "introduced_by": 1, "created_at": "2023-01-03T00:00:00"}
-    ]
+    query = schema_select(Bill, BillSchema).where(Bill.id > after_id)
+    return rows_response(db.execute(query.order_by(Bill.id).limit(limit)))
 
 @router.get("/votes", response_model=list[VoteSchema])
-def get_votes():
+def get_votes(
+    bill_id: Optional[int] = None,
+    politician_id: Optional[int] = None,
+    parliament: Optional[int] = None,
+    after_id: int = 0,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     """
-    Fetch a list of votes.
-    TODO: Replace with actual database query.
+    Fetch a page of votes ordered by ID, optionally for one bill, politician or Parliament.
+
+    Args:
+        bill_id (Optional[int]): Only votes on this bill.
+        politician_id (Optional[int]): Only votes by this politician.
+        parliament (Optional[int]): Only votes of this Parliament (e.g., 44); scans a single partition.
+        after_id (int): Return votes with a greater ID (the last ID of the previous page).
+        limit (int): Maximum number of votes.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[VoteSchema]: Votes, encoded directly from row tuples.
     """
-    return [
-        {"id": 1, "politician_id": 1, "bill_id": 1, "vote": "yes", "created_at": "2023-01-04T00:00:00"}
-    ]
+    query = schema_select(Vote, VoteSchema).where(Vote.id > after_id)
+    if bill_id is not None:
+        query = query.where(Vote.bill_id == bill_id)
+    if politician_id is not None:
+        query = query.where(Vote.politician_id == politician_id)
+    if parliament is not None:
+        if parliament not in PARLIAMENTS:
+            raise HTTPException(status_code=400, detail=f"Unknown Parliament: {parliament}")
+        query = query.where(in_parliament(parliament))
+    return rows_response(db.execute(query.order_by(Vote.id).limit(limit)))
 
 @router.get("/parties/{party_id}/platforms/{election_year}", response_model=list[PlatformCategorySchema])
 def get_party_platform_categories(party_id: int, election_year: int, db: Session = Depends(get_db)):
@@ -90,12 +140,18 @@ def get_party_platform_categories(party_id: int, election_year: int, db: Session
             election_year=election_year,
             category=category,
             stance=stance,
+            text=categorized[category],
             created_at=datetime.utcnow()
         )
         db.add(db_category)
 
     db.commit()
 
+    # The new stances' explanations, translations and audio are produced by the next ingestion run
+    enqueue_refresh()
+    # Only the drift pairs involving this election year change
+    enqueue_drift_update(party_id, election_year)
+
     # Return the newly created categories
     new_categories = db.query(PlatformCategory).filter(
         PlatformCategory.party_id == party_id,
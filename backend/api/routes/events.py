@@ -0,0 +1,155 @@
+# backend/api/routes/events.py
+"""
+Push channels for change events (see api/events.py), replacing polling of /politicians, /bills and /votes.
+
+Both channels accept `topics` (comma-separated, default all) and `cursor` (the last event ID the
+client saw; SSE clients also send it as the Last-Event-ID header when reconnecting). Without a
+cursor a client receives events published from now on. A 'reset' event means the events after
+the client's cursor are no longer retained and it should refetch the lists before continuing.
+"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+from fastapi import APIRouter, Header, Request, WebSocket
+from fastapi.responses import StreamingResponse
+
+from api.events import TOPICS, get_event_bus
+
+router = APIRouter()
+
+# Seconds between keep-alives on an idle connection (below common proxy idle timeouts)
+HEARTBEAT_SECONDS = 15.0
+
+# Reconnect delay suggested to SSE clients, in milliseconds
+SSE_RETRY_MS = 3000
+
+
+def parse_topics(topics: Optional[str]) -> Set[str]:
+    """
+    Parse a comma-separated topic filter.
+
+    Args:
+        topics (Optional[str]): E.g., 'bills,votes'; all topics if empty.
+
+    Returns:
+        Set[str]: Known topics requested.
+    """
+    requested = {t.strip() for t in (topics or "").split(",") if t.strip()}
+    return requested & set(TOPICS) if requested else set(TOPICS)
+
+
+def format_sse(event_type: str, event_id: str, data: Dict) -> str:
+    """
+    Format one server-sent event.
+
+    Args:
+        event_type (str): SSE event name (the topic, or 'reset').
+        event_id (str): Cursor sent back as Last-Event-ID on reconnect.
+        data (Dict): JSON payload.
+
+    Returns:
+        str: SSE frame.
+    """
+    return f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+async def event_messages(
+    cursor: Optional[str],
+    topics: Set[str],
+    is_closed: Callable[[], Awaitable[bool]],
+    heartbeat: float = HEARTBEAT_SECONDS,
+) -> AsyncIterator[Optional[Dict]]:
+    """
+    Yield the events after a cursor as they are published, until the client goes away.
+
+    Args:
+        cursor (Optional[str]): Last cursor the client saw; start from now if None.
+        topics (Set[str]): Topics to deliver.
+        is_closed (Callable[[], Awaitable[bool]]): Returns True once the client disconnected.
+        heartbeat (float): Seconds to wait for new events before yielding a keep-alive.
+
+    Yields:
+        Optional[Dict]: {'id', 'topic', 'data'} events ('reset' topic when the cursor expired),
+        or None as a keep-alive.
+    """
+    bus = get_event_bus()
+    cursor = cursor or await bus.latest_cursor()
+    while not await is_closed():
+        events, reset = await bus.read(cursor)
+        if reset:
+            cursor = await bus.latest_cursor()
+            yield {"id": cursor, "topic": "reset", "data": {"cursor": cursor}}
+            continue
+        for event in events:
+            cursor = event["id"]
+            if event["topic"] in topics:
+                yield event
+        if not events:
+            if not await bus.wait(cursor, heartbeat):
+                yield None
+
+
+@router.get("/events")
+async def stream_events(
+    request: Request,
+    topics: Optional[str] = None,
+    cursor: Optional[str] = None,
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Stream change events as server-sent events.
+
+    Args:
+        request (Request): Incoming request, used to detect disconnects.
+        topics (Optional[str]): Comma-separated topics ('politicians', 'bills', 'votes').
+        cursor (Optional[str]): Last event ID the client saw.
+        last_event_id (Optional[str]): Last-Event-ID header sent by reconnecting EventSource clients.
+
+    Returns:
+        StreamingResponse: text/event-stream of events.
+    """
+    async def body() -> AsyncIterator[str]:
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        async for event in event_messages(last_event_id or cursor, parse_topics(topics), request.is_disconnected):
+            yield ": keep-alive\n\n" if event is None else format_sse(event["topic"], event["id"], event["data"])
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/events/ws")
+async def websocket_events(websocket: WebSocket, topics: Optional[str] = None, cursor: Optional[str] = None):
+    """
+    Push change events over a WebSocket as JSON messages ({'id', 'topic', 'data'}).
+
+    Args:
+        websocket (WebSocket): Client connection; messages from the client are ignored.
+        topics (Optional[str]): Comma-separated topics ('politicians', 'bills', 'votes').
+        cursor (Optional[str]): Last event ID the client saw.
+    """
+    await websocket.accept()
+
+    async def is_closed() -> bool:
+        return False  # disconnects are detected by `receive` below, which cancels `send`
+
+    async def send() -> None:
+        async for event in event_messages(cursor, parse_topics(topics), is_closed):
+            await websocket.send_json({"topic": "keep-alive"} if event is None else event)
+
+    async def receive() -> None:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    tasks = [asyncio.create_task(send()), asyncio.create_task(receive())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,148 @@
+# backend/api/routes/honesty.py
+"""
+API routes for politician honesty and integrity data.
+All responses are read from precomputed tables; nothing is generated on the request path.
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from api.models.database import get_db
+from api.models.read_models import (
+    CategoryComparison,
+    ParliamentCohesion,
+    PartyCohesion,
+    PlatformStanceHistory,
+    PoliticianScorecard,
+    StanceDrift,
+)
+from api.models.schemas import (
+    CategoryComparisonSchema,
+    ParliamentCohesionSchema,
+    PartyCohesionSchema,
+    PlatformStanceHistorySchema,
+    PolicyExplanationSchema,
+    PoliticianScorecardSchema,
+    StanceDriftSchema,
+)
+from policy_explanation.explainer import get_current_explanations
+
+router = APIRouter()
+
+@router.get("/politicians/{politician_id}/scorecard", response_model=PoliticianScorecardSchema)
+def get_politician_scorecard(politician_id: int, db: Session = Depends(get_db)):
+    """
+    Fetch a politician's integrity scorecard (a single primary-key read).
+
+    Args:
+        politician_id (int): ID of the politician.
+        db (Session): Database session dependency.
+
+    Returns:
+        PoliticianScorecardSchema: The precomputed scorecard.
+    """
+    scorecard = db.get(PoliticianScorecard, politician_id)
+    if not scorecard:
+        raise HTTPException(status_code=404, detail="Scorecard not found")
+    return scorecard
+
+@router.get("/politicians/{politician_id}/explanations", response_model=list[PolicyExplanationSchema])
+def get_politician_explanations(politician_id: int, db: Session = Depends(get_db)):
+    """
+    Fetch the current explanations of how a politician's votes compare to their party's platform.
+
+    Args:
+        politician_id (int): ID of the politician.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[PolicyExplanationSchema]: Current explanations, newest platform year first.
+    """
+    return get_current_explanations(db, politician_id)
+
+@router.get("/parties/{party_id}/cohesion", response_model=list[PartyCohesionSchema])
+def get_party_cohesion(party_id: int, db: Session = Depends(get_db)):
+    """
+    Fetch a party's voting cohesion by year.
+
+    Args:
+        party_id (int): ID of the party.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[PartyCohesionSchema]: Cohesion per year, oldest first.
+    """
+    return db.query(PartyCohesion).filter(PartyCohesion.party_id == party_id).order_by(PartyCohesion.year).all()
+
+@router.get("/parties/{party_id}/cohesion/parliaments", response_model=list[ParliamentCohesionSchema])
+def get_party_parliament_cohesion(party_id: int, db: Session = Depends(get_db)):
+    """
+    Fetch a party's voting cohesion per Parliament, as published by the snapshot analytics.
+
+    Args:
+        party_id (int): ID of the party.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[ParliamentCohesionSchema]: Cohesion per Parliament, oldest first.
+    """
+    return (
+        db.query(ParliamentCohesion)
+        .filter(ParliamentCohesion.party_id == party_id)
+        .order_by(ParliamentCohesion.parliament)
+        .all()
+    )
+
+@router.get("/parties/{party_id}/stance-history", response_model=list[PlatformStanceHistorySchema])
+def get_party_stance_history(party_id: int, category: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    Fetch how a party's platform stances changed across election years.
+
+    Args:
+        party_id (int): ID of the party.
+        category (Optional[str]): Restrict the history to one platform category.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[PlatformStanceHistorySchema]: One row per category and election year, oldest first.
+    """
+    query = db.query(PlatformStanceHistory).filter(PlatformStanceHistory.party_id == party_id)
+    if category is not None:
+        query = query.filter(PlatformStanceHistory.category == category)
+    return query.order_by(PlatformStanceHistory.category, PlatformStanceHistory.election_year).all()
+
+@router.get("/parties/{party_id}/drift", response_model=list[StanceDriftSchema])
+def get_party_stance_drift(party_id: int, category: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    Fetch a party's stance drift between consecutive elections (a single primary-key range read).
+
+    Args:
+        party_id (int): ID of the party.
+        category (Optional[str]): Restrict the series to one platform category.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[StanceDriftSchema]: One row per category and election year, oldest first.
+    """
+    query = db.query(StanceDrift).filter(StanceDrift.party_id == party_id)
+    if category is not None:
+        query = query.filter(StanceDrift.category == category)
+    return query.order_by(StanceDrift.category, StanceDrift.election_year).all()
+
+@router.get("/categories/{category}/comparison", response_model=list[CategoryComparisonSchema])
+def get_category_comparison(category: str, party_id: Optional[int] = None, db: Session = Depends(get_db)):
+    """
+    Compare parties' platform stances and votes in a category across election years.
+
+    Args:
+        category (str): Platform category (e.g., 'Housing').
+        party_id (Optional[int]): Restrict the comparison to one party.
+        db (Session): Database session dependency.
+
+    Returns:
+        list[CategoryComparisonSchema]: One row per party and election year, oldest first.
+    """
+    query = db.query(CategoryComparison).filter(CategoryComparison.category == category)
+    if party_id is not None:
+        query = query.filter(CategoryComparison.party_id == party_id)
+    return query.order_by(CategoryComparison.election_year, CategoryComparison.party_id).all()
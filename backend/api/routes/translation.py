@@ -0,0 +1,40 @@
+# backend/api/routes/translation.py
+"""
+API routes serving pre-translated bill text from the translation memory.
+Translations are produced at ingestion time; these routes never call the translation model.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from api.models.database import get_db
+from api.models.bill import Bill
+from api.models.schemas import TranslatedBillSchema
+from translation.translator import SUPPORTED_LANGUAGES, get_translated_bill
+
+router = APIRouter()
+
+@router.get("/bills/{bill_id}/translations/{lang}", response_model=TranslatedBillSchema)
+def get_bill_translation(bill_id: int, lang: str, db: Session = Depends(get_db)):
+    """
+    Fetch a bill's title and description in the requested language.
+
+    Args:
+        bill_id (int): ID of the bill.
+        lang (str): Language code ('en' or 'fr').
+        db (Session): Database session dependency.
+
+    Returns:
+        TranslatedBillSchema: The translated bill fields.
+    """
+    if lang not in SUPPORTED_LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {lang}")
+
+    bill = db.get(Bill, bill_id)
+    if not bill:
+        raise HTTPException(status_code=404, detail="Bill not found")
+
+    translated = get_translated_bill(db, bill, lang)
+    if translated is None:
+        raise HTTPException(status_code=404, detail="Translation not available yet")
+
+    return {"bill_id": bill.id, "language": lang, **translated}
@@ -0,0 +1,61 @@
+# backend/api/serialization.py
+"""
+Fast response path for list endpoints: rows are selected as plain SQLAlchemy `Row` tuples
+(no ORM objects or identity map) and encoded straight to JSON with orjson, skipping
+per-field Pydantic validation.
+
+The selected columns are derived from the endpoint's response schema, so the JSON has exactly
+the documented shape.
+"""
+
+from typing import Dict, List, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Select, select
+from sqlalchemy.engine import Result
+
+# Page size limits of list endpoints
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def schema_select(model, schema: Type[BaseModel]) -> Select:
+    """
+    Build a SELECT of the model columns named by a response schema.
+
+    Args:
+        model: SQLAlchemy model (e.g., Vote).
+        schema (Type[BaseModel]): Response schema whose fields are all columns of the model.
+
+    Returns:
+        Select: Statement returning one Row tuple per record.
+    """
+    return select(*(getattr(model, name) for name in schema.model_fields))
+
+
+def rows_to_dicts(result: Result) -> List[Dict]:
+    """
+    Convert a result of Row tuples into dicts keyed by column name.
+
+    Args:
+        result (Result): Result of a Core/ORM column SELECT.
+
+    Returns:
+        List[Dict]: One dict per row.
+    """
+    keys = list(result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+
+def rows_response(result: Result) -> ORJSONResponse:
+    """
+    Encode a result of Row tuples directly as a JSON array response.
+
+    Args:
+        result (Result): Result of a SELECT built with `schema_select`.
+
+    Returns:
+        ORJSONResponse: JSON array of objects (datetimes as ISO 8601 strings).
+    """
+    return ORJSONResponse(rows_to_dicts(result))
@@ -0,0 +1,82 @@
+# backend/api/tasks.py
+"""
+In-process background work queue for expensive precomputation (e.g., audio synthesis)
+that must never run on the request path.
+"""
+
+import queue
+import threading
+from typing import Callable, Set
+
+
+class TaskQueue:
+    """
+    FIFO queue processed by daemon worker threads, deduplicating tasks by key.
+
+    A task submitted while another task with the same key is pending or running is
+    dropped, so re-ingesting the same bill does not synthesize its audio twice.
+
+    Attributes:
+        name (str): Queue name used in log messages.
+    """
+
+    def __init__(self, name: str, workers: int = 1):
+        self.name = name
+        self._queue: "queue.Queue" = queue.Queue()
+        self._keys: Set[str] = set()
+        self._lock = threading.Lock()
+        self._workers = workers
+        self._threads = []
+
+    def _ensure_started(self) -> None:
+        # Threads start lazily so importing the module (e.g., before a fork) starts nothing
+        if self._threads:
+            return
+        for i in range(self._workers):
+            thread = threading.Thread(target=self._run, name=f"{self.name}-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, key: str, fn: Callable, *args, **kwargs) -> bool:
+        """
+        Schedule `fn(*args, **kwargs)` unless a task with the same key is already queued.
+
+        Args:
+            key (str): Deduplication key (e.g., the content hash of the output).
+            fn (Callable): Function to run in the background.
+
+        Returns:
+            bool: True if the task was queued, False if it was a duplicate.
+        """
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            self._ensure_started()
+        self._queue.put((key, fn, args, kwargs))
+        return True
+
+    def is_pending(self, key: str) -> bool:
+        """
+        Return whether a task with this key is queued or running.
+        """
+        with self._lock:
+            return key in self._keys
+
+    def join(self) -> None:
+        """
+        Block until every submitted task has finished (used by batch jobs before exiting).
+        """
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            key, fn, args, kwargs = self._queue.get()
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                print(f"Error in {self.name} task {key}: {e}")
+            finally:
+                with self._lock:
+                    self._keys.discard(key)
+                self._queue.task_done()
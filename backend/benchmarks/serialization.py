@@ -0,0 +1,82 @@
+# backend/benchmarks/serialization.py
+"""
+Microbenchmark of the /votes list response path, comparing CPU time per response for:
+    - orm+stdlib: ORM objects -> Pydantic (from attributes) -> jsonable_encoder -> stdlib json
+      (the former path of every list endpoint)
+    - orm+pydantic-v2: ORM objects -> Pydantic v2 TypeAdapter.dump_json
+    - rows+orjson: Row tuples -> dicts -> orjson (api/serialization.py, used by the list endpoints)
+
+Runs against an in-memory SQLite database, so it needs no server or network.
+"""
+
+import argparse
+import json
+import timeit
+from datetime import date
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+import api.models  # noqa: F401  (registers every model on Base.metadata)
+from api.models.database import Base
+from api.models.schemas import VoteSchema
+from api.models.vote import Vote
+from api.serialization import rows_response, schema_select
+
+
+def seed(rows: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.execute(insert(Vote), [
+        {"url": f"/votes/44-1/{i // 300}/", "politician_id": i % 338 + 1, "bill_id": i // 300 + 1,
+         "vote": "yes" if i % 3 else "no", "date": date(2024, 1, 1)}
+        for i in range(rows)
+    ])
+    db.commit()
+    return db
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization.")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per response")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    db = seed(args.rows)
+    adapter = TypeAdapter(list[VoteSchema])
+
+    def orm_stdlib() -> bytes:
+        votes = db.query(Vote).order_by(Vote.id).limit(args.rows).all()
+        body = jsonable_encoder([VoteSchema.model_validate(v) for v in votes])
+        db.expunge_all()
+        return json.dumps(body).encode()
+
+    def orm_pydantic_v2() -> bytes:
+        votes = db.query(Vote).order_by(Vote.id).limit(args.rows).all()
+        body = adapter.dump_json(adapter.validate_python(votes, from_attributes=True))
+        db.expunge_all()
+        return body
+
+    def rows_orjson() -> bytes:
+        return rows_response(db.execute(schema_select(Vote, VoteSchema).order_by(Vote.id).limit(args.rows))).body
+
+    # Same payload from every path
+    assert json.loads(orm_stdlib()) == json.loads(rows_orjson()) == json.loads(orm_pydantic_v2())
+    assert isinstance(rows_response(db.execute(schema_select(Vote, VoteSchema).limit(1))), ORJSONResponse)
+
+    baseline = None
+    for name, fn in (("orm+stdlib", orm_stdlib), ("orm+pydantic-v2", orm_pydantic_v2), ("rows+orjson", rows_orjson)):
+        seconds = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        baseline = baseline or seconds
+        print(f"{name:<16} {seconds * 1000:8.2f} ms per {args.rows} rows  ({baseline / seconds:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
+
+# Example usage (from backend/):
+# python -m benchmarks.serialization --rows 5000
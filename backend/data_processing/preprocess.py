@@ -0,0 +1,463 @@
+# backend/data_processing/preprocess.py
+"""
+Streaming preprocessing of scraped platforms, speeches and bulk corpora into clean units of
+bounded size, for keyword categorization and model inference.
+
+Every stage is a generator, so a document is processed line by line (it may be given as an
+iterable of chunks) and a corpus one document at a time:
+    normalize       Unicode NFKC, straight quotes, no zero-width or control characters, single spaces
+    boilerplate     navigation, cookie, social and footer lines (English and French), breadcrumbs,
+                    and short lines repeated within a document (menus rendered twice)
+    segmentation    paragraphs (lines), split at sentence boundaries into units of at most
+                    MAX_UNIT_CHARS, so text scraped without line breaks is still cut into units
+    language        'en', 'fr' or 'und' per unit, for bilingual documents
+    near-duplicates MinHash signatures with LSH banding; a unit too similar to an earlier one is dropped
+
+`preprocess_corpus` runs the per-document stages across a process pool in bounded windows of
+documents and removes near-duplicates in the parent, so the output is the same for any pool size.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import unicodedata
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+# Longest unit in characters: well under the 512-token limit of the stance models, and short
+# enough that a keyword match selects a sentence or two rather than a whole page
+MAX_UNIT_CHARS = 500
+
+# Lines of at most this many words are candidates for boilerplate
+BOILERPLATE_MAX_WORDS = 12
+
+# MinHash signature length and LSH bands (rows per band = NUM_PERM // LSH_BANDS)
+NUM_PERM = 64
+LSH_BANDS = 16
+# Estimated Jaccard similarity of word shingles at or above which a unit is a near-duplicate
+DUPLICATE_THRESHOLD = 0.8
+SHINGLE_SIZE = 3
+
+_QUOTES = str.maketrans({"\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"'})
+_INVISIBLE = re.compile(r"[\u00ad\u200b-\u200f\u2060\ufeff]")
+_CONTROL = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+_SPACES = re.compile(r"\s+")
+
+# Phrases that only occur in page chrome (matched in short lines only)
+_BOILERPLATE = re.compile(
+    r"(?i)(©|\bskip to (main )?content\b|\bcookies?\b|\bprivacy policy\b|\bterms of (use|service)\b"
+    r"|\ball rights reserved\b|\bshare (on|this)\b|\bfollow us\b|\bsign up\b|\bsubscribe\b|\bback to top\b"
+    r"|\bread more\b|\bpasser au contenu\b|\btémoins\b|\bpolitique de confidentialité\b"
+    r"|\bconditions d'utilisation\b|\btous droits réservés\b|\bpartager\b|\bsuivez-nous\b"
+    r"|\babonnez-vous\b|\bretour en haut\b|\blire la suite\b)"
+)
+# Whole lines that are menu items
+_NAV_ITEM = re.compile(
+    r"(?i)(home|menu|search|donate|volunteer|join|contact( us)?|english|français|accueil|rechercher"
+    r"|faites un don|faire un don|bénévole|adhérez|nous joindre)"
+)
+_BREADCRUMB = re.compile(r"\s[|>»/•·]\s")
+
+_ABBREVIATIONS = frozenset({
+    "mr", "mrs", "ms", "dr", "st", "hon", "jr", "sr", "no", "nos", "vs", "etc", "e.g", "i.e", "u.s",
+    "u.k", "m", "mme", "mmes", "art", "sect", "ch", "p", "pp", "inc", "ltd", "co", "approx", "cf",
+})
+_SENTENCE_END = re.compile(r"[.!?…]+[\"')\]»]*(?=\s+[\"'(\[«]?[^\W_a-zà-ÿ])")
+
+_EN_WORDS = frozenset(
+    "the and of to in is that for it with as was on be by this are we will our have not from".split()
+)
+_FR_WORDS = frozenset(
+    "le la les et des du de un une est que qui pour dans au aux sur nous avec pas par ce cette sont "
+    "notre nos vous plus".split()
+)
+_ACCENTED = re.compile(r"[àâçéèêëîïôûùüÿœ]")
+
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(42)
+# Fixed coefficients, so signatures are comparable across processes and runs
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)]
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize one line: NFKC, straight quotes, no invisible or control characters, single spaces.
+
+    Args:
+        text (str): Raw text (a line; newlines become spaces).
+
+    Returns:
+        str: Normalized, stripped text.
+    """
+    text = unicodedata.normalize("NFKC", text).translate(_QUOTES)
+    text = _CONTROL.sub(" ", _INVISIBLE.sub("", text))
+    return _SPACES.sub(" ", text).strip()
+
+
+def iter_lines(document: Union[str, Iterable[str]]) -> Iterator[str]:
+    """
+    Split a document, or a stream of chunks of one, into lines without holding it all in memory.
+
+    Args:
+        document (Union[str, Iterable[str]]): Document text, or chunks of it in order.
+
+    Yields:
+        str: Lines, without line breaks (a line may span chunks).
+    """
+    chunks = [document] if isinstance(document, str) else document
+    pending = ""
+    for chunk in chunks:
+        lines = (pending + chunk).splitlines(keepends=True)
+        pending = lines.pop() if lines and not lines[-1].endswith(("\n", "\r")) else ""
+        for line in lines:
+            yield line.rstrip("\r\n")
+    if pending:
+        yield pending
+
+
+def is_boilerplate(line: str) -> bool:
+    """
+    Whether a normalized line is page chrome rather than content.
+
+    Args:
+        line (str): Normalized line.
+
+    Returns:
+        bool: True for empty lines, menu items, breadcrumbs, footers and lines without words.
+    """
+    words = line.split()
+    if not words:
+        return True
+    if not any(sum(c.isalpha() for c in word) >= 3 for word in words):
+        # Page numbers, separators, dates and other lines without a real word
+        return True
+    if len(words) > BOILERPLATE_MAX_WORDS:
+        return False
+    return bool(
+        _NAV_ITEM.fullmatch(line.rstrip(" .:>»"))
+        or _BOILERPLATE.search(line)
+        or len(_BREADCRUMB.findall(f" {line} ")) >= 2
+    )
+
+
+def clean_paragraphs(document: Union[str, Iterable[str]]) -> Iterator[str]:
+    """
+    Normalized content lines of a document, without boilerplate and repeated short lines.
+
+    Args:
+        document (Union[str, Iterable[str]]): Document text, or chunks of it in order.
+
+    Yields:
+        str: Paragraphs (one per non-boilerplate line).
+    """
+    seen_short: Set[str] = set()
+    for line in iter_lines(document):
+        line = normalize_text(line)
+        if is_boilerplate(line):
+            continue
+        if len(line.split()) <= BOILERPLATE_MAX_WORDS:
+            # Menus, headers and footers rendered more than once per page
+            if line.lower() in seen_short:
+                continue
+            seen_short.add(line.lower())
+        yield line
+
+
+def split_sentences(paragraph: str) -> List[str]:
+    """
+    Split a paragraph into sentences, keeping abbreviations ('Mr.', 'U.S.', 'M.') and initials intact.
+
+    Args:
+        paragraph (str): Normalized paragraph.
+
+    Returns:
+        List[str]: Sentences in order.
+    """
+    sentences, start = [], 0
+    for match in _SENTENCE_END.finditer(paragraph):
+        before = paragraph[start:match.start()].rsplit(None, 1)
+        last_word = before[-1].lower().lstrip("\"'([«") if before else ""
+        if match.group().startswith(".") and (last_word in _ABBREVIATIONS or len(last_word) == 1):
+            continue
+        sentences.append(paragraph[start:match.end()].strip())
+        start = match.end()
+    rest = paragraph[start:].strip()
+    if rest:
+        sentences.append(rest)
+    return sentences
+
+
+def _wrap(sentence: str, max_chars: int) -> Iterator[str]:
+    # Sentences longer than a unit are cut at the last space that fits
+    while len(sentence) > max_chars:
+        cut = sentence.rfind(" ", 0, max_chars + 1)
+        cut = cut if cut > 0 else max_chars
+        yield sentence[:cut].strip()
+        sentence = sentence[cut:].strip()
+    if sentence:
+        yield sentence
+
+
+def iter_units(paragraph: str, max_chars: int = MAX_UNIT_CHARS) -> Iterator[str]:
+    """
+    Pack a paragraph's sentences into units of at most `max_chars` characters.
+
+    Args:
+        paragraph (str): Normalized paragraph.
+        max_chars (int): Maximum unit length.
+
+    Yields:
+        str: Units; a paragraph that fits is a single unit.
+    """
+    if len(paragraph) <= max_chars:
+        yield paragraph
+        return
+    unit = ""
+    for sentence in split_sentences(paragraph):
+        for piece in _wrap(sentence, max_chars):
+            if unit and len(unit) + 1 + len(piece) > max_chars:
+                yield unit
+                unit = piece
+            else:
+                unit = f"{unit} {piece}" if unit else piece
+    if unit:
+        yield unit
+
+
+def clean_units(document: Union[str, Iterable[str]], max_chars: int = MAX_UNIT_CHARS) -> Iterator[str]:
+    """
+    Clean, bounded-size units of a document (normalization, boilerplate removal, segmentation).
+
+    Args:
+        document (Union[str, Iterable[str]]): Document text, or chunks of it in order.
+        max_chars (int): Maximum unit length.
+
+    Yields:
+        str: Units in document order.
+    """
+    for paragraph in clean_paragraphs(document):
+        yield from iter_units(paragraph, max_chars)
+
+
+def detect_language(text: str) -> str:
+    """
+    Tell English from French by stopwords and accented letters.
+
+    Args:
+        text (str): Normalized text.
+
+    Returns:
+        str: 'en', 'fr', or 'und' when there is no evidence either way.
+    """
+    words = re.findall(r"[^\W\d_]+", text.lower())
+    english = sum(word in _EN_WORDS for word in words)
+    french = sum(word in _FR_WORDS for word in words) + 0.5 * sum(bool(_ACCENTED.search(w)) for w in words)
+    if english == french:
+        return "und"
+    return "en" if english > french else "fr"
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """
+    Word shingles of a text, case- and punctuation-insensitive.
+
+    Args:
+        text (str): Normalized text.
+        size (int): Words per shingle.
+
+    Returns:
+        Set[str]: Shingles (the whole text if it has fewer words than `size`).
+    """
+    words = re.findall(r"\w+", text.lower())
+    if len(words) <= size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(text: str) -> Tuple[int, ...]:
+    """
+    MinHash signature of a text's word shingles.
+
+    Args:
+        text (str): Normalized text.
+
+    Returns:
+        Tuple[int, ...]: NUM_PERM minimum hash values; the share of equal positions in two
+        signatures estimates the Jaccard similarity of their shingle sets.
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+        for s in shingles(text)
+    ]
+    return tuple(min((a * h + b) % _MERSENNE for h in hashes) for a, b in _PERMUTATIONS)
+
+
+class NearDuplicateFilter:
+    """
+    Streaming near-duplicate detection over MinHash signatures with LSH banding.
+
+    Signatures sharing a band are candidates; a candidate is a duplicate when its estimated
+    similarity reaches the threshold. Memory grows with the number of distinct units kept.
+
+    Attributes:
+        threshold (float): Estimated Jaccard similarity at or above which a unit is a duplicate.
+        bands (int): Number of LSH bands the signature is split into.
+    """
+
+    def __init__(self, threshold: float = DUPLICATE_THRESHOLD, bands: int = LSH_BANDS):
+        self.threshold = threshold
+        self.bands = bands
+        self._signatures: List[Tuple[int, ...]] = []
+        self._buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+
+    def _keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, int]]:
+        rows = len(signature) // self.bands
+        return [(band, hash(signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+
+    def is_duplicate(self, signature: Tuple[int, ...]) -> bool:
+        """
+        Check a signature against those seen so far, and remember it if it is new.
+
+        Args:
+            signature (Tuple[int, ...]): MinHash signature (see `minhash`).
+
+        Returns:
+            bool: True if a near-duplicate was seen before.
+        """
+        keys = self._keys(signature)
+        candidates = {i for key in keys for i in self._buckets.get(key, ())}
+        for i in candidates:
+            seen = self._signatures[i]
+            if sum(x == y for x, y in zip(signature, seen)) >= self.threshold * len(signature):
+                return True
+        for key in keys:
+            self._buckets[key].append(len(self._signatures))
+        self._signatures.append(signature)
+        return False
+
+
+def preprocess_document(
+    document: Union[str, Iterable[str]],
+    max_chars: int = MAX_UNIT_CHARS,
+    signatures: bool = False,
+) -> Iterator[Dict]:
+    """
+    Clean units of one document with their language.
+
+    Args:
+        document (Union[str, Iterable[str]]): Document text, or chunks of it in order.
+        max_chars (int): Maximum unit length.
+        signatures (bool): Add each unit's MinHash 'signature'.
+
+    Yields:
+        Dict: 'position' (unit index in the document), 'text' and 'language'.
+    """
+    for position, text in enumerate(clean_units(document, max_chars)):
+        unit = {"position": position, "text": text, "language": detect_language(text)}
+        if signatures:
+            unit["signature"] = minhash(text)
+        yield unit
+
+
+def _process(item: Tuple[str, str, int, bool]) -> Tuple[str, List[Dict]]:
+    document_id, text, max_chars, signatures = item
+    return document_id, list(preprocess_document(text, max_chars, signatures))
+
+
+def preprocess_corpus(
+    documents: Iterable[Tuple[str, Union[str, Iterable[str]]]],
+    dedupe: bool = True,
+    workers: int = 1,
+    chunk_size: int = 16,
+    max_chars: int = MAX_UNIT_CHARS,
+    duplicates: Optional[NearDuplicateFilter] = None,
+) -> Iterator[Dict]:
+    """
+    Preprocess a stream of documents into clean units, without near-duplicates across the corpus.
+
+    With one worker everything streams in this process. With more, documents are sent to a
+    process pool in windows of `workers * chunk_size`, so at most one window is held in memory;
+    the per-document stages and signatures run in the pool, and deduplication in order here.
+
+    Args:
+        documents (Iterable[Tuple[str, Union[str, Iterable[str]]]]): (document ID, text) pairs;
+            with one worker the text may be an iterable of chunks.
+        dedupe (bool): Drop units that are near-duplicates of an earlier unit.
+        workers (int): Number of processes.
+        chunk_size (int): Documents sent to a worker at a time.
+        max_chars (int): Maximum unit length.
+        duplicates (Optional[NearDuplicateFilter]): Filter to share across calls (default: a new one).
+
+    Yields:
+        Dict: 'document', 'position', 'text' and 'language' of each unit, in document order.
+    """
+    duplicates = duplicates or NearDuplicateFilter()
+
+    def emit(document_id: str, units: Iterable[Dict]) -> Iterator[Dict]:
+        for unit in units:
+            signature = unit.pop("signature", None)
+            if dedupe and duplicates.is_duplicate(signature):
+                continue
+            yield {"document": document_id, **unit}
+
+    if workers <= 1:
+        for document_id, text in documents:
+            yield from emit(document_id, preprocess_document(text, max_chars, dedupe))
+        return
+
+    items = ((document_id, text, max_chars, dedupe) for document_id, text in documents)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            window = list(islice(items, workers * chunk_size))
+            if not window:
+                return
+            for document_id, units in pool.map(_process, window, chunksize=chunk_size):
+                yield from emit(document_id, units)
+
+
+def _read_jsonl(path: str, text_field: str) -> Iterator[Tuple[str, str]]:
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if line.strip():
+                record = json.loads(line)
+                yield str(record.get("id", line_number)), record[text_field]
+
+
+def main() -> None:
+    """
+    Command-line entry point: preprocess a JSONL corpus into JSONL units.
+    """
+    parser = argparse.ArgumentParser(description="Clean, segment and deduplicate a text corpus.")
+    parser.add_argument("input", help="JSONL file with one document per line")
+    parser.add_argument("--output", help="JSONL file of units (default: stdout)")
+    parser.add_argument("--text-field", default="text", help="Field holding the document text")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument("--max-chars", type=int, default=MAX_UNIT_CHARS, help="Maximum unit length")
+    parser.add_argument("--keep-duplicates", action="store_true", help="Skip near-duplicate removal")
+    args = parser.parse_args()
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        units = preprocess_corpus(
+            _read_jsonl(args.input, args.text_field),
+            dedupe=not args.keep_duplicates,
+            workers=args.workers,
+            max_chars=args.max_chars,
+        )
+        for unit in units:
+            out.write(json.dumps(unit, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
+
+# Example usage (from backend/):
+#     python -m data_processing.preprocess data/platforms.jsonl --output data/units.jsonl --workers 8
@@ -0,0 +1,69 @@
+# backend/data_processing/utils.py
+"""
+Shared helpers for text processing: content hashing and length-bucketed batching.
+"""
+
+import hashlib
+import random
+from typing import List, Sequence
+
+
+def content_hash(*parts: str) -> str:
+    """
+    Compute a stable SHA-256 hex digest over one or more text parts.
+
+    Args:
+        *parts (str): Text parts to hash (e.g., source text, language, model name).
+
+    Returns:
+        str: 64-character hex digest. Parts are separated so ("ab", "c") != ("a", "bc").
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def length_bucketed_batches(
+    lengths: Sequence[int],
+    batch_size: int,
+    shuffle: bool = False,
+    seed: int = 0,
+    bucket_multiplier: int = 50,
+) -> List[List[int]]:
+    """
+    Group item indices into batches of similar length to minimize padding.
+
+    Without shuffling, items are sorted by length globally. With shuffling, items are
+    shuffled, split into buckets of `batch_size * bucket_multiplier`, sorted by length
+    within each bucket, and the resulting batches are shuffled again, so every epoch
+    sees a different order while batches stay length-homogeneous.
+
+    Args:
+        lengths (Sequence[int]): Length (e.g., token count) of each item.
+        batch_size (int): Maximum number of items per batch.
+        shuffle (bool): Whether to randomize bucket contents and batch order.
+        seed (int): Random seed used when shuffling.
+        bucket_multiplier (int): Number of batches per sorting bucket.
+
+    Returns:
+        List[List[int]]: Batches of indices into `lengths`.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    indices = list(range(len(lengths)))
+    if not shuffle:
+        indices.sort(key=lambda i: lengths[i])
+        return [indices[i:i + batch_size] for i in range(0, len(indices), batch_size)]
+
+    rng = random.Random(seed)
+    rng.shuffle(indices)
+    bucket_size = batch_size * max(1, bucket_multiplier)
+    batches = []
+    for start in range(0, len(indices), bucket_size):
+        bucket = sorted(indices[start:start + bucket_size], key=lambda i: lengths[i])
+        batches.extend(bucket[i:i + batch_size] for i in range(0, len(bucket), batch_size))
+    rng.shuffle(batches)
+    return batches
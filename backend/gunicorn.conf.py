@@ -0,0 +1,49 @@
+# backend/gunicorn.conf.py
+"""
+Gunicorn settings for the API: Uvicorn workers forked from a master that has already imported
+the app and memory-mapped the transformer weights (api/model_weights.py), so each extra worker
+adds almost no model memory.
+
+    gunicorn -c gunicorn.conf.py api.main:app
+"""
+
+import gc
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+# Import the app (and map the models) once in the master; workers inherit it on fork
+preload_app = True
+
+# Intra-op threads per worker; the default (one per core) oversubscribes the CPU with several workers
+TORCH_THREADS = int(os.getenv("TORCH_THREADS", "1"))
+
+
+def when_ready(server):
+    """
+    Map the serving models in the master, then freeze the heap before the workers are forked.
+    """
+    from api.data_processing.analyze_stance import SENTIMENT_MODEL
+    from api.model_weights import SERVING_MODELS, preload_models
+
+    count = preload_models(SERVING_MODELS or [SENTIMENT_MODEL])
+    server.log.info("Mapped %d model(s) before forking", count)
+    # Objects allocated so far are never scanned by the workers' collectors, so their pages
+    # are not dirtied (and copied) by reference-count and GC header writes
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """
+    Per-worker setup: tokenizers and pipelines are created in the worker, never inherited.
+    """
+    # The Rust tokenizers' thread pool does not survive a fork
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    import torch
+
+    from api.data_processing.analyze_stance import get_sentiment_pipeline
+
+    torch.set_num_threads(TORCH_THREADS)
+    get_sentiment_pipeline.cache_clear()
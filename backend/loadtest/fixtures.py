@@ -0,0 +1,228 @@
+# backend/loadtest/fixtures.py
+"""
+Upstream fixtures replayed by the stub server (loadtest/stub_server.py).
+
+Fixtures are either recorded from the live services with `record_fixtures` (a JSON file of the
+raw Open Parliament objects, bill XML publications and archived platform pages) or generated
+deterministically at any scale with `generate_fixtures`, so load tests run without a network.
+
+Fixture document layout:
+    politicians, bills, votes, speeches: lists of raw Open Parliament objects
+    publications: parl.ca path -> bill XML
+    platforms: Wayback Machine path -> archived platform HTML
+"""
+
+import argparse
+import json
+import random
+from typing import Dict, Iterable, List
+from xml.sax.saxutils import escape
+
+import requests
+
+from api.data_fetching import upstream
+from api.data_fetching.bill_text import USER_EMAIL, publication_url
+
+PARTY_SLUGS = ["liberal", "conservative", "ndp", "bloc", "green"]
+
+ELECTION_YEARS = [2006, 2008, 2011, 2015, 2019, 2021]
+
+_WORDS = (
+    "housing climate energy tax health care jobs economy families budget defence trade immigration "
+    "indigenous reconciliation pharmacare transit childcare seniors veterans rural broadband carbon "
+    "pricing affordability deficit investment infrastructure workers pensions farmers fisheries"
+).split()
+
+_TOPICS = ["Government Orders", "Oral Questions", "Statements by Members", "Routine Proceedings"]
+
+
+def _sentence(rng: random.Random, words: int = 14) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _bill_xml(rng: random.Random, sections: int) -> str:
+    body = "".join(
+        f"<Section><MarginalNote>{escape(_sentence(rng, 3))}</MarginalNote><Label>{i + 1}</Label>"
+        f"<Text>{escape(' '.join(_sentence(rng) for _ in range(3)))}</Text></Section>"
+        for i in range(sections)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><Bill><Body>{body}</Body></Bill>'
+
+
+def generate_fixtures(
+    politicians: int = 338,
+    bills: int = 200,
+    speeches: int = 5000,
+    sections_per_bill: int = 20,
+    seed: int = 0,
+) -> Dict:
+    """
+    Generate a synthetic fixture document shaped like the live services' responses.
+
+    Every politician votes on every bill (one division per bill), and every government bill
+    has a first-reading XML publication.
+
+    Args:
+        politicians (int): Number of members.
+        bills (int): Number of bills.
+        speeches (int): Number of Hansard speeches.
+        sections_per_bill (int): Sections in each bill publication.
+        seed (int): Random seed; the same arguments always produce the same fixtures.
+
+    Returns:
+        Dict: Fixture document (see module docstring).
+    """
+    rng = random.Random(seed)
+    members = [{
+        "url": f"/politicians/member-{i}/",
+        "name": f"Member {i}",
+        "party": f"/parties/{PARTY_SLUGS[i % len(PARTY_SLUGS)]}/",
+        "position": "MP",
+    } for i in range(politicians)]
+
+    bill_objects, votes, publications = [], [], {}
+    for i in range(bills):
+        number = f"C-{i + 1}"
+        url = f"/bills/44-1/{number}/"
+        bill_objects.append({
+            "url": url,
+            "number": number,
+            "name": f"An Act respecting {rng.choice(_WORDS)} ({number})",
+            "summary": _sentence(rng, 30),
+            "status": rng.choice(["proposed", "passed", "royal assent"]),
+            "sponsor": members[i % politicians]["url"],
+            "introduced_date": f"2022-{i % 12 + 1:02d}-01",
+        })
+        path = publication_url(url, number, 1).split("/Content/", 1)[1]
+        publications[f"/Content/{path}"] = _bill_xml(rng, sections_per_bill)
+        for member in members:
+            votes.append({
+                "url": f"/votes/44-1/{i + 1}/",
+                "politician_url": member["url"],
+                "bill_url": url,
+                "vote": rng.choice(["yes", "yes", "no", "abstain"]),
+                "date": f"2023-{i % 12 + 1:02d}-15",
+            })
+
+    speech_objects = []
+    for i in range(speeches):
+        member = members[rng.randrange(politicians)]
+        day = f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}"
+        paragraphs = "".join(f"<p>{_sentence(rng, 25)}</p>" for _ in range(rng.randint(1, 6)))
+        speech_objects.append({
+            "url": f"/debates/{day.replace('-', '/')}/{member['url'].strip('/').split('/')[-1]}-{i}/",
+            "politician_url": member["url"],
+            "time": f"{day} 14:{i % 60:02d}:00",
+            "h1": {"en": rng.choice(_TOPICS), "fr": rng.choice(_TOPICS)},
+            "content": {"en": paragraphs, "fr": paragraphs},
+        })
+
+    platforms = {}
+    for slug in PARTY_SLUGS:
+        for year in ELECTION_YEARS:
+            text = " ".join(_sentence(rng, 20) for _ in range(40))
+            platforms[f"/web/{year}*/https://{slug}.ca/platform/{year}"] = (
+                f'<html><body><div class="platform-content">{text}</div></body></html>'
+            )
+
+    return {
+        "politicians": members,
+        "bills": bill_objects,
+        "votes": votes,
+        "speeches": speech_objects,
+        "publications": publications,
+        "platforms": platforms,
+    }
+
+
+def _record_objects(session: requests.Session, path: str, limit: int) -> List[Dict]:
+    # Follow the API's pagination until `limit` objects are recorded
+    headers = {"API-Version": "v1", "User-Agent": USER_EMAIL}
+    url, params, objects = f"{upstream.OPENPARLIAMENT_API_ROOT}{path}", {"limit": min(limit, 100)}, []
+    while url and len(objects) < limit:
+        response = upstream.get(url, session=session, headers=headers, params=params, timeout=30)
+        response.raise_for_status()
+        page = response.json()
+        objects.extend(page.get("objects", []) if isinstance(page, dict) else page)
+        next_url = (page.get("pagination") or {}).get("next_url") if isinstance(page, dict) else None
+        url, params = (f"{upstream.OPENPARLIAMENT_API_ROOT}{next_url}", None) if next_url else (None, None)
+    return objects[:limit]
+
+
+def record_fixtures(limit: int = 500, parties: Iterable[str] = PARTY_SLUGS, years: Iterable[int] = (2021,)) -> Dict:
+    """
+    Record a fixture document from the live services.
+
+    Args:
+        limit (int): Maximum objects recorded per Open Parliament endpoint.
+        parties (Iterable[str]): Party slugs whose archived platforms are recorded.
+        years (Iterable[int]): Election years of the recorded platforms.
+
+    Returns:
+        Dict: Fixture document (see module docstring).
+    """
+    fixtures = {"publications": {}, "platforms": {}}
+    with requests.Session() as session:
+        for name in ("politicians", "bills", "votes", "speeches"):
+            fixtures[name] = _record_objects(session, f"/{name}/", limit)
+
+        for bill in fixtures["bills"]:
+            url = publication_url(bill.get("url", ""), bill.get("number", ""), 1)
+            if not url:
+                continue
+            response = upstream.get(url, session=session, headers={"User-Agent": USER_EMAIL}, timeout=30)
+            if response.status_code == 200:
+                fixtures["publications"][url[len(upstream.PARL_ROOT):]] = response.text
+
+        for slug in parties:
+            for year in years:
+                path = f"/{year}*/https://{slug}.ca/platform/{year}"
+                response = upstream.get(f"{upstream.WAYBACK_ROOT}{path}", session=session, timeout=30)
+                if response.status_code == 200:
+                    fixtures["platforms"][f"/web{path}"] = response.text
+    return fixtures
+
+
+def save_fixtures(fixtures: Dict, path: str) -> None:
+    """
+    Write a fixture document to a JSON file.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(fixtures, f)
+
+
+def load_fixtures(path: str) -> Dict:
+    """
+    Read a fixture document written by `save_fixtures`.
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> None:
+    """
+    Command-line entry point: record fixtures from the live services, or generate synthetic ones.
+    """
+    parser = argparse.ArgumentParser(description="Record or generate upstream fixtures for the stub server.")
+    parser.add_argument("output", help="JSON file to write")
+    parser.add_argument("--record", action="store_true", help="Record from the live services instead of generating")
+    parser.add_argument("--limit", type=int, default=500, help="Objects recorded per endpoint")
+    parser.add_argument("--politicians", type=int, default=338)
+    parser.add_argument("--bills", type=int, default=200)
+    parser.add_argument("--speeches", type=int, default=5000)
+    args = parser.parse_args()
+
+    if args.record:
+        fixtures = record_fixtures(args.limit)
+    else:
+        fixtures = generate_fixtures(args.politicians, args.bills, args.speeches)
+    save_fixtures(fixtures, args.output)
+    print({name: len(items) for name, items in fixtures.items()})
+
+
+if __name__ == "__main__":
+    main()
+
+# Example usage (from backend/):
+#     python -m loadtest.fixtures data/fixtures.json --record --limit 1000
+#     python -m loadtest.fixtures data/synthetic.json --politicians 338 --bills 400
@@ -0,0 +1,280 @@
+# backend/loadtest/harness.py
+"""
+Load-test harness reporting throughput and latency percentiles for two scenarios:
+    ingest  crawl the stub server (loadtest/stub_server.py) and store everything, phase by phase,
+            with the upstream's own view of the requests (latency, 429s, failures)
+    api     drive a running API server with concurrent clients over a weighted mix of endpoints
+
+Both run offline: the ingest scenario starts the stub server in-process, and the API under test
+can itself be pointed at the stub server for its upstream calls (see stub_server.py).
+"""
+
+import argparse
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from api.data_fetching import upstream
+from loadtest.fixtures import generate_fixtures, load_fixtures
+from loadtest.stub_server import FaultProfile, StubServer
+
+# Endpoint mix of the API scenario: (weight, path template); {id} is replaced by a random ID
+DEFAULT_MIX = [
+    (4, "/politicians?limit=100"),
+    (4, "/bills?limit=100"),
+    (2, "/votes?limit=1000"),
+    (6, "/bills/{id}/page"),
+    (3, "/politicians/{id}/scorecard"),
+    (1, "/parties/{id}/drift"),
+]
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentiles(samples: Sequence[float], points: Iterable[int] = PERCENTILES) -> Dict[str, float]:
+    """
+    Nearest-rank percentiles of latency samples.
+
+    Args:
+        samples (Sequence[float]): Latencies in seconds.
+        points (Iterable[int]): Percentiles to compute.
+
+    Returns:
+        Dict[str, float]: 'p50', 'p90', ... and 'max' in milliseconds (empty if there are no samples).
+    """
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    result = {f"p{p}": ordered[max(0, -(-p * len(ordered) // 100) - 1)] * 1000 for p in points}
+    result["max"] = ordered[-1] * 1000
+    return result
+
+
+def summarize(latencies: Sequence[float], errors: int, elapsed: float) -> Dict:
+    """
+    Summarize a set of timed requests.
+
+    Args:
+        latencies (Sequence[float]): Latencies of all requests in seconds.
+        errors (int): Number of failed requests among them.
+        elapsed (float): Wall-clock duration of the run in seconds.
+
+    Returns:
+        Dict: 'requests', 'errors', 'rps' and latency percentiles in milliseconds.
+    """
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        **percentiles(latencies),
+    }
+
+
+def _timed(name: str, fn: Callable[[], int], phases: Dict[str, Dict]) -> None:
+    started = time.perf_counter()
+    records = fn()
+    seconds = time.perf_counter() - started
+    phases[name] = {"records": records, "seconds": seconds, "records_per_s": records / seconds if seconds else 0.0}
+
+
+def run_ingest_load(db: Session, stub: StubServer, start_year: int = 2006, speech_pages: Optional[int] = None) -> Dict:
+    """
+    Crawl the stub server and store everything, timing each ingestion phase.
+
+    Args:
+        db (Session): Session on the database under test (tables must exist).
+        stub (StubServer): Running stub server; the fetchers are pointed at it.
+        start_year (int): Year to start fetching from.
+        speech_pages (Optional[int]): Stop the Hansard crawl after this many pages (None for all).
+
+    Returns:
+        Dict: 'phases' (records, seconds and records/s per phase), total 'seconds', and 'upstream'
+        (request summary per route, with 5xx responses as errors and 429s as 'throttled').
+    """
+    from api.data_fetching.hansard import iter_speeches
+    from api.data_fetching.house_of_commons import fetch_bills, fetch_votes
+    from api.data_fetching.politicians import fetch_politicians
+    from api.data_processing.bill_text import ingest_bill_texts
+    from api.data_processing.entities import EntityIndex
+    from api.data_processing.hansard import categorize_paragraphs, ingest_hansard
+    from api.data_processing.ingest import ingest_bills, ingest_politicians, ingest_votes
+
+    upstream.configure(stub.url)
+    stub.requests.clear()
+    phases: Dict[str, Dict] = {}
+    started = time.perf_counter()
+    index = EntityIndex.load(db)
+    state = {}
+
+    def politicians() -> int:
+        count = len(ingest_politicians(db, fetch_politicians(start_year), index))
+        db.commit()
+        return count
+
+    def bills() -> int:
+        state["bills"] = ingest_bills(db, fetch_bills(start_year), index=index)
+        db.commit()
+        return len(state["bills"])
+
+    def votes() -> int:
+        count = len(ingest_votes(db, fetch_votes(), index))
+        db.commit()
+        return count
+
+    _timed("politicians", politicians, phases)
+    _timed("bills", bills, phases)
+    _timed("votes", votes, phases)
+    _timed("bill_texts", lambda: ingest_bill_texts(db, state["bills"]), phases)
+    _timed("hansard", lambda: ingest_hansard(db, iter_speeches(max_pages=speech_pages), index=index)["stored"], phases)
+    _timed("categorization", lambda: categorize_paragraphs(db), phases)
+    elapsed = time.perf_counter() - started
+
+    by_route: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+    for route, status, seconds in list(stub.requests):
+        by_route[route].append((status, seconds))
+    upstream_summary = {
+        route: {
+            # 404s are expected (e.g., probes for bill versions not published yet)
+            **summarize([s for _, s in calls], sum(1 for status, _ in calls if status >= 500), elapsed),
+            "throttled": sum(1 for status, _ in calls if status == 429),
+        }
+        for route, calls in sorted(by_route.items())
+    }
+    return {"phases": phases, "seconds": elapsed, "upstream": upstream_summary}
+
+
+def run_api_load(
+    base_url: str,
+    mix: Sequence[Tuple[int, str]] = DEFAULT_MIX,
+    concurrency: int = 16,
+    total: int = 2000,
+    max_id: int = 100,
+    seed: int = 0,
+) -> Dict[str, Dict]:
+    """
+    Send a weighted mix of requests to a running API server from concurrent clients.
+
+    Args:
+        base_url (str): Root URL of the API (e.g., 'http://127.0.0.1:8000').
+        mix (Sequence[Tuple[int, str]]): (weight, path template) pairs; {id} is replaced by 1..max_id.
+        concurrency (int): Concurrent clients, each with its own connection pool.
+        total (int): Requests sent in all.
+        max_id (int): Largest ID substituted into path templates.
+        seed (int): Random seed of the request sequence.
+
+    Returns:
+        Dict[str, Dict]: Summary per path template, plus 'all'. Responses with status >= 500
+        or connection errors count as errors.
+    """
+    rng = random.Random(seed)
+    weights, templates = zip(*mix)
+    plan = [(t, t.replace("{id}", str(rng.randint(1, max_id)))) for t in rng.choices(templates, weights, k=total)]
+    results: Dict[str, List[Tuple[float, bool]]] = defaultdict(list)
+    lock = threading.Lock()
+    local = threading.local()
+
+    def send(item: Tuple[str, str]) -> None:
+        template, path = item
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        started = time.perf_counter()
+        try:
+            failed = session.get(f"{base_url.rstrip('/')}{path}", timeout=30).status_code >= 500
+        except requests.RequestException:
+            failed = True
+        with lock:
+            results[template].append((time.perf_counter() - started, failed))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(send, plan))
+    elapsed = time.perf_counter() - started
+
+    report = {
+        template: summarize([s for s, _ in calls], sum(failed for _, failed in calls), elapsed)
+        for template, calls in sorted(results.items())
+    }
+    every = [call for calls in results.values() for call in calls]
+    report["all"] = summarize([s for s, _ in every], sum(failed for _, failed in every), elapsed)
+    return report
+
+
+def print_report(title: str, rows: Dict[str, Dict]) -> None:
+    """
+    Print summaries as a table.
+    """
+    print(title)
+    for name, row in rows.items():
+        fields = "  ".join(
+            f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}" for key, value in row.items()
+        )
+        print(f"  {name:<32} {fields}")
+
+
+def main() -> None:
+    """
+    Command-line entry point: run the ingest or API load scenario.
+    """
+    parser = argparse.ArgumentParser(description="Offline load tests of ingestion and the API.")
+    sub = parser.add_subparsers(dest="scenario", required=True)
+
+    ingest = sub.add_parser("ingest", help="Crawl the stub server into a database")
+    ingest.add_argument("--database-url", default="sqlite:///data/loadtest.db", help="Database under test")
+    ingest.add_argument("--fixtures", help="Fixture JSON file (default: generated fixtures)")
+    ingest.add_argument("--politicians", type=int, default=338)
+    ingest.add_argument("--bills", type=int, default=50)
+    ingest.add_argument("--speeches", type=int, default=2000)
+    ingest.add_argument("--speech-pages", type=int, default=None)
+    ingest.add_argument("--latency", type=float, default=0.0)
+    ingest.add_argument("--jitter", type=float, default=0.0)
+    ingest.add_argument("--throttle-rate", type=float, default=0.0)
+    ingest.add_argument("--retry-after", type=int, default=1)
+    ingest.add_argument("--failure-rate", type=float, default=0.0)
+
+    api = sub.add_parser("api", help="Drive a running API server")
+    api.add_argument("--target", default="http://127.0.0.1:8000")
+    api.add_argument("--concurrency", type=int, default=16)
+    api.add_argument("--requests", type=int, default=2000)
+    api.add_argument("--max-id", type=int, default=100)
+    args = parser.parse_args()
+
+    if args.scenario == "api":
+        print_report(f"API load against {args.target}", run_api_load(
+            args.target, concurrency=args.concurrency, total=args.requests, max_id=args.max_id
+        ))
+        return
+
+    fixtures = load_fixtures(args.fixtures) if args.fixtures else generate_fixtures(
+        args.politicians, args.bills, args.speeches
+    )
+    faults = FaultProfile(args.latency, args.jitter, args.throttle_rate, args.retry_after, args.failure_rate)
+    engine = create_engine(args.database_url)
+    if engine.dialect.name == "sqlite":
+        # Scratch database; PostgreSQL targets are created with `alembic upgrade head`
+        if engine.url.database:
+            os.makedirs(os.path.dirname(engine.url.database) or ".", exist_ok=True)
+        import api.models  # noqa: F401  (registers every model on Base.metadata)
+        from api.models.database import Base
+
+        Base.metadata.create_all(bind=engine)
+    with StubServer(fixtures, faults) as stub, sessionmaker(bind=engine)() as db:
+        report = run_ingest_load(db, stub, speech_pages=args.speech_pages)
+    print_report(f"Ingestion phases ({report['seconds']:.1f} s)", report["phases"])
+    print_report("Upstream requests", report["upstream"])
+
+
+if __name__ == "__main__":
+    main()
+
+# Example usage (from backend/):
+#     python -m loadtest.harness ingest --bills 100 --latency 0.05 --jitter 0.05 --throttle-rate 0.02
+#     python -m loadtest.harness api --target http://127.0.0.1:8000 --concurrency 32 --requests 10000
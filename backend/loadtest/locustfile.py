@@ -0,0 +1,49 @@
+# backend/loadtest/locustfile.py
+"""
+Locust scenario for the API, with the same endpoint mix as `harness.py api`, for distributed or
+ramped load (Locust is not a runtime dependency: pip install locust).
+
+    locust -f loadtest/locustfile.py --host http://127.0.0.1:8000 --headless -u 100 -r 10 -t 2m
+"""
+
+import os
+import random
+
+from locust import HttpUser, between, task
+
+MAX_ID = int(os.getenv("LOADTEST_MAX_ID", "100"))
+
+
+class ApiUser(HttpUser):
+    """
+    A client browsing lists, bill pages, scorecards and drift charts.
+    """
+    wait_time = between(0.1, 0.5)
+
+    @task(4)
+    def politicians(self):
+        self.client.get("/politicians?limit=100")
+
+    @task(4)
+    def bills(self):
+        self.client.get("/bills?limit=100")
+
+    @task(2)
+    def votes(self):
+        self.client.get("/votes?limit=1000")
+
+    @task(6)
+    def bill_page(self):
+        self.client.get(f"/bills/{random.randint(1, MAX_ID)}/page", name="/bills/{id}/page")
+
+    @task(3)
+    def scorecard(self):
+        path = f"/politicians/{random.randint(1, MAX_ID)}/scorecard"
+        with self.client.get(path, name="/politicians/{id}/scorecard", catch_response=True) as response:
+            # Politicians without a refreshed scorecard are expected 404s, not failures
+            if response.status_code == 404:
+                response.success()
+
+    @task(1)
+    def drift(self):
+        self.client.get(f"/parties/{random.randint(1, 6)}/drift", name="/parties/{id}/drift")
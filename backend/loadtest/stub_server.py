@@ -0,0 +1,278 @@
+# backend/loadtest/stub_server.py
+"""
+Offline stand-in for Open Parliament, parl.ca and the Wayback Machine, replaying fixtures
+(loadtest/fixtures.py) with injectable latency, throttling (429 with Retry-After) and failures.
+
+One server serves every upstream; point the fetchers at it with `upstream.configure(server.url)`
+or by setting OPENPARLIAMENT_API_ROOT=<url>/api, PARL_ROOT=<url> and WAYBACK_ROOT=<url>/web:
+    GET  /api/politicians/, /api/bills/, /api/votes/  whole list, or a page when limit/offset are given
+    GET  /api/speeches/                              pages of `limit` (default 20) with pagination.next_url
+    HEAD, GET /Content/Bills/...                     bill XML publications
+    GET  /web/<year>*/<url>                          archived party platform pages
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlencode
+
+# Page size of paginated endpoints when the client sends no limit (as on Open Parliament)
+DEFAULT_PAGE_SIZE = 20
+
+
+class FaultProfile:
+    """
+    Upstream misbehaviour injected into every response.
+
+    Attributes:
+        latency (float): Seconds added before every response.
+        jitter (float): Extra random delay, up to this many seconds.
+        throttle_rate (float): Share of requests answered with 429 Too Many Requests.
+        retry_after (int): Retry-After seconds sent with 429 responses.
+        failure_rate (float): Share of requests answered with `failure_status`.
+        failure_status (int): Status of injected failures (500 is not retried by the fetchers, 503 is).
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        failure_rate: float = 0.0,
+        failure_status: int = 500,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self) -> Tuple[float, Optional[int]]:
+        """
+        Draw the delay and injected status (None for a normal response) of one request.
+        """
+        with self._lock:
+            delay = self.latency + self._rng.uniform(0, self.jitter) if self.jitter else self.latency
+            roll = self._rng.random()
+        if roll < self.throttle_rate:
+            return delay, 429
+        if roll < self.throttle_rate + self.failure_rate:
+            return delay, self.failure_status
+        return delay, None
+
+
+class StubServer:
+    """
+    Threaded HTTP server replaying a fixture document.
+
+    Attributes:
+        fixtures (Dict): Fixture document (see loadtest/fixtures.py).
+        faults (FaultProfile): Injected latency, throttling and failures.
+        requests (List[Tuple[str, int, float]]): (route, status, seconds) of every request served.
+    """
+
+    def __init__(self, fixtures: Dict, faults: Optional[FaultProfile] = None, host: str = "127.0.0.1", port: int = 0):
+        self.fixtures = fixtures
+        self.faults = faults or FaultProfile()
+        self.requests: List[Tuple[str, int, float]] = []
+        self._requests_lock = threading.Lock()
+        handler = type("StubHandler", (_StubHandler,), {"stub": self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        Root URL of the server (e.g., 'http://127.0.0.1:8765').
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        """
+        Serve in a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and close the socket.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        """
+        Serve in the current thread until interrupted.
+        """
+        self._server.serve_forever()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def record(self, route: str, status: int, seconds: float) -> None:
+        """
+        Record a served request (called from the handler threads).
+        """
+        with self._requests_lock:
+            self.requests.append((route, status, seconds))
+
+    def respond(self, method: str, path: str, query: Dict[str, str]) -> Tuple[str, int, Dict[str, str], bytes]:
+        """
+        Build the fixture response of a request (without injected faults).
+
+        Args:
+            method (str): 'GET' or 'HEAD'.
+            path (str): Unquoted request path.
+            query (Dict[str, str]): Query parameters.
+
+        Returns:
+            Tuple[str, int, Dict[str, str], bytes]: Route name, status, headers and body.
+        """
+        if path.startswith("/api/"):
+            resource = path[len("/api/"):].strip("/")
+            objects = self.fixtures.get(resource)
+            if objects is None or resource not in ("politicians", "bills", "votes", "speeches"):
+                return "api", 404, {}, b""
+            objects = _filter(resource, objects, query)
+            if resource == "speeches" or "limit" in query or "offset" in query:
+                body = _page(resource, objects, query)
+            else:
+                # The politicians/bills/votes fetchers read these endpoints as one list
+                body = objects
+            return resource, 200, {"Content-Type": "application/json"}, json.dumps(body).encode("utf-8")
+
+        if path.startswith("/Content/"):
+            document = self.fixtures.get("publications", {}).get(path)
+            if document is None:
+                return "publications", 404, {}, b""
+            return "publications", 200, {"Content-Type": "application/xml"}, document.encode("utf-8")
+
+        if path.startswith("/web/"):
+            page = self.fixtures.get("platforms", {}).get(path)
+            if page is None:
+                return "platforms", 404, {}, b""
+            return "platforms", 200, {"Content-Type": "text/html; charset=utf-8"}, page.encode("utf-8")
+
+        return "unknown", 404, {}, b""
+
+
+def _filter(resource: str, objects: List[Dict], query: Dict[str, str]) -> List[Dict]:
+    if resource == "bills" and "introduced_date__gte" in query:
+        return [o for o in objects if (o.get("introduced_date") or "") >= query["introduced_date__gte"]]
+    if resource == "votes" and "bill" in query:
+        return [o for o in objects if o.get("bill_url") == query["bill"]]
+    if resource == "speeches" and "time__gte" in query:
+        return [o for o in objects if (o.get("time") or "") >= query["time__gte"]]
+    return objects
+
+
+def _page(resource: str, objects: List[Dict], query: Dict[str, str]) -> Dict:
+    limit = int(query.get("limit", DEFAULT_PAGE_SIZE))
+    offset = int(query.get("offset", 0))
+
+    def link(new_offset: int) -> str:
+        # Relative to the API root, carrying the filters, as on Open Parliament
+        return f"/{resource}/?{urlencode({**query, 'limit': limit, 'offset': new_offset})}"
+
+    return {
+        "objects": objects[offset:offset + limit],
+        "pagination": {
+            "offset": offset,
+            "limit": limit,
+            "next_url": link(offset + limit) if offset + limit < len(objects) else None,
+            "previous_url": link(max(0, offset - limit)) if offset else None,
+        },
+    }
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    stub: StubServer
+    protocol_version = "HTTP/1.1"
+
+    def _serve(self, method: str) -> None:
+        started = time.perf_counter()
+        raw_path, _, raw_query = self.path.partition("?")
+        query = {key: values[-1] for key, values in parse_qs(raw_query).items()}
+        route, status, headers, body = self.stub.respond(method, unquote(raw_path), query)
+
+        delay, injected = self.stub.faults.draw()
+        if delay:
+            time.sleep(delay)
+        if injected is not None:
+            status, body = injected, b""
+            headers = {"Retry-After": str(self.stub.faults.retry_after)} if injected == 429 else {}
+
+        # Record before responding: a client may inspect `requests` as soon as it reads the response
+        self.stub.record(route, status, time.perf_counter() - started)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if method == "GET":
+            self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._serve("GET")
+
+    def do_HEAD(self) -> None:
+        self._serve("HEAD")
+
+    def log_message(self, format, *args) -> None:
+        # Per-request logging would dominate the cost of a load test
+        pass
+
+
+def main() -> None:
+    """
+    Command-line entry point: run the stub server in the foreground.
+    """
+    from loadtest.fixtures import generate_fixtures, load_fixtures
+
+    parser = argparse.ArgumentParser(description="Serve recorded or generated upstream fixtures.")
+    parser.add_argument("--fixtures", help="Fixture JSON file (default: generated fixtures)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay, up to this many seconds")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds of 429 responses")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests that fail")
+    parser.add_argument("--failure-status", type=int, default=500)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures) if args.fixtures else generate_fixtures()
+    faults = FaultProfile(
+        args.latency, args.jitter, args.throttle_rate, args.retry_after, args.failure_rate, args.failure_status
+    )
+    server = StubServer(fixtures, faults, args.host, args.port)
+    print(f"Serving fixtures at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
+
+# Example usage (from backend/):
+#     python -m loadtest.stub_server --fixtures data/fixtures.json --latency 0.05 --throttle-rate 0.02
+#     OPENPARLIAMENT_API_ROOT=http://127.0.0.1:8765/api PARL_ROOT=http://127.0.0.1:8765 \
+#         WAYBACK_ROOT=http://127.0.0.1:8765/web uvicorn api.main:app
@@ -0,0 +1,56 @@
+# backend/migrations/env.py
+"""
+Alembic environment: runs migrations against DATABASE_URL using the shared model metadata.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+import api.models  # noqa: F401  (registers every model on Base.metadata)
+from api.models.database import Base, engine
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """
+    Hide votes partitions (votes_p39, ..., votes_default) from autogenerate; only the parent is modelled.
+    """
+    table = obj if type_ == "table" else getattr(obj, "table", None)
+    table_name = getattr(table, "name", "") or ""
+    return not (reflected and compare_to is None and table_name.startswith("votes_"))
+
+
+def run_migrations_offline() -> None:
+    """
+    Emit migration SQL without a database connection (`alembic upgrade head --sql`).
+    """
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    Apply migrations over a connection from the application engine.
+    """
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,191 @@
+"""Initial schema with the votes table range-partitioned by Parliament
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Votes partitions: Parliament number -> [first sitting day, first day of the next Parliament).
+# A new Parliament is added by a migration that detaches the open-ended partition, re-attaches it
+# with an upper bound and creates the next one.
+VOTE_PARTITIONS = [
+    (39, "2006-04-03", "2008-11-18"),
+    (40, "2008-11-18", "2011-06-02"),
+    (41, "2011-06-02", "2015-12-03"),
+    (42, "2015-12-03", "2019-12-05"),
+    (43, "2019-12-05", "2021-11-22"),
+    (44, "2021-11-22", "2025-05-26"),
+    (45, "2025-05-26", None),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "parties",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False, unique=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_parties_id", "parties", ["id"])
+
+    op.create_table(
+        "politicians",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("url", sa.String(), nullable=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("party_id", sa.Integer(), sa.ForeignKey("parties.id"), nullable=False),
+        sa.Column("position", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_politicians_id", "politicians", ["id"])
+    op.create_index("ix_politicians_url", "politicians", ["url"], unique=True)
+
+    op.create_table(
+        "bills",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("url", sa.String(), nullable=True),
+        sa.Column("number", sa.String(), nullable=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("introduced_by", sa.Integer(), sa.ForeignKey("politicians.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_bills_id", "bills", ["id"])
+    op.create_index("ix_bills_url", "bills", ["url"], unique=True)
+
+    op.create_table(
+        "platform_categories",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("party_id", sa.Integer(), sa.ForeignKey("parties.id"), nullable=False),
+        sa.Column("election_year", sa.Integer(), nullable=False),
+        sa.Column("category", sa.String(), nullable=False),
+        sa.Column("stance", sa.String(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_platform_categories_id", "platform_categories", ["id"])
+    op.create_index(
+        "ix_platform_categories_party_id_election_year", "platform_categories", ["party_id", "election_year"]
+    )
+
+    # Partitioning requires the partition key in the primary key; ids stay unique via the sequence
+    op.execute("""
+        CREATE TABLE votes (
+            id SERIAL NOT NULL,
+            url VARCHAR,
+            politician_id INTEGER NOT NULL REFERENCES politicians (id),
+            bill_id INTEGER NOT NULL REFERENCES bills (id),
+            vote VARCHAR NOT NULL,
+            date DATE NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE,
+            PRIMARY KEY (id, date)
+        ) PARTITION BY RANGE (date)
+    """)
+    for parliament, start, end in VOTE_PARTITIONS:
+        upper = f"'{end}'" if end else "MAXVALUE"
+        op.execute(f"CREATE TABLE votes_p{parliament} PARTITION OF votes FOR VALUES FROM ('{start}') TO ({upper})")
+    op.execute("CREATE TABLE votes_default PARTITION OF votes DEFAULT")
+
+    # Indexes on the partitioned table are created on every partition
+    op.create_index("ix_votes_id", "votes", ["id"])
+    op.create_index("ix_votes_url", "votes", ["url"])
+    op.create_index("ix_votes_politician_id_date", "votes", ["politician_id", "date"])
+    op.create_index("ix_votes_bill_id_politician_id", "votes", ["bill_id", "politician_id"])
+    op.create_index("ix_votes_created_at_brin", "votes", ["created_at"], postgresql_using="brin")
+
+    op.create_table(
+        "translation_memory",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("source_hash", sa.String(64), nullable=False),
+        sa.Column("source_lang", sa.String(2), nullable=False),
+        sa.Column("target_lang", sa.String(2), nullable=False),
+        sa.Column("source_text", sa.Text(), nullable=False),
+        sa.Column("translated_text", sa.Text(), nullable=False),
+        sa.Column("model_name", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_translation_memory_id", "translation_memory", ["id"])
+    op.create_index("ix_translation_memory_source_hash", "translation_memory", ["source_hash"], unique=True)
+
+    op.create_table(
+        "policy_explanations",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("politician_id", sa.Integer(), sa.ForeignKey("politicians.id"), nullable=False),
+        sa.Column("category", sa.String(), nullable=False),
+        sa.Column("election_year", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("is_current", sa.Boolean(), nullable=False),
+        sa.Column("inputs_hash", sa.String(64), nullable=False),
+        sa.Column("aligned_count", sa.Integer(), nullable=False),
+        sa.Column("conflicting_count", sa.Integer(), nullable=False),
+        sa.Column("explanation", sa.Text(), nullable=False),
+        sa.Column("citations", sa.JSON(), nullable=False),
+        sa.Column("generator", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("politician_id", "category", "election_year", "version"),
+    )
+    op.create_index("ix_policy_explanations_id", "policy_explanations", ["id"])
+    op.create_index("ix_policy_explanations_current", "policy_explanations", ["politician_id", "is_current"])
+
+    op.create_table(
+        "politician_scorecards",
+        sa.Column("politician_id", sa.Integer(), sa.ForeignKey("politicians.id"), primary_key=True),
+        sa.Column("politician_name", sa.String(), nullable=False),
+        sa.Column("position", sa.String(), nullable=False),
+        sa.Column("party_id", sa.Integer(), sa.ForeignKey("parties.id"), nullable=False),
+        sa.Column("party_name", sa.String(), nullable=False),
+        sa.Column("votes_cast", sa.Integer(), nullable=False),
+        sa.Column("aligned_votes", sa.Integer(), nullable=False),
+        sa.Column("conflicting_votes", sa.Integer(), nullable=False),
+        sa.Column("integrity_score", sa.Float(), nullable=True),
+        sa.Column("categories", sa.JSON(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_politician_scorecards_party_id", "politician_scorecards", ["party_id"])
+
+    op.create_table(
+        "party_cohesion",
+        sa.Column("party_id", sa.Integer(), sa.ForeignKey("parties.id"), primary_key=True),
+        sa.Column("year", sa.Integer(), primary_key=True),
+        sa.Column("party_name", sa.String(), nullable=False),
+        sa.Column("bills_voted", sa.Integer(), nullable=False),
+        sa.Column("member_count", sa.Integer(), nullable=False),
+        sa.Column("cohesion", sa.Float(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=True),
+    )
+
+    op.create_table(
+        "category_comparisons",
+        sa.Column("category", sa.String(), primary_key=True),
+        sa.Column("party_id", sa.Integer(), sa.ForeignKey("parties.id"), primary_key=True),
+        sa.Column("election_year", sa.Integer(), primary_key=True),
+        sa.Column("party_name", sa.String(), nullable=False),
+        sa.Column("stance", sa.String(), nullable=False),
+        sa.Column("aligned_votes", sa.Integer(), nullable=False),
+        sa.Column("conflicting_votes", sa.Integer(), nullable=False),
+        sa.Column("alignment_rate", sa.Float(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("category_comparisons")
+    op.drop_table("party_cohesion")
+    op.drop_table("politician_scorecards")
+    op.drop_table("policy_explanations")
+    op.drop_table("translation_memory")
+    op.execute("DROP TABLE votes")  # drops every partition
+    op.drop_table("platform_categories")
+    op.drop_table("bills")
+    op.drop_table("politicians")
+    op.drop_table("parties")
@@ -0,0 +1,47 @@
+"""Analytics read models published from Parquet snapshots
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "parliament_cohesion",
+        sa.Column("party_id", sa.Integer(), sa.ForeignKey("parties.id"), primary_key=True),
+        sa.Column("parliament", sa.Integer(), primary_key=True),
+        sa.Column("party_name", sa.String(), nullable=False),
+        sa.Column("bills_voted", sa.Integer(), nullable=False),
+        sa.Column("member_count", sa.Integer(), nullable=False),
+        sa.Column("votes_cast", sa.Integer(), nullable=False),
+        sa.Column("cohesion", sa.Float(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=True),
+    )
+
+    op.create_table(
+        "platform_stance_history",
+        sa.Column("party_id", sa.Integer(), sa.ForeignKey("parties.id"), primary_key=True),
+        sa.Column("category", sa.String(), primary_key=True),
+        sa.Column("election_year", sa.Integer(), primary_key=True),
+        sa.Column("party_name", sa.String(), nullable=False),
+        sa.Column("stance", sa.String(), nullable=False),
+        sa.Column("previous_election_year", sa.Integer(), nullable=True),
+        sa.Column("previous_stance", sa.String(), nullable=True),
+        sa.Column("changed", sa.Boolean(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("platform_stance_history")
+    op.drop_table("parliament_cohesion")
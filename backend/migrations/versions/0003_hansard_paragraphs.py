@@ -0,0 +1,50 @@
+"""Hansard paragraphs stored compressed and deduplicated by content hash
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "hansard_paragraphs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("politician_id", sa.Integer(), sa.ForeignKey("politicians.id"), nullable=True),
+        sa.Column("speech_url", sa.String(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("spoken_on", sa.Date(), nullable=False),
+        sa.Column("language", sa.String(2), nullable=False),
+        sa.Column("heading", sa.String(), nullable=True),
+        sa.Column("text_compressed", sa.LargeBinary(), nullable=False),
+        sa.Column("categories", sa.JSON(), nullable=True),
+        sa.Column("categorized_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_hansard_paragraphs_content_hash", "hansard_paragraphs", ["content_hash"], unique=True)
+    op.create_index(
+        "ix_hansard_paragraphs_politician_id_spoken_on", "hansard_paragraphs", ["politician_id", "spoken_on"]
+    )
+    op.create_index("ix_hansard_paragraphs_spoken_on", "hansard_paragraphs", ["spoken_on"])
+    op.create_index(
+        "ix_hansard_paragraphs_uncategorized",
+        "hansard_paragraphs",
+        ["id"],
+        postgresql_where=sa.text("categorized_at IS NULL"),
+    )
+    # Text is already zlib-compressed; skip PostgreSQL's own TOAST compression attempt
+    op.execute("ALTER TABLE hansard_paragraphs ALTER COLUMN text_compressed SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    op.drop_table("hansard_paragraphs")
@@ -0,0 +1,51 @@
+"""Bill text versions and sections with changes between readings
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bill_versions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("bill_id", sa.Integer(), sa.ForeignKey("bills.id"), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("stage", sa.String(), nullable=False),
+        sa.Column("source_url", sa.String(), nullable=False),
+        sa.Column("section_count", sa.Integer(), nullable=False),
+        sa.Column("removed_sections", sa.JSON(), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("bill_id", "version"),
+    )
+    op.create_index("ix_bill_versions_id", "bill_versions", ["id"])
+    op.create_index("ix_bill_versions_bill_id", "bill_versions", ["bill_id"])
+
+    op.create_table(
+        "bill_sections",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version_id", sa.Integer(), sa.ForeignKey("bill_versions.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("label", sa.String(), nullable=False),
+        sa.Column("heading", sa.String(), nullable=True),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("content_hash", sa.String(64), nullable=False),
+        sa.Column("change", sa.String(), nullable=False),
+        sa.Column("diff", sa.Text(), nullable=True),
+    )
+    op.create_index("ix_bill_sections_version_id_position", "bill_sections", ["version_id", "position"])
+
+
+def downgrade() -> None:
+    op.drop_table("bill_sections")
+    op.drop_table("bill_versions")
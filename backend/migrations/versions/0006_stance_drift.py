@@ -0,0 +1,35 @@
+"""Stance drift time series between consecutive elections
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stance_drift",
+        sa.Column("party_id", sa.Integer(), sa.ForeignKey("parties.id"), primary_key=True),
+        sa.Column("category", sa.String(), primary_key=True),
+        sa.Column("election_year", sa.Integer(), primary_key=True),
+        sa.Column("previous_election_year", sa.Integer(), nullable=True),
+        sa.Column("stance", sa.String(), nullable=False),
+        sa.Column("previous_stance", sa.String(), nullable=True),
+        sa.Column("label_change", sa.Float(), nullable=True),
+        sa.Column("text_distance", sa.Float(), nullable=True),
+        sa.Column("drift_score", sa.Float(), nullable=True),
+        sa.Column("computed_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stance_drift")
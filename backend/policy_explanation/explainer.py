@@ -0,0 +1,241 @@
+# backend/policy_explanation/explainer.py
+"""
+Generates plain-language explanations of why a politician's votes align or conflict with
+their party's platform stances, citing the bills and platform paragraphs involved.
+
+Explanations are generated in batch by each ingestion run (api/data_processing/ingest.py),
+never by an API worker, stored as numbered versions, and served from the database. A new
+version is only written when its inputs change, so re-running generation is cheap. The
+ingestion run then translates and voices the current versions.
+"""
+
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from api.data_processing.alignment import bill_categories, platform_year_for, vote_alignment
+from api.data_processing.bill_text import latest_bill_texts
+from api.models.bill import Bill
+from api.models.explanation import PolicyExplanation
+from api.models.party import Party, PlatformCategory
+from api.models.politician import Politician
+from api.models.vote import Vote
+from data_processing.utils import content_hash
+
+GENERATOR_NAME = "template-v1"
+
+# Politicians processed per batch, bounding the votes held in memory at once
+_BATCH_SIZE = 200
+
+# Maximum characters of platform text quoted in an explanation
+_EXCERPT_CHARS = 300
+
+
+def render_explanation(context: Dict) -> str:
+    """
+    Render the plain-language explanation for one politician, category and platform year.
+
+    Args:
+        context (Dict): 'politician', 'party', 'category', 'election_year', 'stance',
+            'excerpt', 'aligned' and 'conflicting' (lists of cited bill dicts).
+
+    Returns:
+        str: Explanation text.
+    """
+    aligned, conflicting = context["aligned"], context["conflicting"]
+    total = len(aligned) + len(conflicting)
+    lines = [
+        f"{context['politician']} voted in line with the {context['party']} {context['election_year']} "
+        f"platform on {len(aligned)} of {total} {context['category']} bills. "
+        f"The platform's stance on {context['category']} is {context['stance']}."
+    ]
+    if context["excerpt"]:
+        lines.append(f"The platform says: \"{context['excerpt']}\"")
+    for label, bills in (("Aligned", aligned), ("Conflicting", conflicting)):
+        if bills:
+            cited = "; ".join(f"voted {b['vote']} on {b['number'] or 'bill'} ({b['title']})" for b in bills)
+            lines.append(f"{label} votes: {cited}.")
+    return "\n".join(lines)
+
+
+def _excerpt(text: Optional[str]) -> str:
+    text = (text or "").strip()
+    if len(text) <= _EXCERPT_CHARS:
+        return text
+    return text[:_EXCERPT_CHARS].rsplit(" ", 1)[0] + "…"
+
+
+def _generate_batch(
+    db: Session,
+    politicians: List[Politician],
+    generator: Callable[[Dict], str],
+    generator_name: str,
+) -> int:
+    party_ids = {p.party_id for p in politicians}
+    party_names = dict(db.query(Party.id, Party.name).filter(Party.id.in_(party_ids)))
+
+    # platforms[party_id][election_year][category] -> PlatformCategory
+    platforms: Dict[int, Dict[int, Dict[str, PlatformCategory]]] = defaultdict(lambda: defaultdict(dict))
+    for pc in db.query(PlatformCategory).filter(PlatformCategory.party_id.in_(party_ids)):
+        platforms[pc.party_id][pc.election_year][pc.category] = pc
+    years = {party_id: sorted(by_year) for party_id, by_year in platforms.items()}
+
+    # groups[(politician_id, category, election_year)] -> cited votes
+    groups: Dict[tuple, List[Dict]] = defaultdict(list)
+    categories_by_bill: Dict[int, List[str]] = {}
+    party_of = {p.id: p.party_id for p in politicians}
+    rows = (
+        db.query(Vote.id, Vote.politician_id, Vote.vote, Vote.date, Bill.id, Bill.number, Bill.title, Bill.description)
+        .join(Bill, Vote.bill_id == Bill.id)
+        .filter(Vote.politician_id.in_(party_of))
+        .order_by(Vote.id)
+        .all()
+    )
+    full_texts = latest_bill_texts(db, {row[4] for row in rows})
+    for vote_id, politician_id, vote, voted_on, bill_id, number, title, description in rows:
+        year = platform_year_for(years.get(party_of[politician_id], []), voted_on.year)
+        if year is None:
+            continue
+        if bill_id not in categories_by_bill:
+            categories_by_bill[bill_id] = bill_categories(title, description, full_texts.get(bill_id))
+        for category in categories_by_bill[bill_id]:
+            stance = platforms[party_of[politician_id]][year].get(category)
+            aligned = vote_alignment(vote, stance.stance) if stance else None
+            if aligned is not None:
+                groups[(politician_id, category, year)].append({
+                    "vote_id": vote_id, "bill_id": bill_id, "number": number,
+                    "title": title, "vote": vote, "aligned": aligned,
+                })
+
+    current = {
+        (e.politician_id, e.category, e.election_year): e
+        for e in db.query(PolicyExplanation).filter(
+            PolicyExplanation.politician_id.in_(party_of), PolicyExplanation.is_current.is_(True)
+        )
+    }
+    names = {p.id: p.name for p in politicians}
+    written = 0
+
+    for (politician_id, category, year), cited in groups.items():
+        platform = platforms[party_of[politician_id]][year][category]
+        inputs_hash = content_hash(
+            generator_name, platform.stance, platform.text or "",
+            *(f"{c['vote_id']}:{c['vote']}:{c['title']}" for c in cited),
+        )
+        previous = current.get((politician_id, category, year))
+        if previous and previous.inputs_hash == inputs_hash:
+            continue
+
+        aligned = [c for c in cited if c["aligned"]]
+        conflicting = [c for c in cited if not c["aligned"]]
+        excerpt = _excerpt(platform.text)
+        text = generator({
+            "politician": names[politician_id],
+            "party": party_names.get(party_of[politician_id], "their party"),
+            "category": category,
+            "election_year": year,
+            "stance": platform.stance,
+            "excerpt": excerpt,
+            "aligned": aligned,
+            "conflicting": conflicting,
+        })
+
+        if previous:
+            previous.is_current = False
+        db.add(PolicyExplanation(
+            politician_id=politician_id,
+            category=category,
+            election_year=year,
+            version=previous.version + 1 if previous else 1,
+            is_current=True,
+            inputs_hash=inputs_hash,
+            aligned_count=len(aligned),
+            conflicting_count=len(conflicting),
+            explanation=text,
+            citations={
+                "bills": cited,
+                "platform": {"platform_category_id": platform.id, "election_year": year, "excerpt": excerpt},
+            },
+            generator=generator_name,
+        ))
+        written += 1
+
+    return written
+
+
+def generate_explanations(
+    db: Session,
+    politician_ids: Optional[Iterable[int]] = None,
+    generator: Callable[[Dict], str] = render_explanation,
+    generator_name: str = GENERATOR_NAME,
+) -> int:
+    """
+    Generate new explanation versions for politicians whose votes or party platform changed.
+
+    Args:
+        db (Session): Database session; each batch of politicians is committed.
+        politician_ids (Optional[Iterable[int]]): Politicians to process; all if None.
+        generator (Callable[[Dict], str]): Function turning a context dict into explanation text.
+        generator_name (str): Identifier of the generator, stored and part of the inputs hash.
+
+    Returns:
+        int: Number of explanation versions written.
+    """
+    query = db.query(Politician).order_by(Politician.id)
+    if politician_ids is not None:
+        query = query.filter(Politician.id.in_(list(politician_ids)))
+
+    written, last_id = 0, 0
+    while True:
+        batch = query.filter(Politician.id > last_id).limit(_BATCH_SIZE).all()
+        if not batch:
+            return written
+        written += _generate_batch(db, batch, generator, generator_name)
+        db.commit()
+        last_id = batch[-1].id
+
+
+def iter_current_explanations(db: Session, batch_size: int = _BATCH_SIZE) -> Iterator[List[PolicyExplanation]]:
+    """
+    Read the current explanation versions of every politician in batches (for translation and audio).
+
+    Args:
+        db (Session): Database session.
+        batch_size (int): Explanations per batch.
+
+    Yields:
+        List[PolicyExplanation]: Current versions ordered by ID.
+    """
+    last_id = 0
+    while True:
+        batch = (
+            db.query(PolicyExplanation)
+            .filter(PolicyExplanation.is_current.is_(True), PolicyExplanation.id > last_id)
+            .order_by(PolicyExplanation.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1].id
+
+
+def get_current_explanations(db: Session, politician_id: int) -> List[PolicyExplanation]:
+    """
+    Read the current explanations for a politician (a single indexed query, no generation).
+
+    Args:
+        db (Session): Database session.
+        politician_id (int): ID of the politician.
+
+    Returns:
+        List[PolicyExplanation]: Current versions ordered by election year and category.
+    """
+    return (
+        db.query(PolicyExplanation)
+        .filter(PolicyExplanation.politician_id == politician_id, PolicyExplanation.is_current.is_(True))
+        .order_by(PolicyExplanation.election_year.desc(), PolicyExplanation.category)
+        .all()
+    )
@@ -0,0 +1,76 @@
+# backend/sentiment_analysis/model.py
+"""
+Model definition for the political stance classifier.
+Wraps a BERT-family encoder with a sequence classification head over the stance labels.
+"""
+
+from typing import Dict, Tuple
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+# Stance labels predicted for a piece of platform or bill text within a category
+STANCE_LABELS = ["oppose", "neutral", "support"]
+
+# A distilled BERT keeps CPU training and inference fast; "bert-base-uncased" also works
+DEFAULT_BASE_MODEL = "distilbert-base-uncased"
+
+# Maximum number of tokens per training/inference example
+MAX_LENGTH = 256
+
+
+def label_maps() -> Tuple[Dict[int, str], Dict[str, int]]:
+    """
+    Build the id/label mappings stored in the model config.
+
+    Returns:
+        Tuple[Dict[int, str], Dict[str, int]]: (id2label, label2id) for STANCE_LABELS.
+    """
+    id2label = {i: label for i, label in enumerate(STANCE_LABELS)}
+    label2id = {label: i for i, label in id2label.items()}
+    return id2label, label2id
+
+
+def load_tokenizer(name_or_path: str = DEFAULT_BASE_MODEL):
+    """
+    Load the (fast) tokenizer for a base model or an exported stance model.
+
+    Args:
+        name_or_path (str): Hugging Face model name or local directory.
+
+    Returns:
+        PreTrainedTokenizerBase: The tokenizer.
+    """
+    return AutoTokenizer.from_pretrained(name_or_path, use_fast=True)
+
+
+def build_model(base_model: str = DEFAULT_BASE_MODEL):
+    """
+    Create a stance classifier from a pre-trained encoder with a fresh classification head.
+
+    Args:
+        base_model (str): Hugging Face model name (e.g., 'distilbert-base-uncased').
+
+    Returns:
+        PreTrainedModel: Sequence classification model with len(STANCE_LABELS) outputs.
+    """
+    id2label, label2id = label_maps()
+    return AutoModelForSequenceClassification.from_pretrained(
+        base_model,
+        num_labels=len(STANCE_LABELS),
+        id2label=id2label,
+        label2id=label2id,
+    )
+
+
+def load_model(model_dir: str):
+    """
+    Load a trained stance classifier (checkpoint or export) in evaluation mode.
+
+    Args:
+        model_dir (str): Directory written by `save_pretrained`.
+
+    Returns:
+        PreTrainedModel: The model, ready for inference.
+    """
+    model = AutoModelForSequenceClassification.from_pretrained(model_dir)
+    model.eval()
+    return model
@@ -0,0 +1,84 @@
+# backend/sentiment_analysis/predict.py
+"""
+Batched inference with the exported stance classifier produced by `train.py`.
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, List, Union
+
+import torch
+
+from data_processing.utils import length_bucketed_batches
+from .model import MAX_LENGTH, load_model, load_tokenizer
+
+DEFAULT_MODEL_DIR = os.getenv("STANCE_MODEL_DIR", "models/stance/export")
+
+
+class StancePredictor:
+    """
+    Serves stance predictions from an exported model, batching inputs of similar length.
+
+    Attributes:
+        model: Stance classifier in evaluation mode.
+        tokenizer: Tokenizer saved alongside the model.
+        batch_size (int): Maximum number of texts per forward pass.
+        max_length (int): Maximum number of tokens per text.
+    """
+
+    def __init__(self, model_dir: str = DEFAULT_MODEL_DIR, batch_size: int = 32, max_length: int = MAX_LENGTH):
+        self.model = load_model(model_dir)
+        self.tokenizer = load_tokenizer(model_dir)
+        self.batch_size = batch_size
+        self.max_length = max_length
+
+    def predict(self, texts: List[str]) -> List[Dict[str, Union[str, float]]]:
+        """
+        Predict the stance of each text.
+
+        Args:
+            texts (List[str]): Texts to classify.
+
+        Returns:
+            List[Dict[str, Union[str, float]]]: One {'label', 'score'} dict per text, in input order.
+        """
+        results: List[Dict[str, Union[str, float]]] = [{}] * len(texts)
+        # Approximate token counts by characters; good enough to keep padding low per batch
+        batches = length_bucketed_batches([len(t) for t in texts], self.batch_size)
+        id2label = self.model.config.id2label
+
+        with torch.inference_mode():
+            for batch in batches:
+                encoded = self.tokenizer(
+                    [texts[i] for i in batch],
+                    padding=True,
+                    truncation=True,
+                    max_length=self.max_length,
+                    return_tensors="pt",
+                )
+                probs = self.model(**encoded).logits.softmax(dim=-1)
+                scores, label_ids = probs.max(dim=-1)
+                for i, score, label_id in zip(batch, scores.tolist(), label_ids.tolist()):
+                    results[i] = {"label": id2label[label_id], "score": score}
+
+        return results
+
+
+@lru_cache(maxsize=1)
+def get_predictor(model_dir: str = DEFAULT_MODEL_DIR) -> StancePredictor:
+    """
+    Return the process-wide predictor, loading the model on first use.
+
+    Args:
+        model_dir (str): Directory of the exported model.
+
+    Returns:
+        StancePredictor: Shared predictor instance.
+    """
+    return StancePredictor(model_dir)
+
+
+# Example usage:
+# if __name__ == "__main__":
+#     predictor = get_predictor()
+#     print(predictor.predict(["We will cut the carbon tax.", "We support renewable energy."]))
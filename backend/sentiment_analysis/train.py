@@ -0,0 +1,285 @@
+# backend/sentiment_analysis/train.py
+"""
+Training pipeline for the political stance classifier.
+
+The labelled corpus (JSON lines with 'text' and 'label' fields, labels from STANCE_LABELS)
+is tokenized once and cached on disk as memory-mapped Arrow datasets keyed by the corpus
+contents, tokenizer and maximum length. Training uses dynamic padding with length-bucketed
+batches so CPU epochs spend little time on padding tokens, checkpoints after every epoch,
+resumes from the latest checkpoint, and exports the final model for `predict.py`.
+"""
+
+import argparse
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import torch
+from datasets import DatasetDict, load_dataset, load_from_disk
+from torch.utils.data import DataLoader, Sampler
+from transformers import DataCollatorWithPadding, get_linear_schedule_with_warmup
+
+from data_processing.utils import content_hash, length_bucketed_batches
+from .model import DEFAULT_BASE_MODEL, MAX_LENGTH, STANCE_LABELS, build_model, label_maps, load_tokenizer
+
+DEFAULT_CACHE_DIR = os.getenv("STANCE_DATASET_CACHE", "data/cache/stance_datasets")
+DEFAULT_OUTPUT_DIR = os.getenv("STANCE_MODEL_OUTPUT", "models/stance")
+
+
+def _file_sha256(path: Path) -> str:
+    """
+    Hash a file in chunks so large corpora are never read into memory at once.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tokenize_corpus(
+    corpus_path: str,
+    tokenizer,
+    tokenizer_name: str,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    max_length: int = MAX_LENGTH,
+    eval_fraction: float = 0.1,
+    seed: int = 42,
+) -> DatasetDict:
+    """
+    Tokenize the labelled corpus once and cache the train/eval split on disk.
+
+    Args:
+        corpus_path (str): Path to a JSON lines file with 'text' and 'label' fields.
+        tokenizer: Tokenizer used to encode the text (no padding is applied here).
+        tokenizer_name (str): Name or path of the tokenizer, part of the cache key.
+        cache_dir (str): Directory holding cached Arrow datasets.
+        max_length (int): Maximum number of tokens per example.
+        eval_fraction (float): Fraction of examples held out for evaluation.
+        seed (int): Seed for the train/eval split.
+
+    Returns:
+        DatasetDict: Memory-mapped 'train' and 'eval' splits with input ids, labels and lengths.
+    """
+    corpus = Path(corpus_path)
+    key = content_hash(_file_sha256(corpus), tokenizer_name, str(max_length), str(eval_fraction), str(seed))
+    target = Path(cache_dir) / key
+    if target.exists():
+        return load_from_disk(str(target))
+
+    _, label2id = label_maps()
+
+    def encode(batch: Dict[str, List]) -> Dict[str, List]:
+        encoded = tokenizer(batch["text"], truncation=True, max_length=max_length)
+        encoded["labels"] = [label2id[label] for label in batch["label"]]
+        encoded["length"] = [len(ids) for ids in encoded["input_ids"]]
+        return encoded
+
+    raw = load_dataset("json", data_files=str(corpus), split="train")
+    unknown = set(raw.unique("label")) - set(STANCE_LABELS)
+    if unknown:
+        raise ValueError(f"Unknown stance labels in corpus: {sorted(unknown)}")
+
+    tokenized = raw.map(encode, batched=True, remove_columns=raw.column_names)
+    split = tokenized.train_test_split(test_size=eval_fraction, seed=seed)
+    DatasetDict({"train": split["train"], "eval": split["test"]}).save_to_disk(str(target))
+    # Reload so training reads from the memory-mapped cache rather than in-memory tables
+    return load_from_disk(str(target))
+
+
+class LengthBucketSampler(Sampler):
+    """
+    Batch sampler yielding length-homogeneous batches, reshuffled every epoch.
+    """
+
+    def __init__(self, lengths: List[int], batch_size: int, shuffle: bool = True, seed: int = 42):
+        self.lengths = lengths
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        self.epoch = epoch
+
+    def _batches(self) -> List[List[int]]:
+        return length_bucketed_batches(self.lengths, self.batch_size, shuffle=self.shuffle, seed=self.seed + self.epoch)
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return iter(self._batches())
+
+    def __len__(self) -> int:
+        # Counted from the real batches: buckets may end in partial batches, and the LR schedule
+        # is sized from this
+        return len(self._batches())
+
+
+def _make_loader(dataset, tokenizer, batch_size: int, shuffle: bool, seed: int):
+    """
+    Build a DataLoader with dynamic padding over length-bucketed batches.
+    """
+    sampler = LengthBucketSampler(dataset["length"], batch_size, shuffle=shuffle, seed=seed)
+    columns = [c for c in dataset.column_names if c != "length"]
+    loader = DataLoader(
+        dataset.with_format(columns=columns),
+        batch_sampler=sampler,
+        collate_fn=DataCollatorWithPadding(tokenizer),
+    )
+    return loader, sampler
+
+
+def evaluate(model, loader) -> Dict[str, float]:
+    """
+    Compute loss and accuracy over an evaluation loader.
+
+    Args:
+        model: Stance classifier.
+        loader: DataLoader yielding padded batches with 'labels'.
+
+    Returns:
+        Dict[str, float]: 'loss' and 'accuracy'.
+    """
+    model.eval()
+    total_loss, correct, seen = 0.0, 0, 0
+    with torch.inference_mode():
+        for batch in loader:
+            outputs = model(**batch)
+            total_loss += outputs.loss.item() * len(batch["labels"])
+            correct += (outputs.logits.argmax(dim=-1) == batch["labels"]).sum().item()
+            seen += len(batch["labels"])
+    model.train()
+    if not seen:
+        return {"loss": 0.0, "accuracy": 0.0}
+    return {"loss": total_loss / seen, "accuracy": correct / seen}
+
+
+def _latest_checkpoint(checkpoint_dir: Path) -> Optional[Path]:
+    """
+    Return the most recent epoch checkpoint directory, if any.
+    """
+    if not checkpoint_dir.exists():
+        return None
+    checkpoints = [p for p in checkpoint_dir.glob("epoch-*") if (p / "trainer_state.pt").exists()]
+    return max(checkpoints, key=lambda p: int(p.name.split("-")[1]), default=None)
+
+
+def train(
+    corpus_path: str,
+    output_dir: str = DEFAULT_OUTPUT_DIR,
+    base_model: str = DEFAULT_BASE_MODEL,
+    epochs: int = 3,
+    batch_size: int = 16,
+    learning_rate: float = 5e-5,
+    max_length: int = MAX_LENGTH,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    seed: int = 42,
+    resume: bool = True,
+) -> Dict[str, float]:
+    """
+    Fine-tune the stance classifier on CPU and export it for `predict.py`.
+
+    Args:
+        corpus_path (str): JSON lines corpus with 'text' and 'label' fields.
+        output_dir (str): Directory for checkpoints ('checkpoints/') and the final model ('export/').
+        base_model (str): Pre-trained encoder to fine-tune.
+        epochs (int): Number of training epochs.
+        batch_size (int): Examples per batch.
+        learning_rate (float): Peak AdamW learning rate.
+        max_length (int): Maximum number of tokens per example.
+        cache_dir (str): Directory holding cached tokenized datasets.
+        seed (int): Seed for shuffling, the data split and head initialization.
+        resume (bool): Whether to continue from the latest checkpoint in `output_dir`.
+
+    Returns:
+        Dict[str, float]: Evaluation metrics of the exported model.
+    """
+    torch.manual_seed(seed)
+    torch.set_num_threads(os.cpu_count() or 1)
+
+    output = Path(output_dir)
+    checkpoint_dir = output / "checkpoints"
+    checkpoint = _latest_checkpoint(checkpoint_dir) if resume else None
+
+    tokenizer = load_tokenizer(base_model)
+    datasets = tokenize_corpus(corpus_path, tokenizer, base_model, cache_dir, max_length, seed=seed)
+    train_loader, train_sampler = _make_loader(datasets["train"], tokenizer, batch_size, True, seed)
+    eval_loader, _ = _make_loader(datasets["eval"], tokenizer, batch_size * 2, False, seed)
+
+    model = build_model(str(checkpoint) if checkpoint else base_model)
+    model.train()
+    optimizer = torch.optim.AdamW(model.parameters(), lr=learning_rate)
+    total_steps = len(train_loader) * epochs
+    scheduler = get_linear_schedule_with_warmup(optimizer, int(0.1 * total_steps), total_steps)
+
+    start_epoch = 0
+    if checkpoint:
+        state = torch.load(checkpoint / "trainer_state.pt")
+        optimizer.load_state_dict(state["optimizer"])
+        scheduler.load_state_dict(state["scheduler"])
+        start_epoch = state["epoch"] + 1
+        print(f"Resuming from {checkpoint}")
+
+    metrics = {}
+    for epoch in range(start_epoch, epochs):
+        train_sampler.set_epoch(epoch)
+        started = time.perf_counter()
+        for batch in train_loader:
+            loss = model(**batch).loss
+            loss.backward()
+            torch.nn.utils.clip_grad_norm_(model.parameters(), 1.0)
+            optimizer.step()
+            scheduler.step()
+            optimizer.zero_grad(set_to_none=True)
+
+        metrics = evaluate(model, eval_loader)
+        print(f"Epoch {epoch + 1}/{epochs}: {metrics} ({time.perf_counter() - started:.1f}s)")
+
+        epoch_dir = checkpoint_dir / f"epoch-{epoch}"
+        model.save_pretrained(epoch_dir)
+        torch.save(
+            {"epoch": epoch, "optimizer": optimizer.state_dict(), "scheduler": scheduler.state_dict()},
+            epoch_dir / "trainer_state.pt",
+        )
+
+    if not metrics:
+        metrics = evaluate(model, eval_loader)
+
+    export_dir = output / "export"
+    model.save_pretrained(export_dir, safe_serialization=True)
+    tokenizer.save_pretrained(export_dir)
+    return metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fine-tune the TrueNorthWatch stance classifier.")
+    parser.add_argument("corpus", help="JSON lines file with 'text' and 'label' fields")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--base-model", default=DEFAULT_BASE_MODEL)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--learning-rate", type=float, default=5e-5)
+    parser.add_argument("--max-length", type=int, default=MAX_LENGTH)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--no-resume", action="store_true")
+    args = parser.parse_args()
+
+    metrics = train(
+        args.corpus,
+        output_dir=args.output_dir,
+        base_model=args.base_model,
+        epochs=args.epochs,
+        batch_size=args.batch_size,
+        learning_rate=args.learning_rate,
+        max_length=args.max_length,
+        cache_dir=args.cache_dir,
+        resume=not args.no_resume,
+    )
+    print(f"Exported model to {Path(args.output_dir) / 'export'}: {metrics}")
+
+
+# Example usage (from backend/):
+#     python -m sentiment_analysis.train data/stance_corpus.jsonl --epochs 2
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+# backend/text_to_speech/tts.py
+"""
+Text-to-speech for bill summaries and stance explanations.
+
+Audio is synthesized on CPU with the MMS VITS models and stored in a content-addressed
+file cache: the file name is the hash of (text, voice, language), so a repeat request is
+a file read. Synthesis happens in a background queue fed at ingestion time, never on the
+request path.
+"""
+
+import os
+import re
+import wave
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from api.models.bill import Bill
+from api.models.explanation import PolicyExplanation
+from api.tasks import TaskQueue
+from data_processing.utils import content_hash
+from translation.translator import lookup_translations
+
+# Local VITS checkpoints for each supported language
+VOICE_MODELS = {
+    "en": "facebook/mms-tts-eng",
+    "fr": "facebook/mms-tts-fra",
+}
+DEFAULT_VOICE = "mms"
+
+AUDIO_CACHE_DIR = Path(os.getenv("AUDIO_CACHE_DIR", "data/audio"))
+
+# Characters per synthesis call; VITS quality degrades and memory grows on very long inputs
+_MAX_CHUNK_CHARS = 400
+
+_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+audio_queue = TaskQueue("tts")
+
+
+def audio_key(text: str, language: str, voice: str = DEFAULT_VOICE) -> str:
+    """
+    Compute the content address of the audio for a text.
+
+    Args:
+        text (str): Text to speak.
+        language (str): Language code ('en' or 'fr').
+        voice (str): Voice name.
+
+    Returns:
+        str: SHA-256 hex digest of text, voice and language.
+    """
+    return content_hash(text, voice, language)
+
+
+def audio_path(key: str, cache_dir: Optional[Path] = None) -> Path:
+    """
+    Map an audio key to its file in the cache, sharded by the first two hex digits.
+
+    Args:
+        key (str): Audio key from `audio_key`.
+        cache_dir (Optional[Path]): Cache root; defaults to AUDIO_CACHE_DIR.
+
+    Returns:
+        Path: Location of the WAV file (which may not exist yet).
+    """
+    if not _KEY_PATTERN.match(key):
+        raise ValueError(f"Invalid audio key: {key}")
+    return (cache_dir or AUDIO_CACHE_DIR) / key[:2] / f"{key}.wav"
+
+
+def _chunk_text(text: str) -> List[str]:
+    """
+    Split text at sentence boundaries into chunks of at most _MAX_CHUNK_CHARS characters.
+    """
+    chunks, current = [], ""
+    for sentence in re.split(r"(?<=[.!?;:])\s+", text.strip()):
+        if current and len(current) + len(sentence) + 1 > _MAX_CHUNK_CHARS:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class MmsSynthesizer:
+    """
+    CPU speech synthesizer for one language using a MMS VITS model.
+
+    Attributes:
+        sample_rate (int): Output sample rate in Hz.
+    """
+
+    def __init__(self, language: str):
+        # Imported here so API workers that only serve cached audio never load torch
+        from transformers import AutoTokenizer, VitsModel
+
+        self.tokenizer = AutoTokenizer.from_pretrained(VOICE_MODELS[language])
+        self.model = VitsModel.from_pretrained(VOICE_MODELS[language])
+        self.model.eval()
+        self.sample_rate = self.model.config.sampling_rate
+
+    def synthesize(self, text: str) -> Tuple[bytes, int]:
+        """
+        Synthesize speech for a text.
+
+        Args:
+            text (str): Text to speak.
+
+        Returns:
+            Tuple[bytes, int]: 16-bit mono PCM frames and the sample rate.
+        """
+        import torch
+
+        frames = []
+        with torch.inference_mode():
+            for chunk in _chunk_text(text):
+                inputs = self.tokenizer(chunk, return_tensors="pt")
+                waveform = self.model(**inputs).waveform[0]
+                frames.append((waveform.clamp(-1, 1) * 32767).to(torch.int16).numpy().tobytes())
+        return b"".join(frames), self.sample_rate
+
+
+@lru_cache(maxsize=None)
+def get_synthesizer(language: str) -> MmsSynthesizer:
+    """
+    Return the process-wide synthesizer for a language, loading it on first use.
+    """
+    return MmsSynthesizer(language)
+
+
+def synthesize_to_cache(
+    text: str,
+    language: str,
+    voice: str = DEFAULT_VOICE,
+    synthesizer=None,
+    cache_dir: Optional[Path] = None,
+) -> Path:
+    """
+    Return the cached audio for a text, synthesizing and storing it if missing.
+
+    Args:
+        text (str): Text to speak.
+        language (str): Language code ('en' or 'fr').
+        voice (str): Voice name, part of the cache key.
+        synthesizer: Object with `synthesize(text) -> (pcm_bytes, sample_rate)`;
+            defaults to the MMS model for the language.
+        cache_dir (Optional[Path]): Cache root; defaults to AUDIO_CACHE_DIR.
+
+    Returns:
+        Path: Path of the WAV file.
+    """
+    path = audio_path(audio_key(text, language, voice), cache_dir)
+    if path.exists():
+        return path
+
+    pcm, sample_rate = (synthesizer or get_synthesizer(language)).synthesize(text)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with wave.open(str(tmp_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    # Atomic rename: readers never see a partially written file
+    os.replace(tmp_path, path)
+    return path
+
+
+def enqueue_audio(text: str, language: str, voice: str = DEFAULT_VOICE) -> str:
+    """
+    Queue background synthesis of a text unless it is already cached or queued.
+
+    Args:
+        text (str): Text to speak.
+        language (str): Language code ('en' or 'fr').
+        voice (str): Voice name.
+
+    Returns:
+        str: Audio key under which the file will be available.
+    """
+    key = audio_key(text, language, voice)
+    if not audio_path(key).exists():
+        audio_queue.submit(key, synthesize_to_cache, text, language, voice)
+    return key
+
+
+def bill_audio_text(db: Session, bill: Bill, language: str) -> Optional[str]:
+    """
+    Build the text read aloud for a bill summary in a language.
+
+    Args:
+        db (Session): Database session (used to read French translations).
+        bill (Bill): The bill.
+        language (str): Language code ('en' or 'fr').
+
+    Returns:
+        Optional[str]: Text to speak, or None if the translation is not available yet.
+    """
+    if language == "en":
+        parts = [bill.title, bill.description]
+    else:
+        memory = lookup_translations(db, [bill.title, bill.description], "en", language)
+        if bill.title not in memory or bill.description not in memory:
+            return None
+        parts = [memory[bill.title], memory[bill.description]]
+    # An empty field (translated as "") is left out rather than read as a pause
+    return ". ".join(part for part in parts if part)
+
+
+def enqueue_bill_audio(db: Session, bills: Iterable[Bill], languages: Iterable[str] = tuple(VOICE_MODELS)) -> List[str]:
+    """
+    Pre-generate summary audio for newly ingested bills in the background.
+
+    Args:
+        db (Session): Database session.
+        bills (Iterable[Bill]): Bills to voice.
+        languages (Iterable[str]): Languages to synthesize.
+
+    Returns:
+        List[str]: Audio keys of the queued or already cached files.
+    """
+    keys = []
+    for bill in bills:
+        for language in languages:
+            text = bill_audio_text(db, bill, language)
+            if text:
+                keys.append(enqueue_audio(text, language))
+    return keys
+
+
+def explanation_audio_text(db: Session, explanation: PolicyExplanation, language: str) -> Optional[str]:
+    """
+    Build the text read aloud for a stance explanation in a language.
+
+    Args:
+        db (Session): Database session (used to read French translations).
+        explanation (PolicyExplanation): The explanation version.
+        language (str): Language code ('en' or 'fr').
+
+    Returns:
+        Optional[str]: Text to speak, or None if the translation is not available yet.
+    """
+    if language == "en":
+        return explanation.explanation
+    return lookup_translations(db, [explanation.explanation], "en", language).get(explanation.explanation)
+
+
+def enqueue_explanation_audio(
+    db: Session, explanations: Iterable[PolicyExplanation], languages: Iterable[str] = tuple(VOICE_MODELS)
+) -> List[str]:
+    """
+    Pre-generate audio for explanation versions in the background (after they are translated).
+
+    Args:
+        db (Session): Database session.
+        explanations (Iterable[PolicyExplanation]): Explanations to voice.
+        languages (Iterable[str]): Languages to synthesize.
+
+    Returns:
+        List[str]: Audio keys of the queued or already cached files.
+    """
+    keys = []
+    for explanation in explanations:
+        for language in languages:
+            text = explanation_audio_text(db, explanation, language)
+            if text:
+                keys.append(enqueue_audio(text, language))
+    return keys
@@ -0,0 +1,304 @@
+# backend/translation/translator.py
+"""
+English/French translation of bill and platform text backed by a persistent translation memory.
+
+Text is split into sentences; every sentence and every full field is stored in the
+`translation_memory` table keyed by a hash of (source language, target language, text), so
+nothing is translated twice. Translation runs at ingestion time with a local CPU MarianMT
+model, batching sentences of similar length; serving a translation is a single DB lookup.
+Empty fields need no translation and are always available as "".
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from api.models.bill import Bill
+from api.models.explanation import PolicyExplanation
+from api.models.party import PlatformCategory
+from api.models.translation import TranslationMemory
+from data_processing.utils import content_hash, length_bucketed_batches
+
+SUPPORTED_LANGUAGES = ("en", "fr")
+
+# Local MarianMT checkpoints for each translation direction
+MODEL_NAMES = {
+    ("en", "fr"): "Helsinki-NLP/opus-mt-en-fr",
+    ("fr", "en"): "Helsinki-NLP/opus-mt-fr-en",
+}
+
+# Keep IN (...) lists well below database parameter limits
+_LOOKUP_CHUNK_SIZE = 500
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+(?=[A-ZÀ-Ý0-9«\"(])")
+
+
+def split_segments(text: str) -> List[List[str]]:
+    """
+    Split text into paragraphs of sentences, the unit stored in translation memory.
+
+    Args:
+        text (str): Text to split.
+
+    Returns:
+        List[List[str]]: Sentences grouped by paragraph; empty paragraphs are dropped.
+    """
+    paragraphs = [p.strip() for p in re.split(r"\n+", text) if p.strip()]
+    return [[s.strip() for s in _SENTENCE_END.split(p) if s.strip()] for p in paragraphs]
+
+
+class MarianTranslator:
+    """
+    Local CPU translator for one language direction using a MarianMT model.
+
+    Attributes:
+        model_name (str): Hugging Face checkpoint used for this direction.
+        batch_size (int): Maximum number of sentences per forward pass.
+    """
+
+    def __init__(self, source_lang: str, target_lang: str, batch_size: int = 16):
+        # Imported here so API workers that only read translations never load torch
+        from transformers import MarianMTModel, MarianTokenizer
+
+        self.model_name = MODEL_NAMES[(source_lang, target_lang)]
+        self.tokenizer = MarianTokenizer.from_pretrained(self.model_name)
+        self.model = MarianMTModel.from_pretrained(self.model_name)
+        self.model.eval()
+        self.batch_size = batch_size
+
+    def translate(self, sentences: Sequence[str]) -> List[str]:
+        """
+        Translate sentences, batching those of similar length to limit padding.
+
+        Args:
+            sentences (Sequence[str]): Sentences in the source language.
+
+        Returns:
+            List[str]: Translations in input order.
+        """
+        import torch
+
+        translations = [""] * len(sentences)
+        batches = length_bucketed_batches([len(s) for s in sentences], self.batch_size)
+        with torch.inference_mode():
+            for batch in batches:
+                encoded = self.tokenizer(
+                    [sentences[i] for i in batch], return_tensors="pt", padding=True, truncation=True
+                )
+                generated = self.model.generate(**encoded, max_new_tokens=512)
+                decoded = self.tokenizer.batch_decode(generated, skip_special_tokens=True)
+                for i, text in zip(batch, decoded):
+                    translations[i] = text
+        return translations
+
+
+@lru_cache(maxsize=None)
+def get_translator(source_lang: str, target_lang: str) -> MarianTranslator:
+    """
+    Return the process-wide translator for a language direction, loading it on first use.
+    """
+    return MarianTranslator(source_lang, target_lang)
+
+
+def _check_direction(source_lang: str, target_lang: str) -> None:
+    if (source_lang, target_lang) not in MODEL_NAMES:
+        raise ValueError(f"Unsupported translation direction: {source_lang} -> {target_lang}")
+
+
+def lookup_translations(
+    db: Session, texts: Iterable[str], source_lang: str, target_lang: str
+) -> Dict[str, str]:
+    """
+    Fetch stored translations without ever calling the model.
+
+    Args:
+        db (Session): Database session.
+        texts (Iterable[str]): Source texts (sentences or full fields).
+        source_lang (str): Source language code.
+        target_lang (str): Target language code.
+
+    Returns:
+        Dict[str, str]: Mapping of source text to translation for every text found in memory
+        (empty texts map to "").
+    """
+    texts = set(texts)
+    by_hash = {content_hash(source_lang, target_lang, t): t for t in texts if t}
+    hashes = list(by_hash)
+    # Empty texts are trivially translated
+    found = {t: "" for t in texts if not t}
+    for start in range(0, len(hashes), _LOOKUP_CHUNK_SIZE):
+        rows = db.query(TranslationMemory.source_hash, TranslationMemory.translated_text).filter(
+            TranslationMemory.source_hash.in_(hashes[start:start + _LOOKUP_CHUNK_SIZE])
+        )
+        for source_hash, translated in rows:
+            found[by_hash[source_hash]] = translated
+    return found
+
+
+def translate_texts(
+    db: Session,
+    texts: Sequence[str],
+    source_lang: str = "en",
+    target_lang: str = "fr",
+    translator=None,
+) -> List[str]:
+    """
+    Translate texts through the translation memory, calling the model only for unseen sentences.
+
+    Args:
+        db (Session): Database session; new memory entries are added but not committed.
+        texts (Sequence[str]): Texts to translate (e.g., bill titles and descriptions).
+        source_lang (str): Source language code ('en' or 'fr').
+        target_lang (str): Target language code ('en' or 'fr').
+        translator: Object with a `translate(List[str]) -> List[str]` method and a `model_name`;
+            defaults to the local MarianMT model for the direction.
+
+    Returns:
+        List[str]: Translations in input order.
+    """
+    _check_direction(source_lang, target_lang)
+
+    memory = lookup_translations(db, texts, source_lang, target_lang)
+    pending_texts = [t for t in dict.fromkeys(texts) if t and t not in memory]
+    if not pending_texts:
+        return [memory.get(t, t) for t in texts]
+
+    segmented = {t: split_segments(t) for t in pending_texts}
+    sentences = list(dict.fromkeys(s for paragraphs in segmented.values() for p in paragraphs for s in p))
+    memory.update(lookup_translations(db, sentences, source_lang, target_lang))
+
+    missing = [s for s in sentences if s not in memory]
+    if translator is None and missing:
+        translator = get_translator(source_lang, target_lang)
+    model_name = getattr(translator, "model_name", MODEL_NAMES[(source_lang, target_lang)])
+
+    new_entries = {}
+    if missing:
+        new_entries.update(zip(missing, translator.translate(missing)))
+    memory.update(new_entries)
+
+    for text, paragraphs in segmented.items():
+        translated = "\n".join(" ".join(memory[s] for s in p) for p in paragraphs)
+        memory[text] = translated
+        if text not in new_entries:
+            new_entries[text] = translated
+
+    db.add_all(
+        TranslationMemory(
+            source_hash=content_hash(source_lang, target_lang, source),
+            source_lang=source_lang,
+            target_lang=target_lang,
+            source_text=source,
+            translated_text=translated,
+            model_name=model_name,
+        )
+        for source, translated in new_entries.items()
+    )
+    db.flush()
+    return [memory.get(t, t) for t in texts]
+
+
+def pretranslate_bills(db: Session, bills: Iterable[Bill], source_lang: str = "en", translator=None) -> int:
+    """
+    Translate bill titles and descriptions into every other supported language at ingestion time.
+
+    Args:
+        db (Session): Database session; the caller commits.
+        bills (Iterable[Bill]): Newly ingested or updated bills.
+        source_lang (str): Language the bills were fetched in.
+        translator: Optional translator override (see `translate_texts`).
+
+    Returns:
+        int: Number of texts submitted for translation.
+    """
+    texts = [t for bill in bills for t in (bill.title, bill.description) if t]
+    for target_lang in SUPPORTED_LANGUAGES:
+        if target_lang != source_lang:
+            translate_texts(db, texts, source_lang, target_lang, translator)
+    return len(texts)
+
+
+def pretranslate_platform_categories(
+    db: Session, categories: Iterable[PlatformCategory], source_lang: str = "en", translator=None
+) -> int:
+    """
+    Translate platform category names and stances into every other supported language.
+
+    Args:
+        db (Session): Database session; the caller commits.
+        categories (Iterable[PlatformCategory]): Newly stored platform categories.
+        source_lang (str): Language of the stored categories.
+        translator: Optional translator override (see `translate_texts`).
+
+    Returns:
+        int: Number of texts submitted for translation.
+    """
+    texts = list(dict.fromkeys(t for c in categories for t in (c.category, c.stance) if t))
+    for target_lang in SUPPORTED_LANGUAGES:
+        if target_lang != source_lang:
+            translate_texts(db, texts, source_lang, target_lang, translator)
+    return len(texts)
+
+
+def pretranslate_explanations(
+    db: Session, explanations: Iterable[PolicyExplanation], source_lang: str = "en", translator=None
+) -> int:
+    """
+    Translate stance explanations into every other supported language (for pages and audio).
+
+    Args:
+        db (Session): Database session; the caller commits.
+        explanations (Iterable[PolicyExplanation]): Explanation versions; those already in memory cost a lookup only.
+        source_lang (str): Language the explanations are generated in.
+        translator: Optional translator override (see `translate_texts`).
+
+    Returns:
+        int: Number of texts submitted for translation.
+    """
+    texts = list(dict.fromkeys(e.explanation for e in explanations if e.explanation))
+    for target_lang in SUPPORTED_LANGUAGES:
+        if target_lang != source_lang:
+            translate_texts(db, texts, source_lang, target_lang, translator)
+    return len(texts)
+
+
+def pretranslate_platforms(db: Session, translator=None) -> int:
+    """
+    Translate every stored platform's categories and stances not yet in translation memory.
+
+    Platforms are stored by an API route, which never translates, so each ingestion run picks
+    up the new ones; texts already in memory cost a lookup only.
+
+    Args:
+        db (Session): Database session; the caller commits.
+        translator: Optional translator override (see `translate_texts`).
+
+    Returns:
+        int: Number of texts submitted for translation.
+    """
+    return pretranslate_platform_categories(db, db.query(PlatformCategory), translator=translator)
+
+
+def get_translated_bill(db: Session, bill: Bill, lang: str, source_lang: str = "en") -> Optional[Dict[str, str]]:
+    """
+    Serve a bill's title and description in the requested language from translation memory only.
+
+    Args:
+        db (Session): Database session.
+        bill (Bill): The bill to serve.
+        lang (str): Requested language code.
+        source_lang (str): Language the bill is stored in.
+
+    Returns:
+        Optional[Dict[str, str]]: 'title' and 'description' in `lang`, or None if not yet translated.
+    """
+    if lang == source_lang:
+        return {"title": bill.title, "description": bill.description}
+    _check_direction(source_lang, lang)
+
+    memory = lookup_translations(db, [bill.title, bill.description], source_lang, lang)
+    if bill.title not in memory or bill.description not in memory:
+        return None
+    return {"title": memory[bill.title], "description": memory[bill.description]}
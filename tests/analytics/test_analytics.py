@@ -0,0 +1,104 @@
+# tests/analytics/test_analytics.py
+"""
+Unit tests for the Parquet snapshot export and DuckDB analytics.
+Ensures snapshots are partitioned by Parliament and aggregates are published into the read models.
+"""
+
+import os
+from datetime import date
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from analytics.queries import connect, parliament_cohesion, platform_stance_history, publish_aggregates
+from analytics.snapshot import export_snapshot, latest_snapshot
+from api.models.bill import Bill
+from api.models.database import get_db
+from api.models.party import Party, PlatformCategory
+from api.models.politician import Politician
+from api.models.vote import Vote
+from api.routes import honesty
+
+
+def _seed(db):
+    party = Party(name="Liberal")
+    db.add(party)
+    db.flush()
+    db.add_all([
+        PlatformCategory(party_id=party.id, election_year=2019, category="Housing", stance="positive"),
+        PlatformCategory(party_id=party.id, election_year=2021, category="Housing", stance="negative"),
+    ])
+    members = [Politician(name=name, party_id=party.id, position="MP") for name in ("Jane", "John", "Jill")]
+    db.add_all(members)
+    db.flush()
+    bill = Bill(number="C-1", title="Housing Act", description="Builds homes.", status="passed", introduced_by=members[0].id)
+    db.add(bill)
+    db.flush()
+    db.add_all([
+        Vote(politician_id=members[0].id, bill_id=bill.id, vote="yes", date=date(2020, 3, 1)),
+        Vote(politician_id=members[1].id, bill_id=bill.id, vote="yes", date=date(2020, 3, 1)),
+        Vote(politician_id=members[2].id, bill_id=bill.id, vote="no", date=date(2020, 3, 1)),
+        Vote(politician_id=members[0].id, bill_id=bill.id, vote="yes", date=date(2022, 5, 1)),
+    ])
+    db.commit()
+    return party
+
+
+def test_snapshot_partitions_votes_by_parliament(db_session, tmp_path):
+    """
+    Test that every table is exported and votes land in one directory per Parliament.
+    """
+    _seed(db_session)
+
+    result = export_snapshot(db_session, str(tmp_path))
+
+    assert result["rows"] == {"parties": 1, "politicians": 3, "bills": 1, "votes": 4, "platform_categories": 2}
+    assert latest_snapshot(str(tmp_path)) == result["path"]
+    assert sorted(os.listdir(os.path.join(result["path"], "votes"))) == ["parliament=43", "parliament=44"]
+
+
+def test_analytics_compute_cohesion_and_stance_changes(db_session, tmp_path):
+    """
+    Test that cohesion per Parliament and stance changes are computed from the snapshot alone.
+    """
+    _seed(db_session)
+    con = connect(export_snapshot(db_session, str(tmp_path))["path"])
+
+    cohesion = {row["parliament"]: row for row in parliament_cohesion(con)}
+    history = platform_stance_history(con)
+
+    assert abs(cohesion[43]["cohesion"] - 2 / 3) < 1e-9
+    assert (cohesion[44]["member_count"], cohesion[44]["cohesion"]) == (1, 1.0)
+    assert [(row["election_year"], row["previous_stance"], row["changed"]) for row in history] == [
+        (2019, None, False),
+        (2021, "positive", True),
+    ]
+
+
+def test_publish_serves_aggregates_from_read_models(db_session, tmp_path):
+    """
+    Test that published aggregates are served by the honesty routes.
+    """
+    party = _seed(db_session)
+    con = connect(export_snapshot(db_session, str(tmp_path))["path"])
+
+    counts = publish_aggregates(db_session, con)
+    app = FastAPI()
+    app.include_router(honesty.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    client = TestClient(app)
+
+    assert counts == {"parliament_cohesion": 2, "platform_stance_history": 2}
+    assert [row["parliament"] for row in client.get(f"/parties/{party.id}/cohesion/parliaments").json()] == [43, 44]
+    history = client.get(f"/parties/{party.id}/stance-history", params={"category": "Housing"}).json()
+    assert history[-1]["changed"] is True
+
+
+def test_snapshot_of_empty_tables_is_queryable(db_session, tmp_path):
+    """
+    Test that empty tables still produce readable Parquet files.
+    """
+    con = connect(export_snapshot(db_session, str(tmp_path))["path"])
+
+    assert parliament_cohesion(con) == []
+    assert platform_stance_history(con) == []
@@ -1,10 +1,19 @@
 # tests/conftest.py
 """
 Shared fixtures for PyTest.
-Provides common setup for mocking HTTP requests across test modules.
+Provides common setup for mocking HTTP requests and an in-memory database across test modules.
 """
 
+import sys
+from pathlib import Path
+
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Application modules import each other relative to backend/ (e.g., `api.models`), as in production
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
 
 
 @pytest.fixture
@@ -18,4 +27,25 @@ def mock_requests(requests_mock):
     Returns:
         requests_mock: Configured mock object for HTTP requests.
     """
-    return requests_mock
\ No newline at end of file
+    return requests_mock
+
+
+@pytest.fixture
+def db_session():
+    """
+    Fixture to provide a session on a fresh in-memory SQLite database with all tables created.
+
+    Yields:
+        Session: SQLAlchemy session, closed after the test.
+    """
+    import api.models  # noqa: F401  (registers every model on Base.metadata)
+    from api.models.database import Base
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
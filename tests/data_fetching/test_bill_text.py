@@ -0,0 +1,60 @@
+# tests/data_fetching/test_bill_text.py
+"""
+Unit tests for the bill_text module.
+Ensures publication URLs are built correctly and bill XML is parsed into sections as it streams.
+"""
+
+import io
+
+from api.data_fetching.bill_text import parse_bill_sections, publication_url, stream_bill_sections
+
+BILL_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Bill>
+  <Identification><LongTitle>An Act respecting housing</LongTitle></Identification>
+  <Body>
+    <Heading><TitleText>PART 1</TitleText></Heading>
+    <Section>
+      <MarginalNote>Short title</MarginalNote>
+      <Label>1</Label>
+      <Text>This Act may be cited as the <XRefExternal>Housing Act</XRefExternal>.</Text>
+    </Section>
+    <Section>
+      <Label>2</Label>
+      <Subsection><Label>(1)</Label><Text>The Minister must build homes.</Text></Subsection>
+      <Subsection><Label>(2)</Label><Text>Homes must be affordable.</Text></Subsection>
+    </Section>
+  </Body>
+</Bill>"""
+
+
+def test_publication_url_by_bill_kind():
+    """
+    Test that government and private members' bills map to their publication folders.
+    """
+    assert publication_url("/bills/44-1/C-69/", "C-69", 2) == (
+        "https://www.parl.ca/Content/Bills/441/Government/C-69/C-69_2/C-69_2.XML"
+    )
+    assert "/441/Private/C-318/C-318_1/" in publication_url("/bills/44-1/C-318/", "C-318", 1)
+    assert publication_url("/bills/1/", "C-1", 1) is None
+
+
+def test_parse_bill_sections():
+    """
+    Test that sections keep their label, marginal note and full text, subsections included.
+    """
+    sections = list(parse_bill_sections(io.BytesIO(BILL_XML)))
+
+    assert sections == [
+        {"position": 0, "label": "1", "heading": "Short title", "text": "This Act may be cited as the Housing Act ."},
+        {"position": 1, "label": "2", "heading": "", "text": "(1) The Minister must build homes. (2) Homes must be affordable."},
+    ]
+
+
+def test_stream_bill_sections_downloads_xml(mock_requests):
+    """
+    Test that a downloaded publication is parsed from the response stream.
+    """
+    url = publication_url("/bills/44-1/C-10/", "C-10", 1)
+    mock_requests.get(url, content=BILL_XML)
+
+    assert [s["label"] for s in stream_bill_sections(url)] == ["1", "2"]
@@ -0,0 +1,59 @@
+# tests/data_fetching/test_hansard.py
+"""
+Unit tests for the hansard module.
+Ensures speeches are streamed across pages, split into paragraphs, and errors stop the stream.
+"""
+
+from api.data_fetching import hansard
+from api.data_fetching.hansard import iter_speeches, split_paragraphs
+
+PAGE_1 = {
+    "objects": [{
+        "url": "/debates/2024/5/1/jane-smith-1/",
+        "politician_url": "/politicians/jane-smith/",
+        "time": "2024-05-01 14:05:00",
+        "h1": {"en": "Government Orders"},
+        "content": {"en": "<p>Mr. Speaker,  we will build\nhomes.</p><p></p><p>Housing matters.</p>", "fr": "<p>Oui.</p>"},
+    }],
+    "pagination": {"next_url": "/speeches/?limit=1&offset=1"},
+}
+PAGE_2 = {
+    "objects": [{"url": "/debates/2024/5/2/speaker-1/", "politician_url": None, "time": "2024-05-02 10:00:00", "content": {"en": "Order."}}],
+    "pagination": {"next_url": None},
+}
+
+
+def test_split_paragraphs_html_and_text():
+    """
+    Test that HTML and plain-text speeches are split into normalized, non-empty paragraphs.
+    """
+    assert split_paragraphs("<p>One  two</p><p> </p><p>Three</p>") == ["One two", "Three"]
+    assert split_paragraphs("First line\ncontinued.\n\nSecond.") == ["First line continued.", "Second."]
+
+
+def test_iter_speeches_follows_pagination(mock_requests, monkeypatch):
+    """
+    Test that every page is fetched and each speech is normalized.
+    """
+    monkeypatch.setattr(hansard.time, "sleep", lambda _: None)
+    mock_requests.get("https://openparliament.ca/api/speeches/?limit=1&offset=1", json=PAGE_2)
+    mock_requests.get("https://openparliament.ca/api/speeches/?limit=1&time__gte=2024-05-01", json=PAGE_1, complete_qs=True)
+
+    speeches = list(iter_speeches(start_date="2024-05-01", page_size=1))
+
+    assert [s["date"] for s in speeches] == ["2024-05-01", "2024-05-02"]
+    assert speeches[0]["paragraphs"] == ["Mr. Speaker, we will build homes.", "Housing matters."]
+    assert speeches[0]["heading"] == "Government Orders"
+    assert speeches[1]["politician_url"] == ""
+    assert mock_requests.request_history[0].qs == {"limit": ["1"], "time__gte": ["2024-05-01"]}
+
+
+def test_iter_speeches_stops_on_error(mock_requests, monkeypatch):
+    """
+    Test that a failed page ends the stream after the speeches already yielded.
+    """
+    monkeypatch.setattr(hansard.time, "sleep", lambda _: None)
+    mock_requests.get("https://openparliament.ca/api/speeches/?limit=1&offset=1", status_code=500)
+    mock_requests.get("https://openparliament.ca/api/speeches/?limit=1", json=PAGE_1, complete_qs=True)
+
+    assert len(list(iter_speeches(page_size=1))) == 1
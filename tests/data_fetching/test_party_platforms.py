@@ -73,4 +73,17 @@ def test_fetch_party_platform_request_error(mock_requests):
     assert result["name"] == "Green"
     assert result["election_year"] == "2015"
     assert result["platform"] == "Error fetching platform"
-    assert "created_at" in result
\ No newline at end of file
+    assert "created_at" in result
+
+def test_fetch_party_platform_resolves_name_variants(mock_requests):
+    """
+    Test that every variant of a party's name fetches the platform from its canonical slug.
+    """
+    url = "https://web.archive.org/web/2019*/https://bloc.ca/platform/2019"
+    mock_html = '<html><div class="platform-content">Defend Quebec jurisdiction.</div></html>'
+    mock_requests.get(url, text=mock_html, status_code=200)
+
+    for party_name in ("Bloc Québécois", "BQ", "bloc"):
+        result = fetch_party_platform(party_name, 2019)
+        assert result["name"] == "Bloc"
+        assert result["platform"] == "Defend Quebec jurisdiction."
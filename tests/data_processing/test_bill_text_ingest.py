@@ -0,0 +1,73 @@
+# tests/data_processing/test_bill_text_ingest.py
+"""
+Unit tests for the bill text processing module.
+Ensures only unseen versions are downloaded and section changes between readings are recorded.
+"""
+
+from api.data_fetching.bill_text import publication_url
+from api.data_processing.bill_text import ingest_bill_text, latest_bill_texts, section_diff
+from api.models.bill import Bill
+from api.models.bill_text import BillSection, BillVersion
+from api.models.party import Party
+from api.models.politician import Politician
+
+
+def _xml(*sections):
+    body = "".join(
+        f"<Section><MarginalNote>{heading}</MarginalNote><Label>{label}</Label><Text>{text}</Text></Section>"
+        for label, heading, text in sections
+    )
+    return f"<Bill><Body>{body}</Body></Bill>".encode()
+
+
+def _bill(db):
+    party = Party(name="Liberal")
+    db.add(party)
+    db.flush()
+    sponsor = Politician(name="Jane Smith", party_id=party.id, position="MP")
+    db.add(sponsor)
+    db.flush()
+    bill = Bill(url="/bills/44-1/C-10/", number="C-10", title="Housing Act", description="Builds homes.",
+                status="passed", introduced_by=sponsor.id)
+    db.add(bill)
+    db.commit()
+    return bill
+
+
+def test_section_diff_lists_changed_words():
+    """
+    Test that only changed words are reported.
+    """
+    assert section_diff("homes must be affordable", "homes must be very affordable") == "{+very+}"
+    assert section_diff("build 100 homes now", "build 200 homes") == "[-100-]{+200+} … [-now-]"
+
+
+def test_ingest_bill_text_stores_new_versions_with_changes(db_session, mock_requests):
+    """
+    Test that versions are stored with per-section changes and stored versions are not re-downloaded.
+    """
+    bill = _bill(db_session)
+    first, second, third = (publication_url(bill.url, bill.number, v) for v in (1, 2, 3))
+    mock_requests.head(first, status_code=200)
+    mock_requests.head(second, status_code=200)
+    mock_requests.head(third, status_code=404)
+    mock_requests.get(first, content=_xml(("1", "Short title", "Housing Act."), ("2", "Duty", "Build 100 homes."),
+                                          ("3", "Repeal", "Old law is repealed.")))
+    mock_requests.get(second, content=_xml(("1", "Short title", "Housing Act."), ("2", "Duty", "Build 200 homes."),
+                                           ("4", "Review", "Review in five years.")))
+
+    stored = ingest_bill_text(db_session, bill)
+
+    assert [(v.version, v.stage, v.section_count) for v in stored] == [
+        (1, "First Reading", 3), (2, "As passed by the House of Commons", 3),
+    ]
+    assert stored[1].removed_sections == ["3"]
+    changes = [(s.label, s.change, s.diff) for s in stored[1].sections]
+    assert changes == [("1", "unchanged", None), ("2", "modified", "[-100-]{+200+}"), ("4", "added", None)]
+    assert "Duty: Build 200 homes." in latest_bill_texts(db_session, [bill.id])[bill.id]
+
+    downloads = mock_requests.call_count
+    assert ingest_bill_text(db_session, bill) == []
+    assert [r.url for r in mock_requests.request_history[downloads:]] == [third]
+    assert db_session.query(BillVersion).count() == 2
+    assert db_session.query(BillSection).count() == 6
@@ -0,0 +1,107 @@
+# tests/data_processing/test_drift.py
+"""
+Unit tests for the drift module.
+Ensures drift scores combine label and text changes, and incremental updates match a full rebuild.
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.data_processing.drift import hashed_embeddings, label_change, refresh_drift, text_distance, update_drift
+from api.models.database import get_db
+from api.models.party import Party, PlatformCategory
+from api.models.read_models import StanceDrift
+from api.routes import honesty
+
+HOUSING = {
+    2006: ("positive", "We will build affordable housing across Canada."),
+    2011: ("positive", "We will build affordable housing across Canada."),
+    2015: ("negative", "Housing markets should be left to provinces and private builders."),
+}
+
+
+def _store(db, party_id, year, category="Housing"):
+    stance, text = HOUSING[year]
+    db.add(PlatformCategory(party_id=party_id, election_year=year, category=category, stance=stance, text=text))
+    db.commit()
+
+
+def _series(db, party_id):
+    return [
+        (r.election_year, r.previous_election_year, r.label_change, round(r.text_distance or 0, 6), r.drift_score is None)
+        for r in db.query(StanceDrift).filter_by(party_id=party_id).order_by(StanceDrift.election_year)
+    ]
+
+
+def _party(db):
+    party = Party(name="Liberal")
+    db.add(party)
+    db.commit()
+    return party.id
+
+
+def test_label_change_and_text_distance():
+    """
+    Test that reversals score 1, steps to neutral 0.5, and identical texts have no distance.
+    """
+    same, other, empty = hashed_embeddings(["Build housing now.", "Cut income taxes.", ""])
+
+    assert label_change("positive", "oppose") == 1
+    assert label_change("support", "neutral") == 0.5
+    assert label_change("negative", "oppose") == 0
+    assert text_distance(same, same) == 0
+    assert text_distance(same, other) == 1
+    assert text_distance(same, empty) == 1
+
+
+def test_update_recomputes_only_affected_pairs(db_session):
+    """
+    Test that inserting an election between two others re-links the later one and leaves earlier rows alone.
+    """
+    party_id = _party(db_session)
+    for year in (2006, 2015):
+        _store(db_session, party_id, year)
+        update_drift(db_session, party_id, year)
+    first_computed = db_session.get(StanceDrift, (party_id, "Housing", 2006)).computed_at
+
+    _store(db_session, party_id, 2011)
+    assert update_drift(db_session, party_id, 2011) == 2
+
+    series = _series(db_session, party_id)
+    assert [row[:3] for row in series] == [(2006, None, None), (2011, 2006, 0), (2015, 2011, 1)]
+    assert series[1][3] == 0 and series[2][3] > 0.5
+    assert db_session.get(StanceDrift, (party_id, "Housing", 2015)).drift_score > 0.75
+    assert db_session.get(StanceDrift, (party_id, "Housing", 2006)).computed_at == first_computed
+
+
+def test_incremental_updates_match_full_rebuild(db_session):
+    """
+    Test that updating year by year, in any order, produces the same series as a rebuild.
+    """
+    party_id = _party(db_session)
+    for year in (2015, 2006, 2011):
+        _store(db_session, party_id, year)
+        update_drift(db_session, party_id, year)
+    incremental = _series(db_session, party_id)
+
+    assert refresh_drift(db_session) == 3
+    assert _series(db_session, party_id) == incremental
+
+
+def test_drift_route_returns_the_party_series(db_session):
+    """
+    Test that the drift endpoint serves the stored series, oldest first.
+    """
+    party_id = _party(db_session)
+    for year in HOUSING:
+        _store(db_session, party_id, year)
+    refresh_drift(db_session)
+    app = FastAPI()
+    app.include_router(honesty.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+
+    served = TestClient(app).get(f"/parties/{party_id}/drift", params={"category": "Housing"}).json()
+
+    assert [(r["election_year"], r["previous_stance"]) for r in served] == [
+        (2006, None), (2011, "positive"), (2015, "positive"),
+    ]
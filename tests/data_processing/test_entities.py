@@ -0,0 +1,101 @@
+# tests/data_processing/test_entities.py
+"""
+Unit tests for the entities module.
+Ensures URLs, slugs and name variants resolve to canonical IDs without per-row queries.
+"""
+
+from sqlalchemy import event
+
+from api.data_processing.entities import EntityIndex, entity_key
+from api.data_processing.ingest import ingest_politicians, ingest_votes
+from api.models.entity_alias import EntityAlias
+from api.models.party import Party
+from api.models.politician import Politician
+
+
+def test_entity_key_normalizes_urls_and_names():
+    """
+    Test that hosts, case, accents, punctuation and stopwords are ignored.
+    """
+    assert entity_key("https://openparliament.ca/Politicians/Jane-Smith", "politician") == "/politicians/jane-smith/"
+    assert entity_key("Hon. Jane Smith, PC", "politician") == "jane smith"
+    assert entity_key("Parti libéral du Canada", "party") == "liberal"
+
+
+def test_index_resolves_party_variants_and_fuzzy_names(db_session):
+    """
+    Test that slugs, known variants and near-miss names resolve to the stored party.
+    """
+    db_session.add_all([Party(name="Liberal"), Party(name="Bloc Québécois")])
+    db_session.commit()
+    index = EntityIndex.load(db_session)
+    liberal = db_session.query(Party).filter_by(name="Liberal").one().id
+    bloc = db_session.query(Party).filter_by(name="Bloc Québécois").one().id
+
+    assert index.resolve("party", "/parties/liberal/") == liberal
+    assert index.resolve("party", "Liberal Party of Canada") == liberal
+    assert index.resolve("party", "/parties/bloc/") == bloc
+    assert index.resolve("party", "Bloc Quebecois Party") == bloc
+    assert index.resolve("party", "Liberals") is None
+    assert index.resolve("party", "Liberals", fuzzy=True) == liberal
+    assert index.resolve("party", "Rhinoceros", fuzzy=True) is None
+
+
+def test_ambiguous_names_resolve_to_none(db_session):
+    """
+    Test that a name shared by two politicians is not linked to either, while their URLs are.
+    """
+    party = Party(name="Liberal")
+    db_session.add(party)
+    db_session.flush()
+    first = Politician(url="/politicians/john-williams/", name="John Williams", party_id=party.id, position="MP")
+    second = Politician(url="/politicians/john-williams-2/", name="John Williams", party_id=party.id, position="MP")
+    db_session.add_all([first, second])
+    db_session.commit()
+
+    index = EntityIndex.load(db_session)
+
+    assert index.resolve("politician", "John Williams") is None
+    assert index.resolve("politician", "/politicians/john-williams-2/") == second.id
+
+
+def test_stored_aliases_resolve_changed_urls(db_session):
+    """
+    Test that a manual alias maps a second URL to an existing politician, so ingestion updates it in place.
+    """
+    ingest_politicians(db_session, [{"url": "/politicians/1/", "name": "Jane Smith", "party_url": "/parties/ndp/", "position": "MP"}])
+    politician = db_session.query(Politician).one()
+    index = EntityIndex.load(db_session)
+    index.register("politician", "/politicians/jane-smith/", politician.id, source="manual")
+    index.save(db_session)
+    db_session.commit()
+
+    changed = ingest_politicians(db_session, [
+        {"url": "/politicians/jane-smith/", "name": "Jane Smith", "party_url": "New Democratic Party", "position": "Minister"},
+    ])
+
+    assert db_session.query(Politician).count() == 1
+    assert [p.position for p in changed] == ["Minister"]
+    assert db_session.query(Party).count() == 1
+    assert db_session.query(EntityAlias).one().alias == "/politicians/jane-smith/"
+
+
+def test_vote_ingestion_resolves_references_without_politician_queries(db_session):
+    """
+    Test that resolving voters of a large batch reads no politician rows.
+    """
+    raw_politicians = [
+        {"url": f"/politicians/{i}/", "name": f"Member {i}", "party_url": "/parties/liberal/", "position": "MP"}
+        for i in range(50)
+    ]
+    ingest_politicians(db_session, raw_politicians)
+    db_session.commit()
+    index = EntityIndex.load(db_session)
+    statements = []
+    event.listen(db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    ingest_votes(db_session, [
+        {"url": "/votes/1/", "politician_url": p["url"], "bill_url": "/bills/1/", "vote": "yes"} for p in raw_politicians
+    ], index)
+
+    assert not [s for s in statements if "FROM politicians" in s]
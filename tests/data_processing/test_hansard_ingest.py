@@ -0,0 +1,60 @@
+# tests/data_processing/test_hansard_ingest.py
+"""
+Unit tests for the Hansard processing module.
+Ensures paragraphs are stored compressed once per content hash and categorized in bulk.
+"""
+
+from api.data_processing.hansard import categorize_paragraphs, ingest_hansard
+from api.models.hansard import HansardParagraph
+from api.models.party import Party
+from api.models.politician import Politician
+
+
+def _speech(url, politician_url, paragraphs):
+    return {"url": url, "politician_url": politician_url, "date": "2024-05-01", "language": "en", "paragraphs": paragraphs}
+
+
+def test_ingest_hansard_deduplicates_and_links_speakers(db_session):
+    """
+    Test that repeated paragraphs are stored once and speakers are resolved by URL.
+    """
+    party = Party(name="Liberal")
+    db_session.add(party)
+    db_session.flush()
+    jane = Politician(url="/politicians/jane/", name="Jane Smith", party_id=party.id, position="MP")
+    db_session.add(jane)
+    db_session.commit()
+    speeches = [
+        _speech("/debates/1/jane-1/", "/politicians/jane/", ["Mr. Speaker, thank you.", "We will build housing."]),
+        _speech("/debates/1/jane-2/", "/politicians/jane/", ["Mr. Speaker, thank you."]),
+        _speech("/debates/1/unknown-1/", "/politicians/unknown/", ["Mr. Speaker, thank you."]),
+    ]
+
+    counts = ingest_hansard(db_session, iter(speeches), batch_size=2)
+    again = ingest_hansard(db_session, iter(speeches), batch_size=2)
+
+    stored = db_session.query(HansardParagraph).order_by(HansardParagraph.id).all()
+    assert counts == {"stored": 3, "duplicates": 1}
+    assert again == {"stored": 0, "duplicates": 4}
+    assert [p.politician_id for p in stored] == [jane.id, jane.id, None]
+    assert stored[1].text == "We will build housing."
+    assert stored[1].text_compressed != b"We will build housing."
+
+
+def test_categorize_paragraphs_in_batches(db_session):
+    """
+    Test that every pending paragraph is categorized once, including duplicates within a batch.
+    """
+    speeches = [_speech(
+        "/debates/1/a-1/", "/politicians/a/",
+        ["We will build affordable housing.", "Mr. Speaker, thank you.", "Cut the carbon tax on energy."],
+    )]
+    ingest_hansard(db_session, iter(speeches))
+
+    assert categorize_paragraphs(db_session, batch_size=2) == 3
+    assert categorize_paragraphs(db_session) == 0
+
+    categories = [p.categories for p in db_session.query(HansardParagraph).order_by(HansardParagraph.id)]
+    assert categories[0] == ["Housing"]
+    assert categories[1] == []
+    assert "Climate Change and Energy" in categories[2]
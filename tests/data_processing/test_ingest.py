@@ -0,0 +1,82 @@
+# tests/data_processing/test_ingest.py
+"""
+Unit tests for the ingest module.
+Ensures fetched records are stored once, linked by URL, and re-ingestion only reports changes.
+"""
+
+from api.data_processing.ingest import change_events, ingest_bills, ingest_politicians, ingest_votes
+from api.models.party import Party
+from api.models.vote import Vote
+
+RAW_POLITICIANS = [{"url": "/politicians/123/", "name": "Jane Smith", "party_url": "/parties/liberal/", "position": "MP"}]
+RAW_BILLS = [{
+    "url": "/bills/42-1/C-10/", "number": "C-10", "title": "Broadcasting Act", "description": "Amends it.",
+    "status": "passed", "introduced_by": "/politicians/123/",
+}]
+RAW_VOTES = [{
+    "url": "/votes/42-1/1/", "politician_url": "/politicians/123/", "bill_url": "/bills/42-1/C-10/",
+    "vote": "yes", "date": "2016-05-04",
+}]
+
+
+def test_ingestion_links_records_and_is_idempotent(db_session):
+    """
+    Test that politicians, bills and votes are linked and unchanged records are skipped.
+    """
+    politicians = ingest_politicians(db_session, RAW_POLITICIANS)
+    bills = ingest_bills(db_session, RAW_BILLS)
+    votes = ingest_votes(db_session, RAW_VOTES)
+
+    assert db_session.query(Party).one().name == "Liberal"
+    assert bills[0].introduced_by == politicians[0].id
+    assert (votes[0].politician_id, votes[0].bill_id) == (politicians[0].id, bills[0].id)
+
+    assert ingest_politicians(db_session, RAW_POLITICIANS) == []
+    assert ingest_bills(db_session, RAW_BILLS) == []
+    assert ingest_votes(db_session, RAW_VOTES) == []
+    assert db_session.query(Vote).count() == 1
+
+
+def test_ingest_votes_skips_votes_without_date(db_session, capsys):
+    """
+    Test that an undated vote is skipped with a warning instead of being filed under today's Parliament.
+    """
+    ingest_politicians(db_session, RAW_POLITICIANS)
+    ingest_bills(db_session, RAW_BILLS)
+
+    assert ingest_votes(db_session, [{**RAW_VOTES[0], "date": ""}]) == []
+    assert "Skipping vote /votes/42-1/1/: no date" in capsys.readouterr().out
+    assert db_session.query(Vote).count() == 0
+
+
+def test_ingest_bills_reports_updated_status(db_session):
+    """
+    Test that a bill whose status changed is updated in place and reported.
+    """
+    ingest_politicians(db_session, RAW_POLITICIANS)
+    ingest_bills(db_session, RAW_BILLS)
+
+    changed = ingest_bills(db_session, [{**RAW_BILLS[0], "status": "royal assent"}])
+
+    assert [b.status for b in changed] == ["royal assent"]
+
+
+def test_change_events_carry_only_bill_diffs_and_group_votes(db_session):
+    """
+    Test that bill events list only changed fields and votes are grouped per division.
+    """
+    politicians = ingest_politicians(db_session, RAW_POLITICIANS)
+    ingest_bills(db_session, RAW_BILLS)
+    votes = ingest_votes(db_session, RAW_VOTES)
+    changes = {}
+    bills = ingest_bills(db_session, [{**RAW_BILLS[0], "status": "royal assent"}], changes)
+
+    events = change_events(politicians, bills, changes, votes)
+
+    assert [topic for topic, _ in events] == ["politicians", "bills", "votes"]
+    assert events[1][1] == {
+        "id": bills[0].id, "url": "/bills/42-1/C-10/", "action": "updated", "changes": {"status": "royal assent"},
+    }
+    assert events[2][1]["tally"] == {"yes": 1}
+    assert events[2][1]["votes"] == {str(politicians[0].id): "yes"}
+    assert events[2][1]["date"] == "2016-05-04"
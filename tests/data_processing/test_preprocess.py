@@ -0,0 +1,119 @@
+# tests/data_processing/test_preprocess.py
+"""
+Unit tests for the streaming preprocessing pipeline.
+Ensures page chrome is dropped, units stay bounded, languages are told apart, near-duplicates
+are removed across documents, and a process pool gives the same output as a single process.
+"""
+
+from api.data_processing.categorize_platform import categorize_text
+from data_processing.preprocess import (
+    MAX_UNIT_CHARS,
+    clean_units,
+    detect_language,
+    iter_lines,
+    minhash,
+    normalize_text,
+    preprocess_corpus,
+    split_sentences,
+)
+
+PAGE = """Skip to content
+Home > Platform > Housing
+Menu
+Our Plan
+We will build 500 000 homes and cut the GST on new housing.
+Menu
+© 2021 Liberal Party of Canada. All rights reserved.
+12
+"""
+
+SENTENCES = [
+    "We will cut the carbon tax on energy for every family.",
+    "Mr. Smith said the U.S. tariff on softwood lumber must end.",
+    "Our health care plan adds dental coverage for seniors.",
+    "Nous allons investir dans le logement abordable pour les familles.",
+]
+
+
+def test_boilerplate_and_repeated_menus_are_removed():
+    """
+    Test that navigation, breadcrumbs, footers and page numbers are dropped and text is normalized.
+    """
+    assert list(clean_units(PAGE)) == [
+        "Our Plan",
+        "We will build 500 000 homes and cut the GST on new housing.",
+    ]
+    assert normalize_text("l’économie​  ﬁscale") == "l'économie fiscale"
+
+
+def test_text_without_line_breaks_is_split_into_bounded_units():
+    """
+    Test that a page scraped as one line is cut at sentence boundaries into units under the limit.
+    """
+    text = " ".join(SENTENCES * 10)
+    units = list(clean_units(text))
+
+    assert len(units) > 1
+    assert all(len(unit) <= MAX_UNIT_CHARS for unit in units)
+    assert " ".join(units) == text
+    assert all(unit.endswith((".", "!")) for unit in units)
+
+    categorized = categorize_text(text)
+    assert all(len(line) <= MAX_UNIT_CHARS for line in categorized["Housing"].splitlines())
+
+
+def test_sentences_keep_abbreviations_and_initials():
+    """
+    Test that titles, initials and 'U.S.' do not end sentences.
+    """
+    assert split_sentences("Hon. J. Smith met Dr. Lee in the U.S. on Monday. Then M. Blanchet spoke!") == [
+        "Hon. J. Smith met Dr. Lee in the U.S. on Monday.",
+        "Then M. Blanchet spoke!",
+    ]
+
+
+def test_language_is_detected_per_unit():
+    """
+    Test English, French and undetermined units.
+    """
+    assert detect_language(SENTENCES[0]) == "en"
+    assert detect_language(SENTENCES[3]) == "fr"
+    assert detect_language("Bill C-5") == "und"
+
+
+def test_documents_are_read_chunk_by_chunk():
+    """
+    Test that lines spanning chunks are reassembled and give the same units as the whole text.
+    """
+    chunks = [PAGE[i:i + 7] for i in range(0, len(PAGE), 7)]
+
+    assert list(iter_lines(["ab\nc", "d\n", "e"])) == ["ab", "cd", "e"]
+    assert list(clean_units(iter(chunks))) == list(clean_units(PAGE))
+
+
+def test_near_duplicates_are_removed_across_documents():
+    """
+    Test that a lightly edited copy of a unit is dropped, and distinct units are kept.
+    """
+    original = "We will build affordable housing near transit in every province and territory of Canada."
+    edited = original.replace("Canada.", "Canada by 2030.")
+    documents = [("a", original), ("b", f"{edited}\n{SENTENCES[0]}")]
+
+    units = list(preprocess_corpus(documents))
+
+    assert len(set(minhash(original)) & set(minhash(edited))) > 0
+    assert [(u["document"], u["text"]) for u in units] == [("a", original), ("b", SENTENCES[0])]
+    assert len(list(preprocess_corpus(documents, dedupe=False))) == 3
+
+
+def test_process_pool_matches_single_process():
+    """
+    Test that the pool preserves document order and deduplicates the same units.
+    """
+    documents = [(str(i), "\n".join(SENTENCES[i % 4:] + [f"Item {i} of the platform."])) for i in range(12)]
+
+    serial = list(preprocess_corpus(documents))
+    pooled = list(preprocess_corpus(documents, workers=2, chunk_size=2))
+
+    assert pooled == serial
+    assert [u["language"] for u in serial[:4]] == ["en", "en", "en", "fr"]
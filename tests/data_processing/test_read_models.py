@@ -0,0 +1,111 @@
+# tests/data_processing/test_read_models.py
+"""
+Unit tests for the read_models module and honesty routes.
+Ensures scorecards, cohesion and category comparisons are precomputed and served as single reads.
+"""
+
+from datetime import date
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from api.data_processing.read_models import refresh_read_models
+from api.models.bill import Bill
+from api.models.bill_text import BillSection, BillVersion
+from api.models.database import get_db
+from api.models.party import Party, PlatformCategory
+from api.models.politician import Politician
+from api.models.vote import Vote
+from api.routes import honesty
+
+VOTED_ON = date(2024, 3, 20)
+
+
+def _seed(db):
+    party = Party(name="Liberal")
+    db.add(party)
+    db.flush()
+    db.add(PlatformCategory(party_id=party.id, election_year=2000, category="Housing", stance="positive"))
+    members = [Politician(name=name, party_id=party.id, position="MP") for name in ("Jane", "John", "Jill")]
+    db.add_all(members)
+    db.flush()
+    bill = Bill(number="C-1", title="Housing Act", description="Builds homes.", status="passed", introduced_by=members[0].id)
+    db.add(bill)
+    db.flush()
+    db.add_all([
+        Vote(politician_id=members[0].id, bill_id=bill.id, vote="yes", date=VOTED_ON),
+        Vote(politician_id=members[1].id, bill_id=bill.id, vote="yes", date=VOTED_ON),
+        Vote(politician_id=members[2].id, bill_id=bill.id, vote="no", date=VOTED_ON),
+    ])
+    db.commit()
+    return party, members
+
+
+def _client(db):
+    app = FastAPI()
+    app.include_router(honesty.router)
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def test_refresh_builds_all_read_models(db_session):
+    """
+    Test that scorecards, cohesion and category comparisons reflect votes and stances.
+    """
+    party, members = _seed(db_session)
+
+    counts = refresh_read_models(db_session)
+    client = _client(db_session)
+
+    assert counts == {"scorecards": 3, "party_cohesion": 1, "category_comparisons": 1}
+    scorecard = client.get(f"/politicians/{members[2].id}/scorecard").json()
+    assert (scorecard["party_name"], scorecard["conflicting_votes"], scorecard["integrity_score"]) == ("Liberal", 1, 0.0)
+    assert scorecard["categories"] == {"Housing": {"aligned": 0, "conflicting": 1}}
+
+    cohesion = client.get(f"/parties/{party.id}/cohesion").json()
+    assert cohesion[0]["cohesion"] == 2 / 3 and cohesion[0]["member_count"] == 3
+
+    comparison = client.get("/categories/Housing/comparison").json()
+    assert [(c["election_year"], c["aligned_votes"], c["conflicting_votes"]) for c in comparison] == [(2000, 2, 1)]
+
+
+def test_refresh_categorizes_bills_by_latest_full_text(db_session):
+    """
+    Test that a bill's latest stored text, not only its description, decides its categories.
+    """
+    party, members = _seed(db_session)
+    bill_id = db_session.query(Bill.id).scalar()
+    db_session.add(PlatformCategory(party_id=party.id, election_year=2000, category="Health Care", stance="positive"))
+    for version, text in ((1, "Builds homes."), (2, "Builds homes and funds national pharmacare.")):
+        bill_version = BillVersion(bill_id=bill_id, version=version, stage="First Reading", source_url=f"v{version}")
+        db_session.add(bill_version)
+        db_session.flush()
+        db_session.add(BillSection(
+            version_id=bill_version.id, position=0, label="1", text=text, content_hash=str(version), change="added",
+        ))
+    db_session.commit()
+
+    refresh_read_models(db_session)
+
+    scorecard = _client(db_session).get(f"/politicians/{members[2].id}/scorecard").json()
+    assert scorecard["categories"] == {
+        "Housing": {"aligned": 0, "conflicting": 1},
+        "Health Care": {"aligned": 0, "conflicting": 1},
+    }
+
+
+def test_scorecard_is_a_single_query(db_session):
+    """
+    Test that serving a scorecard issues exactly one SQL statement.
+    """
+    _, members = _seed(db_session)
+    refresh_read_models(db_session)
+    db_session.expire_all()
+    statements = []
+    event.listen(db_session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    response = _client(db_session).get(f"/politicians/{members[0].id}/scorecard")
+
+    assert response.status_code == 200
+    assert len(statements) == 1
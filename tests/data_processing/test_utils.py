@@ -0,0 +1,41 @@
+# tests/data_processing/test_utils.py
+"""
+Unit tests for the data_processing utils module.
+Ensures content hashing is stable and length-bucketed batching keeps batches homogeneous.
+"""
+
+from backend.data_processing.utils import content_hash, length_bucketed_batches
+
+
+def test_content_hash_is_stable_and_separates_parts():
+    """
+    Test that hashes are deterministic and part boundaries matter.
+    """
+    assert content_hash("Bill C-10", "fr") == content_hash("Bill C-10", "fr")
+    assert content_hash("ab", "c") != content_hash("a", "bc")
+    assert len(content_hash("text")) == 64
+
+
+def test_length_bucketed_batches_sorted_without_shuffle():
+    """
+    Test that unshuffled batching sorts items by length.
+    """
+    lengths = [5, 1, 4, 2, 3]
+    batches = length_bucketed_batches(lengths, batch_size=2)
+
+    assert batches == [[1, 3], [4, 2], [0]]
+
+
+def test_length_bucketed_batches_shuffle_covers_every_item_once():
+    """
+    Test that shuffled batching is seeded, complete, and length-homogeneous within buckets.
+    """
+    lengths = [i % 17 for i in range(100)]
+    batches = length_bucketed_batches(lengths, batch_size=8, shuffle=True, seed=1, bucket_multiplier=100)
+
+    assert sorted(i for batch in batches for i in batch) == list(range(100))
+    assert batches == length_bucketed_batches(lengths, batch_size=8, shuffle=True, seed=1, bucket_multiplier=100)
+    # A single bucket means each batch is a contiguous slice of the length-sorted order
+    for batch in batches:
+        batch_lengths = [lengths[i] for i in batch]
+        assert max(batch_lengths) - min(batch_lengths) <= 2
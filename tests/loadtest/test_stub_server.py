@@ -0,0 +1,94 @@
+# tests/loadtest/test_stub_server.py
+"""
+Unit tests for the offline stub server and the load-test harness.
+Ensures fixtures are paginated like Open Parliament, injected 429s are retried after Retry-After,
+and latency percentiles are reported.
+"""
+
+import pytest
+import requests
+
+from api.data_fetching import upstream
+from api.data_fetching.bill_text import publication_exists
+from api.data_fetching.hansard import iter_speeches
+from api.data_fetching.politicians import fetch_politicians
+from loadtest.fixtures import generate_fixtures
+from loadtest.harness import percentiles, run_api_load
+from loadtest.stub_server import FaultProfile, StubServer
+
+FIXTURES = generate_fixtures(politicians=12, bills=3, speeches=30, sections_per_bill=2)
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """
+    Run a stub server with no faults and point the fetchers at it.
+    """
+    with StubServer(FIXTURES) as server:
+        monkeypatch.setattr(upstream, "OPENPARLIAMENT_API_ROOT", f"{server.url}/api")
+        monkeypatch.setattr(upstream, "PARL_ROOT", server.url)
+        monkeypatch.setattr(upstream, "WAYBACK_ROOT", f"{server.url}/web")
+        yield server
+
+
+def test_speeches_are_paginated_with_next_url(stub):
+    """
+    Test that the Hansard crawler follows the stub's pagination across pages.
+    """
+    speeches = list(iter_speeches(page_size=20, max_pages=2))
+
+    assert [s["url"] for s in speeches] == [s["url"] for s in FIXTURES["speeches"][:30]]
+    assert [route for route, _, _ in stub.requests] == ["speeches", "speeches"]
+
+
+def test_publications_and_platforms_are_replayed(stub):
+    """
+    Test that bill XML and archived platform pages are served at their upstream paths.
+    """
+    path = next(iter(FIXTURES["publications"]))
+
+    assert requests.head(f"{stub.url}{path}").status_code == 200
+    assert requests.get(f"{stub.url}/Content/Bills/441/Government/C-1/C-1_2/C-1_2.XML").status_code == 404
+    assert "platform-content" in requests.get(f"{upstream.WAYBACK_ROOT}/2021*/https://liberal.ca/platform/2021").text
+
+
+def test_throttled_requests_are_retried_after_retry_after(stub):
+    """
+    Test that 429s carry Retry-After and the fetchers retry until the request goes through.
+    """
+    stub.faults = FaultProfile(throttle_rate=1.0, retry_after=0)
+    response = upstream.get(f"{stub.url}/api/politicians/", max_retries=2)
+    assert (response.status_code, response.headers["Retry-After"]) == (429, "0")
+    assert len(stub.requests) == 3
+
+    stub.faults = FaultProfile(throttle_rate=0.5, retry_after=0, seed=1)
+    assert [p["url"] for p in fetch_politicians()] == [p["url"] for p in FIXTURES["politicians"]]
+
+
+def test_publication_check_retries_throttled_heads(stub):
+    """
+    Test that a throttled HEAD is retried and never taken for an unpublished bill; only a 404 is.
+    """
+    url = f"{stub.url}{next(iter(FIXTURES['publications']))}"
+    stub.faults = FaultProfile(throttle_rate=1.0, retry_after=0)
+    with pytest.raises(requests.HTTPError):
+        publication_exists(url)
+    assert [status for _, status, _ in stub.requests] == [429] * (upstream.MAX_RETRIES + 1)
+
+    stub.faults = FaultProfile(throttle_rate=0.5, retry_after=0, seed=1)
+    assert publication_exists(url)
+    stub.faults = FaultProfile()
+    assert not publication_exists(f"{stub.url}/Content/Bills/441/Government/C-1/C-1_2/C-1_2.XML")
+
+
+def test_harness_reports_throughput_and_percentiles(stub):
+    """
+    Test that the API scenario reports every request, and percentiles use the nearest rank.
+    """
+    report = run_api_load(stub.url, mix=[(1, "/api/politicians/"), (1, "/api/bills/")], concurrency=4, total=40)
+
+    assert report["all"]["requests"] == 40 and report["all"]["errors"] == 0
+    assert report["all"]["rps"] > 0
+    assert percentiles([0.001 * i for i in range(1, 101)]) == pytest.approx(
+        {"p50": 50, "p90": 90, "p95": 95, "p99": 99, "max": 100}
+    )
@@ -0,0 +1,68 @@
+# tests/models/test_vote.py
+"""
+Unit tests for the vote model.
+Ensures Parliament filters match the votes partition boundaries and restrict the votes endpoint.
+"""
+
+from datetime import date
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.models.bill import Bill
+from api.models.database import get_db
+from api.models.party import Party
+from api.models.politician import Politician
+from api.models.vote import Vote, in_parliament, parliament_dates
+from api.routes import data as data_routes
+
+
+def _add_votes(db, dates):
+    party = Party(name="Liberal")
+    db.add(party)
+    db.flush()
+    politician = Politician(name="Jane Smith", party_id=party.id, position="MP")
+    db.add(politician)
+    db.flush()
+    bill = Bill(title="Housing Act", description="Builds homes.", status="passed", introduced_by=politician.id)
+    db.add(bill)
+    db.flush()
+    for voted_on in dates:
+        db.add(Vote(politician_id=politician.id, bill_id=bill.id, vote="yes", date=voted_on))
+    db.flush()
+
+
+def test_in_parliament_selects_only_that_parliaments_votes(db_session):
+    """
+    Test that a Parliament filter includes its first day and excludes the next Parliament's first day.
+    """
+    _add_votes(db_session, (date(2021, 11, 22), date(2025, 5, 25), date(2025, 5, 26)))
+
+    dates = [v.date for v in db_session.query(Vote).filter(in_parliament(44)).order_by(Vote.date)]
+    ongoing = [v.date for v in db_session.query(Vote).filter(in_parliament(45))]
+
+    assert dates == [date(2021, 11, 22), date(2025, 5, 25)]
+    assert ongoing == [date(2025, 5, 26)]
+
+
+def test_votes_endpoint_filters_by_parliament(db_session):
+    """
+    Test that /votes?parliament= returns only that Parliament's votes and rejects unknown Parliaments.
+    """
+    _add_votes(db_session, (date(2021, 11, 21), date(2021, 11, 22), date(2025, 5, 26)))
+    db_session.commit()
+    app = FastAPI()
+    app.include_router(data_routes.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    client = TestClient(app)
+
+    assert [v["date"] for v in client.get("/votes?parliament=44").json()] == ["2021-11-22"]
+    assert client.get("/votes?parliament=12").status_code == 400
+
+
+def test_parliament_dates_rejects_unknown_parliament():
+    """
+    Test that unknown Parliament numbers raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        parliament_dates(12)
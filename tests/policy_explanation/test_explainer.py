@@ -0,0 +1,84 @@
+# tests/policy_explanation/test_explainer.py
+"""
+Unit tests for the explainer module.
+Ensures explanations cite aligned/conflicting votes, are versioned, and are only regenerated on change.
+"""
+
+from datetime import date
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.models.bill import Bill
+from api.models.database import get_db
+from api.models.explanation import PolicyExplanation
+from api.models.party import Party, PlatformCategory
+from api.models.politician import Politician
+from api.models.vote import Vote
+from api.routes import honesty
+from policy_explanation.explainer import generate_explanations
+
+VOTED_ON = date(2024, 3, 20)
+
+
+def _seed(db):
+    party = Party(name="Liberal")
+    db.add(party)
+    db.flush()
+    db.add(PlatformCategory(
+        party_id=party.id, election_year=2000, category="Housing",
+        stance="positive", text="We will build affordable housing.",
+    ))
+    politician = Politician(name="Jane Smith", party_id=party.id, position="MP")
+    db.add(politician)
+    db.flush()
+    bills = [
+        Bill(number="C-1", title="Housing Act", description="Builds homes.", status="passed", introduced_by=politician.id),
+        Bill(number="C-2", title="Rent Act", description="Funds housing starts.", status="passed", introduced_by=politician.id),
+    ]
+    db.add_all(bills)
+    db.flush()
+    db.add_all([
+        Vote(politician_id=politician.id, bill_id=bills[0].id, vote="yes", date=VOTED_ON),
+        Vote(politician_id=politician.id, bill_id=bills[1].id, vote="no", date=VOTED_ON),
+    ])
+    db.commit()
+    return politician, bills
+
+
+def test_generate_explanations_cites_votes_and_platform(db_session):
+    """
+    Test that an explanation counts aligned and conflicting votes and cites the platform.
+    """
+    politician, _ = _seed(db_session)
+
+    assert generate_explanations(db_session) == 1
+
+    explanation = db_session.query(PolicyExplanation).filter_by(category="Housing").one()
+    assert (explanation.aligned_count, explanation.conflicting_count) == (1, 1)
+    assert "1 of 2 Housing bills" in explanation.explanation
+    assert "We will build affordable housing." in explanation.explanation
+    assert [b["number"] for b in explanation.citations["bills"]] == ["C-1", "C-2"]
+
+
+def test_generate_explanations_versions_only_on_change(db_session):
+    """
+    Test that unchanged inputs are skipped and new votes create a new current version.
+    """
+    politician, bills = _seed(db_session)
+    generate_explanations(db_session)
+
+    assert generate_explanations(db_session) == 0
+
+    db_session.add(Vote(politician_id=politician.id, bill_id=bills[0].id, vote="no", date=VOTED_ON))
+    db_session.commit()
+    assert generate_explanations(db_session, [politician.id]) == 1
+
+    versions = db_session.query(PolicyExplanation).order_by(PolicyExplanation.version).all()
+    assert [(v.version, v.is_current) for v in versions] == [(1, False), (2, True)]
+
+    app = FastAPI()
+    app.include_router(honesty.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    served = TestClient(app).get(f"/politicians/{politician.id}/explanations").json()
+    assert [(e["version"], e["conflicting_count"]) for e in served] == [(2, 2)]
@@ -0,0 +1,58 @@
+# tests/sentiment_analysis/conftest.py
+"""
+Shared fixtures for the stance classifier tests.
+Provides a tiny random DistilBERT stance model and tokenizer saved locally, so tests run offline.
+"""
+
+import json
+
+import pytest
+import torch
+from transformers import DistilBertConfig, DistilBertForSequenceClassification, DistilBertTokenizerFast
+
+from sentiment_analysis.model import STANCE_LABELS, label_maps
+
+WORDS = "we will cut raise the carbon tax build homes fund dental care oppose support nothing new".split()
+
+
+@pytest.fixture
+def tiny_model_dir(tmp_path):
+    """
+    Save a tiny DistilBERT stance classifier and its word-level tokenizer.
+
+    Returns:
+        str: Directory usable as `base_model` for training or as an exported model.
+    """
+    model_dir = tmp_path / "tiny-model"
+    model_dir.mkdir()
+    vocab = model_dir / "vocab.txt"
+    vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *WORDS]) + "\n")
+    tokenizer = DistilBertTokenizerFast(vocab_file=str(vocab))
+
+    id2label, label2id = label_maps()
+    config = DistilBertConfig(
+        vocab_size=len(tokenizer), dim=32, n_layers=1, n_heads=2, hidden_dim=64,
+        num_labels=len(STANCE_LABELS), id2label=id2label, label2id=label2id,
+    )
+    torch.manual_seed(0)
+    DistilBertForSequenceClassification(config).save_pretrained(model_dir)
+    tokenizer.save_pretrained(model_dir)
+    return str(model_dir)
+
+
+@pytest.fixture
+def corpus_path(tmp_path):
+    """
+    Write a small labelled JSON lines corpus of varying lengths.
+    """
+    texts = {
+        "support": "we will build homes and fund dental care",
+        "oppose": "we oppose the carbon tax",
+        "neutral": "nothing new",
+    }
+    path = tmp_path / "corpus.jsonl"
+    with open(path, "w") as f:
+        for i in range(40):
+            label = STANCE_LABELS[i % 3]
+            f.write(json.dumps({"text": " ".join([texts[label]] * (i % 4 + 1)), "label": label}) + "\n")
+    return str(path)
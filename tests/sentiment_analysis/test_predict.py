@@ -0,0 +1,21 @@
+# tests/sentiment_analysis/test_predict.py
+"""
+Unit tests for batched stance prediction.
+Ensures length-bucketed batches return one prediction per text in input order.
+"""
+
+from sentiment_analysis.model import STANCE_LABELS
+from sentiment_analysis.predict import StancePredictor
+
+
+def test_batched_predictions_keep_input_order(tiny_model_dir):
+    """
+    Test that predictions made in small length-sorted batches match one-by-one predictions.
+    """
+    texts = ["we will build homes and fund dental care", "nothing", "we oppose the carbon tax", "cut", ""]
+    batched = StancePredictor(tiny_model_dir, batch_size=2).predict(texts)
+    single = StancePredictor(tiny_model_dir, batch_size=1).predict(texts)
+
+    assert [r["label"] for r in batched] == [r["label"] for r in single]
+    assert all(abs(b["score"] - s["score"]) < 1e-5 for b, s in zip(batched, single))
+    assert all(r["label"] in STANCE_LABELS for r in batched)
@@ -0,0 +1,66 @@
+# tests/sentiment_analysis/test_train.py
+"""
+Unit tests for the stance classifier training pipeline.
+Ensures tokenized datasets are cached, bucketed batches cover every example once, and training
+resumes from checkpoints with the learning-rate schedule sized to the real number of steps.
+"""
+
+import torch
+
+from sentiment_analysis import train as train_module
+from sentiment_analysis.model import load_tokenizer
+from sentiment_analysis.train import LengthBucketSampler, tokenize_corpus, train
+
+
+def test_tokenized_corpus_is_cached(tiny_model_dir, corpus_path, tmp_path, monkeypatch):
+    """
+    Test that a second tokenization of the same corpus is loaded from the cache.
+    """
+    tokenizer = load_tokenizer(tiny_model_dir)
+    cache_dir = str(tmp_path / "cache")
+
+    def no_reload(*args, **kwargs):
+        raise AssertionError("the cached dataset must be reused")
+
+    first = tokenize_corpus(corpus_path, tokenizer, tiny_model_dir, cache_dir)
+    monkeypatch.setattr(train_module, "load_dataset", no_reload)
+    second = tokenize_corpus(corpus_path, tokenizer, tiny_model_dir, cache_dir)
+
+    assert (len(first["train"]), len(first["eval"])) == (36, 4)
+    assert second["train"]["input_ids"] == first["train"]["input_ids"]
+    assert set(first["train"].column_names) >= {"input_ids", "labels", "length"}
+
+
+def test_bucket_sampler_counts_and_covers_every_batch():
+    """
+    Test that the sampler's length matches the batches it yields and every index appears once per epoch.
+    """
+    lengths = [(i * 7) % 13 for i in range(103)]
+    sampler = LengthBucketSampler(lengths, batch_size=4, seed=1)
+
+    for epoch in range(3):
+        sampler.set_epoch(epoch)
+        batches = list(sampler)
+        assert len(sampler) == len(batches)
+        assert sorted(i for batch in batches for i in batch) == list(range(103))
+        assert all(len(batch) <= 4 for batch in batches)
+
+
+def test_training_resumes_and_schedule_ends_at_zero(tiny_model_dir, corpus_path, tmp_path, capsys):
+    """
+    Test that a resumed run continues from the latest epoch and the LR decays to zero exactly at the end.
+    """
+    options = dict(
+        output_dir=str(tmp_path / "out"), base_model=tiny_model_dir, batch_size=8,
+        cache_dir=str(tmp_path / "cache"), max_length=32,
+    )
+
+    train(corpus_path, epochs=1, **options)
+    metrics = train(corpus_path, epochs=2, **options)
+
+    assert "Resuming from" in capsys.readouterr().out
+    assert set(metrics) == {"loss", "accuracy"}
+    state = torch.load(tmp_path / "out" / "checkpoints" / "epoch-1" / "trainer_state.pt", weights_only=False)
+    assert state["epoch"] == 1
+    assert state["scheduler"]["_last_lr"] == [0.0]
+    assert (tmp_path / "out" / "export" / "model.safetensors").exists()
@@ -0,0 +1,110 @@
+# tests/test_batch.py
+"""
+Unit tests for the request loaders and the batch routes.
+Ensures IDs are coalesced into one query per model and a bill page loads in a fixed number of queries.
+"""
+
+from datetime import date
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from api.loaders import RequestLoaders
+from api.models.bill import Bill
+from api.models.database import get_db
+from api.models.party import Party
+from api.models.politician import Politician
+from api.models.vote import Vote
+from api.routes import batch
+
+VOTED_ON = date(2024, 3, 20)
+
+
+def _seed(db, voters=20):
+    parties = [Party(name="Liberal"), Party(name="Conservative")]
+    db.add_all(parties)
+    db.flush()
+    members = [
+        Politician(url=f"/politicians/{i}/", name=f"Member {i}", party_id=parties[i % 2].id, position="MP")
+        for i in range(voters)
+    ]
+    db.add_all(members)
+    db.flush()
+    bill = Bill(number="C-1", title="Housing Act", description="", status="passed", introduced_by=members[0].id)
+    db.add(bill)
+    db.flush()
+    db.add_all([Vote(politician_id=m.id, bill_id=bill.id, vote="yes" if i % 2 else "no", date=VOTED_ON) for i, m in enumerate(members)])
+    db.commit()
+    return parties, members, bill
+
+
+def _client(db):
+    app = FastAPI()
+    app.include_router(batch.router)
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def _count_statements(db):
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_loader_coalesces_ids_and_caches_rows(db_session):
+    """
+    Test that repeated and already-loaded IDs are not queried again, and missing IDs map to None.
+    """
+    parties, members, _ = _seed(db_session)
+    loaders = RequestLoaders(db_session)
+
+    first = loaders.politicians.load_many([members[0].id, members[1].id, members[0].id, 999])
+    again = loaders.politicians.load_many([members[1].id, members[2].id])
+
+    assert first[members[0].id]["name"] == "Member 0"
+    assert first[999] is None
+    assert again[members[2].id]["party_id"] == parties[0].id
+    assert loaders.queries == 2
+
+
+def test_bill_page_loads_in_four_queries(db_session):
+    """
+    Test that a bill page with many voters runs one query per model.
+    """
+    _, members, bill = _seed(db_session)
+    bill_id, member_ids = bill.id, [m.id for m in members]
+    statements = _count_statements(db_session)
+
+    page = _client(db_session).get(f"/bills/{bill_id}/page").json()
+
+    assert len(statements) == 4
+    assert page["sponsor"]["id"] == member_ids[0]
+    assert len(page["votes"]) == len(member_ids)
+    assert set(page["politicians"]) == {str(i) for i in member_ids}
+    assert {p["name"] for p in page["parties"].values()} == {"Liberal", "Conservative"}
+
+
+def test_bill_page_returns_404_for_unknown_bill(db_session):
+    """
+    Test that a missing bill is reported instead of an empty page.
+    """
+    assert _client(db_session).get("/bills/999/page").status_code == 404
+
+
+def test_batch_lookup_returns_records_keyed_by_id(db_session):
+    """
+    Test that the batch endpoint returns each requested record, null for unknown IDs.
+    """
+    parties, members, bill = _seed(db_session)
+    client = _client(db_session)
+
+    response = client.post("/batch", json={"politicians": [members[3].id, 999], "bills": [bill.id]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["politicians"] == {str(members[3].id): body["politicians"][str(members[3].id)], "999": None}
+    assert body["politicians"][str(members[3].id)]["name"] == "Member 3"
+    assert body["bills"][str(bill.id)]["number"] == "C-1"
+    assert body["parties"] == {} and body["votes"] == {}
+    assert client.post("/batch", json={"votes": list(range(1001))}).status_code == 422
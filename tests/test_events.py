@@ -0,0 +1,197 @@
+# tests/test_events.py
+"""
+Unit tests for the change-event bus and its SSE/WebSocket routes.
+Ensures clients resume from a cursor, get a reset when events expired, and receive pushed events.
+"""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import events
+from api.events import InMemoryEventBus, RedisEventBus
+from api.routes import events as event_routes
+
+
+def test_bus_reads_events_after_cursor():
+    """
+    Test that reading from a cursor returns only later events, oldest first.
+    """
+    bus = InMemoryEventBus()
+
+    async def scenario():
+        start = await bus.latest_cursor()
+        first = bus.publish("bills", {"id": 1})
+        bus.publish("votes", {"bill_id": 1})
+        latest = await bus.latest_cursor()
+        return (await bus.read(start), await bus.read(first), await bus.read(latest), latest)
+
+    from_start, from_first, from_latest, latest = asyncio.run(scenario())
+
+    assert [e["topic"] for e in from_start[0]] == ["bills", "votes"]
+    assert from_first == ([{"id": latest, "topic": "votes", "data": {"bill_id": 1}}], False)
+    assert from_latest == ([], False)
+
+
+def test_bus_resets_expired_or_foreign_cursors():
+    """
+    Test that cursors whose events were evicted, or from another bus instance, require a reset.
+    """
+    bus = InMemoryEventBus(maxlen=2)
+    start = asyncio.run(bus.latest_cursor())
+    for i in range(3):
+        bus.publish("bills", {"id": i})
+
+    assert asyncio.run(bus.read(start)) == ([], True)
+    assert asyncio.run(bus.read("1-1")) == ([], True)
+    assert asyncio.run(bus.read("garbage")) == ([], True)
+
+
+def test_bus_wait_wakes_on_publish():
+    """
+    Test that a waiting client is woken by a publish instead of sleeping until the timeout.
+    """
+    bus = InMemoryEventBus()
+
+    async def scenario():
+        cursor = await bus.latest_cursor()
+        waiting = asyncio.create_task(bus.wait(cursor, timeout=5))
+        await asyncio.sleep(0)
+        bus.publish("bills", {"id": 1})
+        return await asyncio.wait_for(waiting, timeout=1), await bus.wait(await bus.latest_cursor(), timeout=0.01)
+
+    assert asyncio.run(scenario()) == (True, False)
+
+
+def test_event_messages_filter_topics_and_keep_alive(monkeypatch):
+    """
+    Test that only requested topics are delivered and idle connections get keep-alives.
+    """
+    bus = InMemoryEventBus()
+    monkeypatch.setattr(event_routes, "get_event_bus", lambda: bus)
+    cursor = asyncio.run(bus.latest_cursor())
+    bus.publish("votes", {"bill_id": 1})
+    bus.publish("bills", {"id": 1})
+
+    async def collect():
+        async def is_closed():
+            return False
+
+        stream = event_routes.event_messages(cursor, {"bills"}, is_closed, heartbeat=0.01)
+        received = [await stream.__anext__(), await stream.__anext__()]
+        await stream.aclose()
+        return received
+
+    received = asyncio.run(collect())
+
+    assert received[0]["topic"] == "bills"
+    assert received[1] is None
+    assert event_routes.format_sse("bills", "1-2", {"id": 1}) == 'id: 1-2\nevent: bills\ndata: {"id":1}\n\n'
+
+
+class FakeRedisStream:
+    """
+    In-process stand-in for the Redis stream commands used by RedisEventBus (IDs '<ms>-<seq>').
+    """
+
+    def __init__(self):
+        self.entries = []
+
+    def xadd(self, stream, fields, maxlen=None, approximate=True):
+        entry_id = f"1700000000000-{len(self.entries)}"
+        self.entries.append((entry_id, fields))
+        if maxlen is not None:
+            del self.entries[:-maxlen]
+        return entry_id
+
+
+class FakeAsyncRedisStream:
+    """
+    Async client over the same entries; the only one the read path may use.
+    """
+
+    def __init__(self, sync):
+        self.sync = sync
+
+    @staticmethod
+    def _key(entry_id):
+        return tuple(int(part) for part in entry_id.split("-"))
+
+    async def xrevrange(self, stream, count=None):
+        return list(reversed(self.sync.entries))[:count]
+
+    async def xrange(self, stream, min="-", count=None):
+        entries = self.sync.entries
+        if min.startswith("("):
+            entries = [e for e in entries if self._key(e[0]) > self._key(min[1:])]
+        return entries[:count]
+
+    async def xread(self, streams, count=None, block=None):
+        (cursor,) = streams.values()
+        entries = await self.xrange(None, min=f"({cursor}", count=count)
+        if not entries:
+            await asyncio.sleep(block / 1000)
+        return [("stream", entries)] if entries else []
+
+
+def test_event_messages_with_redis_bus(monkeypatch):
+    """
+    Test that SSE/WebSocket messages are read through the async Redis client, including resets.
+    """
+    bus = RedisEventBus("redis://localhost:6379/0", maxlen=2)
+    sync = FakeRedisStream()
+    bus._client, bus._async_client = sync, FakeAsyncRedisStream(sync)
+    monkeypatch.setattr(event_routes, "get_event_bus", lambda: bus)
+    first = bus.publish("bills", {"id": 1})
+    bus.publish("votes", {"bill_id": 1})
+
+    async def collect(cursor, count):
+        async def is_closed():
+            return False
+
+        stream = event_routes.event_messages(cursor, {"bills", "votes"}, is_closed, heartbeat=0.01)
+        received = [await stream.__anext__() for _ in range(count)]
+        await stream.aclose()
+        return received
+
+    resumed = asyncio.run(collect(first, 2))
+    bus.publish("bills", {"id": 2})
+    expired = asyncio.run(collect(first, 2))
+
+    assert resumed[0] == {"id": "1700000000000-1", "topic": "votes", "data": {"bill_id": 1}}
+    assert resumed[1] is None
+    assert expired[0]["topic"] == "reset"
+    assert expired[0]["data"]["cursor"] == "1700000000000-2"
+    assert expired[1] is None
+
+
+def test_websocket_resumes_from_cursor(monkeypatch):
+    """
+    Test that a WebSocket client connecting with a cursor receives the events it missed.
+    """
+    bus = InMemoryEventBus()
+    monkeypatch.setattr(event_routes, "get_event_bus", lambda: bus)
+    cursor = asyncio.run(bus.latest_cursor())
+    bus.publish("bills", {"id": 7, "action": "created"})
+    app = FastAPI()
+    app.include_router(event_routes.router)
+
+    with TestClient(app).websocket_connect(f"/events/ws?cursor={cursor}&topics=bills") as websocket:
+        message = websocket.receive_json()
+
+    assert (message["topic"], message["data"]["id"]) == ("bills", 7)
+
+
+def test_publish_events_logs_failures(monkeypatch, capsys):
+    """
+    Test that a failing backend never aborts the publisher.
+    """
+    class BrokenBus:
+        def publish(self, topic, data):
+            raise ConnectionError("down")
+
+    monkeypatch.setattr(events, "get_event_bus", lambda: BrokenBus())
+
+    assert events.publish_events([("bills", {"id": 1})]) == 0
+    assert "Error publishing bills event" in capsys.readouterr().out
@@ -0,0 +1,66 @@
+# tests/test_model_weights.py
+"""
+Unit tests for the memory-mapped model weights shared by API workers.
+Ensures mapped models match the saved ones, share one file mapping, and never write to the file.
+"""
+
+import pytest
+import torch
+from transformers import DistilBertConfig, DistilBertForSequenceClassification
+
+from api import model_weights
+from api.model_weights import get_shared_model, load_mapped_model, mmap_safetensors
+
+
+@pytest.fixture
+def saved_model(tmp_path):
+    """
+    Save a tiny random DistilBERT classifier with save_pretrained.
+    """
+    config = DistilBertConfig(vocab_size=100, dim=32, n_layers=2, n_heads=2, hidden_dim=64, num_labels=2)
+    torch.manual_seed(0)
+    model = DistilBertForSequenceClassification(config).eval()
+    model.save_pretrained(tmp_path)
+    return model, str(tmp_path)
+
+
+def test_mapped_model_matches_saved_model(saved_model):
+    """
+    Test that the mapped model computes the same logits, with every parameter in one mapping.
+    """
+    model, path = saved_model
+    mapped = load_mapped_model(path)
+    input_ids = torch.tensor([[1, 5, 7, 2]])
+
+    with torch.no_grad():
+        assert torch.allclose(model(input_ids).logits, mapped(input_ids).logits)
+    assert len({p.untyped_storage().data_ptr() for p in mapped.parameters()}) == 1
+    assert type(load_mapped_model(path, task="base")).__name__ == "DistilBertModel"
+
+
+def test_mapping_is_copy_on_write(saved_model):
+    """
+    Test that writes to a mapped tensor stay private to the process and never reach the file.
+    """
+    _, path = saved_model
+    file = f"{path}/model.safetensors"
+    with open(file, "rb") as f:
+        before = f.read()
+
+    tensors = mmap_safetensors(file)
+    next(iter(tensors.values())).fill_(0)
+
+    with open(file, "rb") as f:
+        assert f.read() == before
+
+
+def test_shared_model_is_loaded_once(saved_model, monkeypatch):
+    """
+    Test that the process-wide cache returns one model per name and task.
+    """
+    _, path = saved_model
+    monkeypatch.setattr(model_weights, "_models", {})
+
+    assert get_shared_model(path) is get_shared_model(path)
+    assert model_weights.preload_models([path]) == 1
+    assert list(model_weights._models) == [(path, "sequence-classification")]
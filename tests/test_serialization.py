@@ -0,0 +1,54 @@
+# tests/test_serialization.py
+"""
+Unit tests for the serialization module.
+Ensures row-tuple responses match the response schema's shape and JSON encoding.
+"""
+
+import json
+from datetime import date
+
+from api.models.bill import Bill
+from api.models.party import Party
+from api.models.politician import Politician
+from api.models.schemas import VoteSchema
+from api.models.vote import Vote
+from api.serialization import rows_response, rows_to_dicts, schema_select
+
+
+def _seed(db):
+    party = Party(name="Liberal")
+    db.add(party)
+    db.flush()
+    member = Politician(url="/politicians/1/", name="Jane Smith", party_id=party.id, position="MP")
+    db.add(member)
+    db.flush()
+    bill = Bill(number="C-1", title="Housing Act", description="", status="passed", introduced_by=member.id)
+    db.add(bill)
+    db.flush()
+    db.add_all([Vote(politician_id=member.id, bill_id=bill.id, vote=v, date=date(2024, 1, 1)) for v in ("yes", "no")])
+    db.commit()
+
+
+def test_schema_select_returns_schema_columns(db_session):
+    """
+    Test that the selected columns are exactly the schema's fields, in order.
+    """
+    _seed(db_session)
+
+    rows = rows_to_dicts(db_session.execute(schema_select(Vote, VoteSchema).order_by(Vote.id)))
+
+    assert [list(row) for row in rows] == [list(VoteSchema.model_fields)] * 2
+    assert [row["vote"] for row in rows] == ["yes", "no"]
+
+
+def test_rows_response_matches_pydantic_encoding(db_session):
+    """
+    Test that the orjson row path produces the same JSON as validating ORM objects with the schema.
+    """
+    _seed(db_session)
+
+    fast = json.loads(rows_response(db_session.execute(schema_select(Vote, VoteSchema).order_by(Vote.id))).body)
+    slow = [VoteSchema.model_validate(v).model_dump(mode="json") for v in db_session.query(Vote).order_by(Vote.id)]
+
+    assert fast == slow
+    assert fast[0]["date"] == "2024-01-01"
@@ -0,0 +1,192 @@
+# tests/text_to_speech/test_tts.py
+"""
+Unit tests for the tts module and audio routes.
+Ensures audio is content-addressed, synthesized once, streamed with range support, and never
+synthesized by the API routes.
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.models.bill import Bill
+from api.models.database import get_db
+from api.models.explanation import PolicyExplanation
+from api.models.party import Party
+from api.models.politician import Politician
+from api.routes import audio as audio_routes
+from text_to_speech import tts
+from translation.translator import pretranslate_explanations
+
+
+class FakeSynthesizer:
+    """
+    Produces one 16-bit sample per character and counts synthesis calls.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def synthesize(self, text):
+        self.calls += 1
+        return b"\x01\x00" * len(text), 16000
+
+
+class FakeTranslator:
+    """
+    Returns a tagged translation for every sentence.
+    """
+    model_name = "fake-en-fr"
+
+    def translate(self, sentences):
+        return [f"FR({s})" for s in sentences]
+
+
+class RecordingQueue:
+    """
+    Stands in for the background audio queue and records submitted keys.
+    """
+
+    def __init__(self):
+        self.keys = []
+
+    def submit(self, key, fn, *args):
+        self.keys.append(key)
+        return True
+
+
+def _add_politician(db):
+    party = Party(name="Liberal")
+    db.add(party)
+    db.flush()
+    politician = Politician(name="Jane Smith", party_id=party.id, position="MP")
+    db.add(politician)
+    db.flush()
+    return politician
+
+
+def _audio_app(db):
+    app = FastAPI()
+    app.include_router(audio_routes.router)
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def _no_synthesizer(language):
+    raise AssertionError("API routes must not load the speech model")
+
+
+def test_audio_key_depends_on_text_voice_and_language():
+    """
+    Test that the content address changes with any of its inputs.
+    """
+    key = tts.audio_key("Housing Act.", "en")
+
+    assert key == tts.audio_key("Housing Act.", "en")
+    assert key != tts.audio_key("Housing Act.", "fr")
+    assert key != tts.audio_key("Housing Act.", "en", voice="other")
+
+
+def test_synthesize_to_cache_only_synthesizes_once(tmp_path):
+    """
+    Test that a repeat request is served from the file cache.
+    """
+    synthesizer = FakeSynthesizer()
+
+    first = tts.synthesize_to_cache("Builds homes.", "en", synthesizer=synthesizer, cache_dir=tmp_path)
+    second = tts.synthesize_to_cache("Builds homes.", "en", synthesizer=synthesizer, cache_dir=tmp_path)
+
+    assert first == second
+    assert first.read_bytes()[:4] == b"RIFF"
+    assert synthesizer.calls == 1
+
+
+def test_audio_route_serves_byte_ranges(tmp_path, monkeypatch):
+    """
+    Test that cached audio supports full, partial and unsatisfiable range requests.
+    """
+    monkeypatch.setattr(tts, "AUDIO_CACHE_DIR", tmp_path)
+    path = tts.synthesize_to_cache("Builds homes.", "en", synthesizer=FakeSynthesizer())
+    data = path.read_bytes()
+    key = path.stem
+
+    app = FastAPI()
+    app.include_router(audio_routes.router)
+    client = TestClient(app)
+
+    full = client.get(f"/audio/{key}.wav")
+    partial = client.get(f"/audio/{key}.wav", headers={"Range": "bytes=0-9"})
+    suffix = client.get(f"/audio/{key}.wav", headers={"Range": "bytes=-4"})
+    invalid = client.get(f"/audio/{key}.wav", headers={"Range": f"bytes={len(data)}-"})
+
+    assert full.status_code == 200 and full.content == data
+    assert full.headers["accept-ranges"] == "bytes"
+    assert partial.status_code == 206 and partial.content == data[:10]
+    assert partial.headers["content-range"] == f"bytes 0-9/{len(data)}"
+    assert suffix.content == data[-4:]
+    assert invalid.status_code == 416
+    assert client.get(f"/audio/{'0' * 64}.wav").status_code == 404
+
+
+def test_audio_routes_never_synthesize_on_a_miss(db_session, tmp_path, monkeypatch):
+    """
+    Test that uncached bill audio is answered with 202 without loading the model or queueing it.
+    """
+    monkeypatch.setattr(tts, "AUDIO_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(tts, "get_synthesizer", _no_synthesizer)
+    queue = RecordingQueue()
+    monkeypatch.setattr(tts, "audio_queue", queue)
+    politician = _add_politician(db_session)
+    bill = Bill(title="Housing Act", description="Builds homes.", status="proposed", introduced_by=politician.id)
+    db_session.add(bill)
+    db_session.commit()
+
+    response = _audio_app(db_session).get(f"/bills/{bill.id}/audio/en")
+
+    key = tts.audio_key("Housing Act. Builds homes.", "en")
+    assert response.status_code == 202
+    assert response.json()["audio_url"] == f"/audio/{key}.wav"
+    assert queue.keys == []
+
+
+def test_explanation_audio_is_queued_and_served(db_session, tmp_path, monkeypatch):
+    """
+    Test that current explanation versions are queued for synthesis and served once cached.
+    """
+    monkeypatch.setattr(tts, "AUDIO_CACHE_DIR", tmp_path)
+    queue = RecordingQueue()
+    monkeypatch.setattr(tts, "audio_queue", queue)
+    politician = _add_politician(db_session)
+    versions = [
+        PolicyExplanation(
+            politician_id=politician.id, category="Housing", election_year=2021, version=version,
+            is_current=version == 2, inputs_hash=str(version), explanation=f"Version {version}.",
+            citations={}, generator="test",
+        )
+        for version in (1, 2)
+    ]
+    db_session.add_all(versions)
+    db_session.commit()
+    current = versions[1]
+
+    # French needs a translation first, so only English is queued
+    en_key, fr_key = tts.audio_key("Version 2.", "en"), tts.audio_key("FR(Version 2.)", "fr")
+    assert tts.enqueue_explanation_audio(db_session, [current]) == [en_key]
+    assert queue.keys == [en_key]
+
+    client = _audio_app(db_session)
+    url = f"/politicians/{politician.id}/explanations/{current.id}/audio"
+    assert client.get(f"{url}/fr").status_code == 404
+    assert client.get(f"{url}/en").status_code == 202
+    tts.synthesize_to_cache("Version 2.", "en", synthesizer=FakeSynthesizer())
+
+    served = client.get(f"{url}/en")
+    assert served.status_code == 200 and served.content[:4] == b"RIFF"
+
+    # Once ingestion has translated the version, French is queued and served too
+    assert pretranslate_explanations(db_session, [current], translator=FakeTranslator()) == 1
+    db_session.commit()
+    assert tts.enqueue_explanation_audio(db_session, [current]) == [en_key, fr_key]
+    assert client.get(f"{url}/fr").status_code == 202
+    tts.synthesize_to_cache("FR(Version 2.)", "fr", synthesizer=FakeSynthesizer())
+    assert client.get(f"{url}/fr").status_code == 200
+    assert client.get(f"/politicians/{politician.id + 1}/explanations/{current.id}/audio/en").status_code == 404
@@ -0,0 +1,139 @@
+# tests/translation/test_translator.py
+"""
+Unit tests for the translator module.
+Ensures the translation memory prevents repeat model calls, serving is lookup-only, and stored
+platforms are translated at ingestion rather than on the request path.
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.models.bill import Bill
+from api.models.database import get_db
+from api.models.party import Party
+from api.models.politician import Politician
+from api.models.translation import TranslationMemory
+from api.routes import data as data_routes
+from api.routes import translation as translation_routes
+from translation.translator import (
+    get_translated_bill,
+    lookup_translations,
+    pretranslate_bills,
+    pretranslate_platforms,
+    split_segments,
+    translate_texts,
+)
+
+
+class FakeTranslator:
+    """
+    Records every sentence sent to the "model" and returns a tagged translation.
+    """
+    model_name = "fake-en-fr"
+
+    def __init__(self):
+        self.calls = []
+
+    def translate(self, sentences):
+        self.calls.append(list(sentences))
+        return [f"FR({s})" for s in sentences]
+
+
+def _add_bill(db, title, description):
+    party = Party(name="Liberal")
+    db.add(party)
+    db.flush()
+    politician = Politician(name="Jane Smith", party_id=party.id, position="MP")
+    db.add(politician)
+    db.flush()
+    bill = Bill(title=title, description=description, status="proposed", introduced_by=politician.id)
+    db.add(bill)
+    db.flush()
+    return bill
+
+
+def test_split_segments_keeps_paragraphs_and_sentences():
+    """
+    Test that text is split into paragraphs of sentences.
+    """
+    text = "First sentence. Second one!\n\nNew paragraph"
+
+    assert split_segments(text) == [["First sentence.", "Second one!"], ["New paragraph"]]
+
+
+def test_translate_texts_reuses_memory_for_repeated_sentences(db_session):
+    """
+    Test that sentences already in memory are never sent to the model again.
+    """
+    translator = FakeTranslator()
+
+    first = translate_texts(db_session, ["Taxes go down. Jobs go up."], translator=translator)
+    second = translate_texts(db_session, ["Jobs go up. Taxes go down.", "Taxes go down. Jobs go up."], translator=translator)
+
+    assert first == ["FR(Taxes go down.) FR(Jobs go up.)"]
+    assert second == ["FR(Jobs go up.) FR(Taxes go down.)", "FR(Taxes go down.) FR(Jobs go up.)"]
+    assert translator.calls == [["Taxes go down.", "Jobs go up."]]
+    # Two sentences plus the two distinct full texts
+    assert db_session.query(TranslationMemory).count() == 4
+
+
+def test_pretranslated_bill_is_served_from_memory(db_session):
+    """
+    Test that a bill translated at ingestion is served by lookup, and untranslated bills are not.
+    """
+    bill = _add_bill(db_session, "Housing Act", "Builds homes.")
+    assert get_translated_bill(db_session, bill, "fr") is None
+
+    pretranslate_bills(db_session, [bill], translator=FakeTranslator())
+    db_session.commit()
+
+    app = FastAPI()
+    app.include_router(translation_routes.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    response = TestClient(app).get(f"/bills/{bill.id}/translations/fr")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "bill_id": bill.id,
+        "language": "fr",
+        "title": "FR(Housing Act)",
+        "description": "FR(Builds homes.)",
+    }
+
+
+def test_stored_platform_is_translated_at_ingestion(db_session, monkeypatch):
+    """
+    Test that storing a platform never translates, and the ingestion step fills the memory for its stances.
+    """
+    party = Party(name="Liberal")
+    db_session.add(party)
+    db_session.commit()
+    monkeypatch.setattr(data_routes, "fetch_party_platform", lambda name, year: {"platform": "We will build housing."})
+    monkeypatch.setattr(data_routes, "analyze_stance", lambda categorized: {"Housing": "positive"})
+    monkeypatch.setattr(data_routes, "enqueue_refresh", lambda: None)
+    monkeypatch.setattr(data_routes, "enqueue_drift_update", lambda party_id, year: None)
+
+    app = FastAPI()
+    app.include_router(data_routes.router)
+    app.dependency_overrides[get_db] = lambda: db_session
+    assert TestClient(app).get(f"/parties/{party.id}/platforms/2025").status_code == 200
+    assert db_session.query(TranslationMemory).count() == 0
+
+    pretranslate_platforms(db_session, translator=FakeTranslator())
+    db_session.commit()
+
+    assert lookup_translations(db_session, ["positive", "Housing"], "en", "fr") == {
+        "positive": "FR(positive)",
+        "Housing": "FR(Housing)",
+    }
+
+
+def test_bill_with_empty_description_is_fully_translated(db_session):
+    """
+    Test that an empty field counts as translated, so the bill is served instead of a permanent 404.
+    """
+    bill = _add_bill(db_session, "Housing Act", "")
+    pretranslate_bills(db_session, [bill], translator=FakeTranslator())
+    db_session.commit()
+
+    assert get_translated_bill(db_session, bill, "fr") == {"title": "FR(Housing Act)", "description": ""}